@@ -30,6 +30,7 @@ from iplotLogging import setupLogger
 from iplotlib.core.persistence import JSONExporter
 from iplotlib.core.plot import Plot, PlotXY, PlotContour, PlotXYWithSlider
 from iplotlib.core.signal import Signal
+from iplotlib.core.windowing import window
 import pandas as pd
 
 logger = setupLogger.get_logger(__name__)
@@ -359,18 +360,13 @@ class Canvas(ABC):
                             # Refresh limits
                             # Now when using pulses, if no start time or end time are specified, the default is set to
                             # 0 and None respectively. For that reason, it is necessary to check the ts_end of the
-                            # different signals and create the mask depending on the circumstances.
+                            # different signals and select the window depending on the circumstances.
                             if isinstance(row, PlotXYWithSlider):
                                 timerange = pl_signal.time
                                 y_data = pl_signal.y_data
                             else:
-                                if pl_signal.ts_end is None:
-                                    mask = pl_signal.x_data >= pl_signal.ts_start
-                                else:
-                                    mask = (pl_signal.x_data >= pl_signal.ts_start) & (
-                                            pl_signal.x_data <= pl_signal.ts_end)
-                                timerange = pl_signal.x_data[mask]
-                                y_data = pl_signal.y_data[mask]
+                                timerange, y_data = window(pl_signal.x_data, pl_signal.y_data, lo=pl_signal.ts_start,
+                                                           hi=pl_signal.ts_end, inclusive=True)
 
                             # Check min and max dates
                             if timerange.size > 0 and bool(min(timerange) > (1 << 53) and
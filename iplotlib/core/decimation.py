@@ -0,0 +1,132 @@
+# Copyright (c) 2020-2025 ITER Organization,
+#               CS 90046
+#               13067 St Paul Lez Durance Cedex
+#               France
+# Author IO
+#
+# This file is part of iplotlib module.
+# iplotlib python module is free software: you can redistribute it and/or modify it under
+# the terms of the MIT license.
+#
+# This file is part of ITER CODAC software.
+# For the terms and conditions of redistribution or use of this software
+# refer to the file LICENSE located in the top level directory
+# of the distribution package
+#
+
+
+
+"""
+Data reduction helpers that keep the visual envelope of a signal.
+"""
+
+import numpy as np
+
+from iplotlib.core.windowing import window_selector
+
+
+def minmax_indices(x: np.ndarray, y: np.ndarray, bucket) -> np.ndarray:
+    """
+    Returns the sorted indices of the minimum and the maximum of `y` within each bucket of width `bucket` along the
+    sorted `x`. Buckets are aligned on multiples of `bucket`, so decimating already decimated data with the same
+    bucket width gives it back unchanged. NaNs are only selected when a bucket has nothing else.
+    """
+    x = np.asarray(x)
+    if len(x) == 0:
+        return np.empty(0, dtype=np.intp)
+    starts = _bucket_starts(np.floor_divide(x, bucket))
+    lows, highs = _bucket_extrema(y, starts)
+    return np.unique(np.concatenate((lows, highs)))
+
+
+def m4_indices(x: np.ndarray, y: np.ndarray, x_min, x_max, width: int) -> np.ndarray:
+    """
+    M4 aggregation: returns the sorted indices of the first, last, minimum and maximum samples of each of the
+    `width` pixel columns spanning [`x_min`, `x_max`] (and of the columns of the same width beyond them).
+    Drawing these samples as a line rasterizes to the same pixels as drawing all of them.
+    """
+    x = np.asarray(x)
+    if len(x) == 0 or width <= 0 or not x_max > x_min:
+        return np.arange(len(x))
+    starts = _bucket_starts(np.floor((x - x_min) * (width / (x_max - x_min))))
+    ends = np.r_[starts[1:], len(x)] - 1
+    lows, highs = _bucket_extrema(y, starts)
+    return np.unique(np.concatenate((starts, lows, highs, ends)))
+
+
+def m4_view_indices(x: np.ndarray, y: np.ndarray, x_min, x_max, width: int, keep: np.ndarray = None) -> np.ndarray:
+    """
+    Level of detail of sorted `x` for a view of `width` pixel columns spanning [`x_min`, `x_max`]: returns the sorted
+    M4 indices of the samples in view, with the nearest sample on each side so the line runs to the borders, the
+    first and the last samples, and the indices of `keep` (e.g. the extremes of `y`, to preserve the data bounds).
+    Only the samples in view are read, views with up to 4 samples per pixel column keep all of them.
+    """
+    x = np.asarray(x)
+    n = len(x)
+    if n == 0 or width <= 0 or not x_max > x_min:
+        return np.arange(n)
+    selector = window_selector(x, x_min, x_max, inclusive=True, assume_sorted=True)
+    start, stop = max(0, selector.start - 1), min(n, selector.stop + 1)
+    if stop - start > 4 * width:
+        view = start + m4_indices(x[start:stop], y[start:stop], x_min, x_max, width)
+    else:
+        view = np.arange(start, stop)
+    keep = np.empty(0, dtype=np.intp) if keep is None else np.asarray(keep, dtype=np.intp)
+    return np.unique(np.concatenate((view, keep, [0, n - 1])))
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, num_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets: returns the sorted indices of `num_out` samples that preserve the shape of the
+    line. Unlike M4 it does not keep every extremum, but it gives an evenly spread selection of real samples.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if num_out >= n or num_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, num_out - 1).astype(np.intp)
+    selected = np.empty(num_out, dtype=np.intp)
+    selected[0] = 0
+    selected[-1] = n - 1
+    a = 0
+    for i in range(num_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_lo, next_hi = (hi, edges[i + 2]) if i + 2 < len(edges) else (n - 1, n)
+        avg_x = x[next_lo:next_hi].mean()
+        avg_y = np.nanmean(y[next_lo:next_hi]) if np.isfinite(y[next_lo:next_hi]).any() else y[a]
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(np.argmax(np.nan_to_num(area, nan=-1.0)))
+        selected[i + 1] = a
+    return selected
+
+
+def _bucket_starts(keys: np.ndarray) -> np.ndarray:
+    return np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+
+
+def _bucket_extrema(y: np.ndarray, starts: np.ndarray):
+    """
+    Returns the indices of the first minimum and the first maximum of `y` within each bucket. For multi-column `y`,
+    the extrema across the columns are used. A bucket without any valid value gives its first index.
+    """
+    y = np.asarray(y)
+    n = len(y)
+    if y.ndim > 1:
+        y_low = np.min(y.reshape(n, -1), axis=1)
+        y_high = np.max(y.reshape(n, -1), axis=1)
+    else:
+        y_low = y_high = y
+    group = np.repeat(np.arange(len(starts)), np.diff(np.r_[starts, n]))
+
+    result = []
+    for values, reduce in ((y_low, np.fmin), (y_high, np.fmax)):
+        extremes = reduce.reduceat(values, starts)
+        hits = np.flatnonzero(values == extremes[group])
+        hit_groups = group[hits]
+        first = np.r_[True, hit_groups[1:] != hit_groups[:-1]]
+        indices = starts.copy()
+        indices[hit_groups[first]] = hits[first]
+        result.append(indices)
+    return result
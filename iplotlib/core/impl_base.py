@@ -148,6 +148,8 @@ class BackendParserBase(ABC):
         self._stale_citems = list()  # type: List[ImplementationPlotCacheItem]
         self._impl_plot_ranges_hash = defaultdict(
             lambda: defaultdict(dict))  # type: Dict[Any, int] # key is id(impl_plot)
+        self._shared_x_key = None  # original x ranges and max_diff the shared x groups were computed for
+        self._shared_x_groups = dict()  # type: Dict[int, List[Plot]] # key is id(Plot)
 
     def run_in_one_thread(func):
         """
@@ -268,6 +270,18 @@ class BackendParserBase(ABC):
         :type signal: Signal
         """
 
+    @run_in_one_thread
+    def process_ipl_signals(self, signals: List[Signal]):
+        """
+        Prepare the implementation shapes for a batch of signals that changed since the previous frame.
+        Backends may override this to repaint once for the whole batch.
+
+        :param signals: A list of Signal instances
+        :type signals: List[Signal]
+        """
+        for signal in signals:
+            self.process_ipl_signal(signal)
+
     def update_axis_labels_with_units(self, impl_plot: Any, signal: Signal):
         """
         Get the unit information from the signal object and set the axis labels with those units.
@@ -385,27 +399,64 @@ class BackendParserBase(ABC):
         """
         self._stale_citems.clear()
 
-    def get_shared_plot_xy_slider(self, plot_with_slider: PlotXYWithSlider):
+    @staticmethod
+    def _original_x_range(plot: Plot) -> Optional[tuple]:
         """
-        Returns a list of PlotXYWithSlider instances that share the same time range with the given PlotXYWithSlider
+        Returns the original limits of the first range axis of the plot, None if it does not have one
         """
-        shared = []
-        limits = self.get_plot_limits(plot_with_slider, 'original')
-        base_begin, base_end = limits.axes_ranges[0].begin, limits.axes_ranges[0].end
-        for col in self.canvas.plots:
-            for plot in col:
-                if not isinstance(plot, PlotXYWithSlider) or plot == plot_with_slider:
-                    continue
-                limits = self.get_plot_limits(plot, 'original')
-                begin, end = limits.axes_ranges[0].begin, limits.axes_ranges[0].end
+        for axes in plot.axes:
+            for axis in (axes if isinstance(axes, Collection) else [axes]):
+                if isinstance(axis, RangeAxis):
+                    return axis.get_limits('original')
+        return None
 
-                max_diff = self._pm.get_value(self.canvas, 'max_diff')
-                max_diff_ns = max_diff * 1e9 if plot.axes[0].is_date or isinstance(plot, PlotXYWithSlider) else max_diff
+    @staticmethod
+    def _same_x_range(base_range: tuple, x_range: tuple, max_diff) -> bool:
+        if x_range == base_range:
+            return True
+        try:
+            return abs(x_range[0] - base_range[0]) <= max_diff and abs(x_range[1] - base_range[1]) <= max_diff
+        except TypeError:
+            # One of the ranges is not defined
+            return False
+
+    def get_shared_x_groups(self) -> Dict[int, List[Plot]]:
+        """
+        Returns the plots of the canvas that share the original X-axis range of each plot, the plot itself included.
+        The key is id(Plot), the lists follow the order of the canvas.
+        A plot shares the range of another one if (begin, end) is the same or differs by at most `max_diff` (in
+        seconds for date axes and sliders). The groups are computed again only when an original range or `max_diff`
+        change.
+        """
+        if not isinstance(self.canvas, Canvas):
+            return dict()
+
+        plots = [plot for col in self.canvas.plots for plot in col if isinstance(plot, Plot)]
+        ranges = [self._original_x_range(plot) for plot in plots]
+        max_diff = self._pm.get_value(self.canvas, 'max_diff')
+        key = (max_diff, tuple(id(plot) for plot in plots), tuple(ranges))
+        if key == self._shared_x_key:
+            return self._shared_x_groups
+
+        groups = dict()
+        for base_plot, base_range in zip(plots, ranges):
+            if base_range is None:
+                groups[id(base_plot)] = []
+                continue
+            groups[id(base_plot)] = [
+                plot for plot, x_range in zip(plots, ranges) if x_range is not None and self._same_x_range(
+                    base_range, x_range,
+                    max_diff * 1e9 if plot.axes[0].is_date or isinstance(plot, PlotXYWithSlider) else max_diff)]
+        self._shared_x_key = key
+        self._shared_x_groups = groups
+        return groups
 
-                if ((begin, end) == (base_begin, base_end) or (
-                        abs(begin - base_begin) <= max_diff_ns and abs(end - base_end) <= max_diff_ns)):
-                    shared.append(plot)
-        return shared
+    def get_shared_plot_xy_slider(self, plot_with_slider: PlotXYWithSlider):
+        """
+        Returns a list of PlotXYWithSlider instances that share the same time range with the given PlotXYWithSlider
+        """
+        return [plot for plot in self.get_shared_x_groups().get(id(plot_with_slider), [])
+                if isinstance(plot, PlotXYWithSlider) and plot is not plot_with_slider]
 
     def get_shared_plots(self, which='original'):
         """
@@ -420,13 +471,17 @@ class BackendParserBase(ABC):
         if isinstance(self._focus_plot, PlotXYWithSlider):
             return shared_plots
 
-        # Get original limits of the base plot (focus plot)
+        if which == 'original':
+            return [plot for plot in self.get_shared_x_groups().get(id(self._focus_plot), [])
+                    if plot is not self._focus_plot]
+
+        # Get limits of the base plot (focus plot)
         limits = self.get_plot_limits(self._focus_plot, which)
         base_begin, base_end = limits.axes_ranges[0].begin, limits.axes_ranges[0].end
 
         for col in self.canvas.plots:
             for plot in col:
-                if plot == self._focus_plot:
+                if plot is self._focus_plot or not isinstance(plot, Plot):
                     continue
 
                 limits = self.get_plot_limits(plot, which)
@@ -435,8 +490,7 @@ class BackendParserBase(ABC):
                 max_diff = self._pm.get_value(self.canvas, 'max_diff')
                 max_diff_ns = max_diff * 1e9 if plot.axes[0].is_date or isinstance(plot, PlotXYWithSlider) else max_diff
 
-                if ((begin, end) == (base_begin, base_end) or (
-                        abs(begin - base_begin) <= max_diff_ns and abs(end - base_end) <= max_diff_ns)):
+                if self._same_x_range((base_begin, base_end), (begin, end), max_diff_ns):
                     shared_plots.append(plot)
 
         return shared_plots
@@ -0,0 +1,68 @@
+# Copyright (c) 2020-2025 ITER Organization,
+#               CS 90046
+#               13067 St Paul Lez Durance Cedex
+#               France
+# Author IO
+#
+# This file is part of iplotlib module.
+# iplotlib python module is free software: you can redistribute it and/or modify it under
+# the terms of the MIT license.
+#
+# This file is part of ITER CODAC software.
+# For the terms and conditions of redistribution or use of this software
+# refer to the file LICENSE located in the top level directory
+# of the distribution package
+#
+
+
+
+"""
+Nearest sample lookup on signals sorted along x.
+"""
+
+import numpy as np
+
+
+def nearest_index(x: np.ndarray, y: np.ndarray, x0, y0, x_scale: float = 1., y_scale: float = 1., start: int = 0,
+                  stop: int = None):
+    """
+    Returns the index of the sample of (`x`, `y`) within [`start`, `stop`) closest to (`x0`, `y0`) and its distance.
+    Distances are measured after scaling x by `x_scale` and y by `y_scale` (e.g. pixels per data unit), and `x` must
+    be sorted. Samples with a NaN coordinate are ignored. Returns (None, inf) when there is no such sample.
+
+    The search starts at the insertion point of `x0` and scans blocks of doubling size on both sides until the
+    next unscanned sample is farther away along x than the best match, so only a neighbourhood of `x0` is visited.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    stop = min(len(x), len(y)) if stop is None else min(stop, len(x), len(y))
+    start = max(0, start)
+    if stop <= start:
+        return None, np.inf
+
+    best_idx, best_dist = None, np.inf
+    left = right = start + int(np.searchsorted(x[start:stop], x0))
+    block = 64
+    while left > start or right < stop:
+        lo, hi = max(start, left - block), min(stop, right + block)
+        for a, b in ((lo, left), (right, hi)):
+            if b <= a:
+                continue
+            dx = (x[a:b] - x0) * x_scale
+            dy = (y[a:b] - y0) * y_scale
+            dist = np.nan_to_num(dx * dx + dy * dy, copy=False, nan=np.inf)
+            k = int(np.argmin(dist))
+            if dist[k] < best_dist ** 2:
+                best_idx, best_dist = a + k, float(np.sqrt(dist[k]))
+        left, right = lo, hi
+
+        # Samples not scanned yet are at least as far as their distance along x
+        gap = np.inf
+        if left > start:
+            gap = min(gap, abs(float(x0 - x[left - 1])) * x_scale)
+        if right < stop:
+            gap = min(gap, abs(float(x[right] - x0)) * x_scale)
+        if gap >= best_dist:
+            break
+        block *= 2
+    return best_idx, best_dist
@@ -0,0 +1,227 @@
+# Copyright (c) 2020-2025 ITER Organization,
+#               CS 90046
+#               13067 St Paul Lez Durance Cedex
+#               France
+# Author IO
+#
+# This file is part of iplotlib module.
+# iplotlib python module is free software: you can redistribute it and/or modify it under
+# the terms of the MIT license.
+#
+# This file is part of ITER CODAC software.
+# For the terms and conditions of redistribution or use of this software
+# refer to the file LICENSE located in the top level directory
+# of the distribution package
+#
+
+
+
+"""
+Minimum, maximum, sum and count of the samples of an array over index ranges, without scanning the range.
+"""
+
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+
+class RangeStats(NamedTuple):
+    min: float
+    max: float
+    sum: float
+    count: int
+
+
+class RangeIndex:
+    """
+    Answers min/max/sum/count queries over index ranges of a one-dimensional array. NaNs are ignored.
+
+    The array is cut in blocks of `block_size` samples. Each block keeps its statistics, a sparse table over the
+    blocks answers min/max of any run of whole blocks in O(1) and prefix sums answer sum/count. Only the partial
+    blocks at both ends of a range are scanned, so a query costs O(block_size) whatever the length of the range,
+    and the index takes O(n / block_size) memory.
+
+    :meth:`update` accepts the next version of the data. Views of the same buffer that only grow at the end or
+    shrink at the front, like the views of :class:`~iplotlib.data_access.ring_buffer.RingBuffer`, extend the index
+    with the new samples only. Such buffers must not rewrite samples once they have been handed out.
+    """
+
+    def __init__(self, block_size: int = 1024):
+        self.block_size = block_size
+        self._buffer = None  # the array owning the memory the blocks are laid on
+        self._values = None  # the same memory as a plain array
+        self._view = None  # the last array given to update
+        self._offset = 0  # position of the first sample of the view in the buffer
+        self._start = 0  # position of the first sample covered by the blocks
+        self._end = 0  # position after the last sample covered by the blocks
+        self._mins = [np.empty(0)]  # sparse table levels, level k holds the min of 2**k blocks
+        self._maxs = [np.empty(0)]
+        self._sums = np.zeros(1)  # prefix sums of the block sums
+        self._counts = np.zeros(1, dtype=np.int64)
+
+    def update(self, values: np.ndarray) -> 'RangeIndex':
+        """
+        Follows `values`, queries are then expressed in positions of `values`.
+        """
+        if values is self._view:
+            return self
+        arr = np.asarray(values)
+        self._view = values
+
+        buffer, offset = _buffer_of(arr)
+        if buffer is None:
+            self._reset(None, np.ascontiguousarray(arr), 0)
+        elif buffer is not self._buffer or offset < self._start:
+            self._reset(buffer, np.asarray(buffer), offset)
+        self._offset = offset
+        self._extend(self._offset + len(arr))
+        return self
+
+    def _reset(self, buffer, values: np.ndarray, offset: int):
+        self._buffer = buffer
+        self._values = values
+        # The blocks before the first sample are left empty, they can never be part of a query
+        skip = offset // self.block_size
+        self._start = self._end = skip * self.block_size
+        self._mins, self._maxs = [np.full(skip, np.inf)], [np.full(skip, -np.inf)]
+        self._sums = np.zeros(skip + 1)
+        self._counts = np.zeros(skip + 1, dtype=np.int64)
+
+    def query(self, start: int, stop: int) -> RangeStats:
+        """
+        Returns the statistics of the samples in [`start`, `stop`) of the array given to :meth:`update`.
+        An empty range or a range of NaNs gives a min of inf, a max of -inf and a count of 0.
+        """
+        start, stop = start + self._offset, stop + self._offset
+        stop = min(stop, self._end)
+        if stop <= start:
+            return RangeStats(np.inf, -np.inf, 0., 0)
+
+        b = self.block_size
+        first_block, last_block = -(-start // b), stop // b
+        if first_block >= last_block:
+            return _scan(self._values[start:stop])
+
+        parts = [_scan(self._values[start:first_block * b]), _scan(self._values[last_block * b:stop])]
+        level = int(last_block - first_block).bit_length() - 1
+        width = 1 << level
+        parts.append(RangeStats(
+            min(self._mins[level][first_block], self._mins[level][last_block - width]),
+            max(self._maxs[level][first_block], self._maxs[level][last_block - width]),
+            float(self._sums[last_block] - self._sums[first_block]),
+            int(self._counts[last_block] - self._counts[first_block])))
+        return RangeStats(min(p.min for p in parts), max(p.max for p in parts), sum(p.sum for p in parts),
+                          sum(p.count for p in parts))
+
+    def _extend(self, end: int):
+        """Lays blocks over the buffer up to `end`. The last block may be partial, it is computed again later."""
+        if end <= self._end:
+            return
+        b = self.block_size
+        first = self._end // b  # the first block that changes
+        values = self._values[first * b:end]
+        num = -(-len(values) // b)
+
+        mins = np.full(num, np.inf)
+        maxs = np.full(num, -np.inf)
+        sums = np.zeros(num)
+        counts = np.zeros(num, dtype=np.int64)
+        full = len(values) // b
+        if full:
+            blocks = values[:full * b].reshape(full, b)
+            mins[:full], maxs[:full], sums[:full], counts[:full] = _block_stats(blocks)
+        if full < num:
+            mins[full], maxs[full], sums[full], counts[full] = _scan(values[full * b:])
+
+        level_mins = np.concatenate((self._mins[0][:first], mins))
+        level_maxs = np.concatenate((self._maxs[0][:first], maxs))
+        self._sums = np.concatenate((self._sums[:first + 1], self._sums[first] + np.cumsum(sums)))
+        self._counts = np.concatenate((self._counts[:first + 1], self._counts[first] + np.cumsum(counts)))
+
+        # Entries of the upper levels that cover a changed block are computed again
+        new_mins, new_maxs = [level_mins], [level_maxs]
+        level = 1
+        while (1 << level) <= len(level_mins):
+            half = 1 << (level - 1)
+            size = len(level_mins) - (1 << level) + 1
+            keep = max(0, min(first - (1 << level) + 1, len(self._mins[level]) if level < len(self._mins) else 0))
+            prev_mins, prev_maxs = new_mins[-1], new_maxs[-1]
+            lvl_mins = np.empty(size)
+            lvl_maxs = np.empty(size)
+            if keep:
+                lvl_mins[:keep] = self._mins[level][:keep]
+                lvl_maxs[:keep] = self._maxs[level][:keep]
+            np.minimum(prev_mins[keep:size], prev_mins[keep + half:size + half], out=lvl_mins[keep:])
+            np.maximum(prev_maxs[keep:size], prev_maxs[keep + half:size + half], out=lvl_maxs[keep:])
+            new_mins.append(lvl_mins)
+            new_maxs.append(lvl_maxs)
+            level += 1
+        self._mins, self._maxs = new_mins, new_maxs
+        self._end = end
+
+
+def get_range_index(owner, values, name: str = 'y') -> Optional[RangeIndex]:
+    """
+    Returns the :class:`RangeIndex` that `owner` keeps under `name`, updated to `values`.
+    Returns None when `values` is not a one-dimensional numeric array, or is masked.
+    """
+    if isinstance(values, np.ma.MaskedArray):
+        return None
+    values = np.asarray(values) if not isinstance(values, np.ndarray) else values
+    if values.ndim != 1 or values.dtype.kind not in 'biuf':
+        return None
+    indexes = getattr(owner, 'ipl_range_indexes', None)
+    if indexes is None:
+        indexes = dict()
+        owner.ipl_range_indexes = indexes
+    index = indexes.get(name)
+    if index is None:
+        index = indexes[name] = RangeIndex()
+    return index.update(values)
+
+
+def _buffer_of(arr: np.ndarray):
+    """
+    Returns the contiguous one-dimensional array that owns the memory of `arr` and the position of the first sample
+    of `arr` in it, or (None, 0) when `arr` is not a contiguous slice of such an array.
+    """
+    if arr.ndim != 1 or (len(arr) > 1 and arr.strides[0] != arr.itemsize):
+        return None, 0
+    root = arr
+    while isinstance(root.base, np.ndarray):
+        root = root.base
+    if root.ndim != 1 or root.dtype != arr.dtype or not root.flags.c_contiguous:
+        return None, 0
+    offset, rest = divmod(arr.__array_interface__['data'][0] - root.__array_interface__['data'][0], arr.itemsize)
+    if rest or offset + len(arr) > len(root):
+        return None, 0
+    return root, offset
+
+
+def _block_stats(blocks: np.ndarray):
+    if blocks.dtype.kind != 'f':
+        return blocks.min(axis=1), blocks.max(axis=1), blocks.sum(axis=1, dtype=np.float64), blocks.shape[1]
+    mins = np.fmin.reduce(blocks, axis=1)
+    maxs = np.fmax.reduce(blocks, axis=1)
+    sums = blocks.sum(axis=1, dtype=np.float64)
+    counts = np.full(len(blocks), blocks.shape[1], dtype=np.int64)
+    # Only the blocks holding NaNs are masked, a NaN sum tells them apart
+    dirty = np.flatnonzero(np.isnan(sums))
+    if len(dirty):
+        valid = ~np.isnan(blocks[dirty])
+        sums[dirty] = np.where(valid, blocks[dirty], 0).sum(axis=1, dtype=np.float64)
+        counts[dirty] = valid.sum(axis=1)
+        empty = np.isnan(mins)  # only when the whole block is NaN
+        mins[empty], maxs[empty] = np.inf, -np.inf
+    return mins, maxs, sums, counts
+
+
+def _scan(values: np.ndarray) -> RangeStats:
+    if len(values) == 0:
+        return RangeStats(np.inf, -np.inf, 0., 0)
+    if values.dtype.kind == 'f':
+        valid = values[~np.isnan(values)]
+        if len(valid) == 0:
+            return RangeStats(np.inf, -np.inf, 0., 0)
+        values = valid
+    return RangeStats(values.min().item(), values.max().item(), float(values.sum(dtype=np.float64)), len(values))
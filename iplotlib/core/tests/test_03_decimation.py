@@ -0,0 +1,73 @@
+# Copyright (c) 2020-2025 ITER Organization,
+#               CS 90046
+#               13067 St Paul Lez Durance Cedex
+#               France
+# Author IO
+#
+# This file is part of iplotlib module.
+# iplotlib python module is free software: you can redistribute it and/or modify it under
+# the terms of the MIT license.
+#
+# This file is part of ITER CODAC software.
+# For the terms and conditions of redistribution or use of this software
+# refer to the file LICENSE located in the top level directory
+# of the distribution package
+#
+
+
+
+import unittest
+
+import numpy as np
+
+from iplotlib.core.decimation import lttb_indices, m4_indices, m4_view_indices
+
+
+class TestDecimation(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = np.random.default_rng(0)
+        self.x = np.arange(100000, dtype=np.int64)
+        self.y = np.sin(self.x / 1000.0) + rng.normal(size=len(self.x))
+
+    def test_m4_keeps_column_extrema(self):
+        width = 200
+        indices = m4_indices(self.x, self.y, self.x[0], self.x[-1], width)
+        self.assertTrue(np.all(np.diff(indices) > 0))
+        self.assertLessEqual(len(indices), 4 * width)
+        self.assertEqual(indices[0], 0)
+        self.assertEqual(indices[-1], len(self.x) - 1)
+
+        columns = np.minimum((self.x * width) // len(self.x), width - 1)
+        for col in (0, 57, width - 1):
+            in_col = indices[columns[indices] == col]
+            y_col = self.y[columns == col]
+            self.assertEqual(self.y[in_col].min(), y_col.min())
+            self.assertEqual(self.y[in_col].max(), y_col.max())
+
+    def test_m4_ignores_nan(self):
+        self.y[:1000] = np.nan
+        indices = m4_indices(self.x, self.y, self.x[0], self.x[-1], 100)
+        self.assertEqual(np.nanmax(self.y[indices]), np.nanmax(self.y))
+
+    def test_m4_view(self):
+        keep = [int(np.argmin(self.y)), int(np.argmax(self.y))]
+        indices = m4_view_indices(self.x, self.y, 20000.5, 30000, 100, keep)
+        self.assertTrue(np.all(np.diff(indices) > 0))
+        self.assertTrue(set(keep + [0, 20000, 30001, len(self.x) - 1]) <= set(indices.tolist()))
+        self.assertLessEqual(len(indices), 4 * 100 + 8)
+        self.assertEqual(self.y[indices[(indices > 20000) & (indices <= 30000)]].max(), self.y[20001:30001].max())
+
+        # Zoomed in, the view keeps every sample
+        indices = m4_view_indices(self.x, self.y, 500, 600, 100)
+        self.assertTrue(set(range(499, 602)) <= set(indices.tolist()))
+
+    def test_lttb_size(self):
+        indices = lttb_indices(self.x, self.y, 500)
+        self.assertEqual(len(indices), 500)
+        self.assertEqual(indices[0], 0)
+        self.assertEqual(indices[-1], len(self.x) - 1)
+        self.assertTrue(np.all(np.diff(indices) > 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
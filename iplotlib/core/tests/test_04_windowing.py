@@ -0,0 +1,69 @@
+# Copyright (c) 2020-2025 ITER Organization,
+#               CS 90046
+#               13067 St Paul Lez Durance Cedex
+#               France
+# Author IO
+#
+# This file is part of iplotlib module.
+# iplotlib python module is free software: you can redistribute it and/or modify it under
+# the terms of the MIT license.
+#
+# This file is part of ITER CODAC software.
+# For the terms and conditions of redistribution or use of this software
+# refer to the file LICENSE located in the top level directory
+# of the distribution package
+#
+
+
+
+import unittest
+
+import numpy as np
+
+from iplotlib.core.windowing import is_sorted, window, window_selector
+
+
+class TestWindowing(unittest.TestCase):
+    def setUp(self) -> None:
+        self.x = np.array([0, 1, 1, 2, 3, 5, 8, 13], dtype=np.int64)
+        self.y = np.arange(len(self.x), dtype=np.float64)
+
+    def check_same_as_mask(self, x, y, lo, hi, inclusive):
+        if inclusive:
+            mask = (x >= lo) & (x <= hi)
+        else:
+            mask = (x > lo) & (x < hi)
+        xw, yw = window(x, y, lo=lo, hi=hi, inclusive=inclusive)
+        np.testing.assert_array_equal(xw, x[mask])
+        np.testing.assert_array_equal(yw, y[mask])
+
+    def test_sorted_gives_views(self):
+        selector = window_selector(self.x, 1, 8)
+        self.assertIsInstance(selector, slice)
+        xw, yw = window(self.x, self.y, lo=1, hi=8)
+        self.assertTrue(np.shares_memory(xw, self.x))
+        self.assertTrue(np.shares_memory(yw, self.y))
+
+    def test_same_as_mask(self):
+        rng = np.random.default_rng(0)
+        unsorted = rng.permutation(self.x)
+        for x in (self.x, unsorted):
+            for lo, hi in ((1, 8), (0.5, 2.5), (-10, 100), (4, 4), (9, 2)):
+                for inclusive in (False, True):
+                    self.check_same_as_mask(x, self.y, lo, hi, inclusive)
+
+    def test_open_bounds(self):
+        xw, = window(self.x, lo=3, inclusive=True)
+        np.testing.assert_array_equal(xw, [3, 5, 8, 13])
+        xw, = window(self.x, hi=1)
+        np.testing.assert_array_equal(xw, [0])
+
+    def test_is_sorted(self):
+        self.assertTrue(is_sorted(self.x))
+        self.assertTrue(is_sorted(np.empty(0)))
+        self.assertFalse(is_sorted(self.x[::-1]))
+        self.assertFalse(is_sorted(np.array([0.0, np.nan, 2.0])))
+
+
+if __name__ == "__main__":
+    unittest.main()
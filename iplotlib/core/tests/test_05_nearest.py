@@ -0,0 +1,58 @@
+# Copyright (c) 2020-2025 ITER Organization,
+#               CS 90046
+#               13067 St Paul Lez Durance Cedex
+#               France
+# Author IO
+#
+# This file is part of iplotlib module.
+# iplotlib python module is free software: you can redistribute it and/or modify it under
+# the terms of the MIT license.
+#
+# This file is part of ITER CODAC software.
+# For the terms and conditions of redistribution or use of this software
+# refer to the file LICENSE located in the top level directory
+# of the distribution package
+#
+
+
+
+import unittest
+
+import numpy as np
+
+from iplotlib.core.nearest import nearest_index
+
+
+class TestNearest(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = np.random.default_rng(0)
+        self.x = np.sort(rng.integers(0, 10 ** 12, size=200000))
+        self.y = rng.normal(size=len(self.x))
+        self.x_scale = 1000 / 10 ** 12
+        self.y_scale = 500 / 8
+
+    def brute_force(self, x0, y0, start=0, stop=None):
+        x, y = self.x[start:stop], self.y[start:stop]
+        dist = np.hypot((x - x0) * self.x_scale, (y - y0) * self.y_scale)
+        return start + int(np.nanargmin(dist)), float(np.nanmin(dist))
+
+    def test_matches_brute_force(self):
+        rng = np.random.default_rng(1)
+        for x0, y0 in zip(rng.integers(-10 ** 10, 10 ** 12 + 10 ** 10, size=20), rng.normal(scale=3, size=20)):
+            idx, dist = nearest_index(self.x, self.y, x0, y0, self.x_scale, self.y_scale)
+            expected_idx, expected_dist = self.brute_force(x0, y0)
+            self.assertAlmostEqual(dist, expected_dist)
+            self.assertEqual(idx, expected_idx)
+
+    def test_range_and_nan(self):
+        self.y[1000:2000] = np.nan
+        x0, y0 = self.x[1500], 0.
+        idx, _ = nearest_index(self.x, self.y, x0, y0, self.x_scale, self.y_scale, 500, 5000)
+        self.assertEqual(idx, self.brute_force(x0, y0, 500, 5000)[0])
+        self.assertFalse(np.isnan(self.y[idx]))
+
+        self.assertEqual(nearest_index(self.x, self.y, x0, y0, start=10, stop=10), (None, np.inf))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+# Copyright (c) 2020-2025 ITER Organization,
+#               CS 90046
+#               13067 St Paul Lez Durance Cedex
+#               France
+# Author IO
+#
+# This file is part of iplotlib module.
+# iplotlib python module is free software: you can redistribute it and/or modify it under
+# the terms of the MIT license.
+#
+# This file is part of ITER CODAC software.
+# For the terms and conditions of redistribution or use of this software
+# refer to the file LICENSE located in the top level directory
+# of the distribution package
+#
+
+
+
+import unittest
+
+import numpy as np
+
+from iplotlib.core.range_query import RangeIndex
+from iplotlib.data_access.ring_buffer import RingBuffer
+
+
+class TestRangeQuery(unittest.TestCase):
+    def setUp(self) -> None:
+        self.rng = np.random.default_rng(0)
+
+    def assert_matches_brute_force(self, index, values, count=200):
+        for start, stop in np.sort(self.rng.integers(0, len(values) + 1, size=(count, 2)), axis=1):
+            stats = index.query(start, stop)
+            valid = values[start:stop][~np.isnan(values[start:stop])]
+            self.assertEqual(stats.count, len(valid))
+            self.assertEqual(stats.min, valid.min() if len(valid) else np.inf)
+            self.assertEqual(stats.max, valid.max() if len(valid) else -np.inf)
+            self.assertAlmostEqual(stats.sum, valid.sum())
+
+    def test_matches_brute_force(self):
+        values = self.rng.normal(size=50003)
+        values[self.rng.integers(0, len(values), size=300)] = np.nan
+        values[5000:7000] = np.nan
+        self.assert_matches_brute_force(RangeIndex(block_size=128).update(values), values)
+
+    def test_view_of_larger_array(self):
+        values = self.rng.normal(size=20000)[12345:]
+        self.assert_matches_brute_force(RangeIndex(block_size=100).update(values), values)
+
+    def test_streaming(self):
+        buffer = RingBuffer(max_samples=3000)
+        index = RangeIndex(block_size=64)
+        for i in range(40):
+            buffer.append(np.arange(i * 250, (i + 1) * 250), self.rng.normal(size=250))
+            values = buffer.view(1)
+            index.update(values)
+            self.assert_matches_brute_force(index, values, count=10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+# Copyright (c) 2020-2025 ITER Organization,
+#               CS 90046
+#               13067 St Paul Lez Durance Cedex
+#               France
+# Author IO
+#
+# This file is part of iplotlib module.
+# iplotlib python module is free software: you can redistribute it and/or modify it under
+# the terms of the MIT license.
+#
+# This file is part of ITER CODAC software.
+# For the terms and conditions of redistribution or use of this software
+# refer to the file LICENSE located in the top level directory
+# of the distribution package
+#
+
+
+
+"""
+Selection of the samples that fall within a range of the independent variable.
+"""
+
+from typing import Tuple, Union
+
+import numpy as np
+
+
+def is_sorted(x: np.ndarray) -> bool:
+    """
+    Returns True if `x` is one-dimensional, non-decreasing and free of NaNs.
+    """
+    x = np.asarray(x)
+    if x.ndim != 1:
+        return False
+    if len(x) < 2:
+        return not (len(x) == 1 and x.dtype.kind == 'f' and np.isnan(x[0]))
+    return bool(np.all(x[1:] >= x[:-1]))
+
+
+def window_selector(x: np.ndarray, lo=None, hi=None, inclusive: bool = False,
+                    assume_sorted: bool = None) -> Union[slice, np.ndarray]:
+    """
+    Returns what selects the samples of `x` within (`lo`, `hi`), or [`lo`, `hi`] when `inclusive` is set.
+    A bound set to None is open.
+
+    For sorted `x` the bounds are found by binary search and the result is a slice, so indexing with it costs
+    O(log n) and gives views. Otherwise the result is a boolean mask.
+    `assume_sorted` skips the O(n) order check when the caller already knows the answer.
+    """
+    x = np.asarray(x)
+    if assume_sorted is None:
+        assume_sorted = is_sorted(x)
+    if assume_sorted:
+        start = 0 if lo is None else _search(x, lo, 'left' if inclusive else 'right')
+        stop = len(x) if hi is None else _search(x, hi, 'right' if inclusive else 'left')
+        return slice(start, max(start, stop))
+
+    mask = np.ones(x.shape, dtype=bool)
+    if lo is not None:
+        mask &= (x >= lo) if inclusive else (x > lo)
+    if hi is not None:
+        mask &= (x <= hi) if inclusive else (x < hi)
+    return mask
+
+
+def _search(x: np.ndarray, value, side: str) -> int:
+    """
+    Binary search of `value` in sorted `x`. A float bound on integer samples is rounded to an integer first,
+    otherwise numpy would convert the whole of `x` to float to compare them.
+    """
+    if x.dtype.kind in 'iu' and isinstance(value, (float, np.floating)) and np.isfinite(value):
+        info = np.iinfo(x.dtype)
+        # x >= value <=> x >= ceil(value) and x > value <=> x > floor(value)
+        value = np.ceil(value) if side == 'left' else np.floor(value)
+        if value < info.min:
+            return 0
+        if value > info.max:
+            return len(x)
+        value = x.dtype.type(value)
+    return int(np.searchsorted(x, value, side=side))
+
+
+def window(x: np.ndarray, *arrays: np.ndarray, lo=None, hi=None, inclusive: bool = False,
+           assume_sorted: bool = None) -> Tuple[np.ndarray, ...]:
+    """
+    Returns `x` and each of `arrays` restricted to the samples of `x` within `lo` and `hi`.
+    See :func:`window_selector`.
+    """
+    selector = window_selector(x, lo, hi, inclusive, assume_sorted)
+    return tuple(arr[selector] for arr in (x,) + arrays)
@@ -19,6 +19,12 @@
 Real-time streaming infrastructure for iplotlib.
 """
 
+from .redraw_scheduler import RedrawScheduler
+from .ring_buffer import RingBuffer
+from .rolling_extrema import RollingExtrema
+from .stream_record import RecordedData, StreamRecorder, StreamReplay
 from .streamer import CanvasStreamer
+from .tiered_buffer import TieredBuffer
 
-__all__ = ["CanvasStreamer"]
+__all__ = ["CanvasStreamer", "RecordedData", "RedrawScheduler", "RingBuffer", "RollingExtrema", "StreamRecorder",
+           "StreamReplay", "TieredBuffer"]
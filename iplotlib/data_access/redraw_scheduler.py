@@ -0,0 +1,91 @@
+# Copyright (c) 2020-2025 ITER Organization,
+#               CS 90046
+#               13067 St Paul Lez Durance Cedex
+#               France
+# Author IO
+#
+# This file is part of iplotlib module.
+# iplotlib python module is free software: you can redistribute it and/or modify it under
+# the terms of the MIT license.
+#
+# This file is part of ITER CODAC software.
+# For the terms and conditions of redistribution or use of this software
+# refer to the file LICENSE located in the top level directory
+# of the distribution package
+#
+
+
+"""
+Coalesces the redraw requests of a streaming canvas into frames.
+"""
+
+import time
+from threading import Condition, Thread
+from typing import Callable, Dict
+
+import iplotLogging.setupLogger as Sl
+
+logger = Sl.get_logger(__name__)
+
+
+class RedrawScheduler:
+    """
+    Collects the signals that received new data and hands them to `callback` in a single call,
+    at most `max_fps` times per second.
+
+    :meth:`mark_dirty` only records the signal, so data ingestion is never slowed down by the display.
+    A signal updated several times between two frames is redrawn once.
+    """
+
+    def __init__(self, callback: Callable, max_fps: float = 25.0):
+        self.callback = callback
+        self.max_fps = max_fps
+        self._dirty = dict()  # type: Dict[int, object] # key is id(signal)
+        self._wakeup = Condition()
+        self._stop_flag = False
+        self._thread = None
+        self._last_frame = 0.0
+
+    @property
+    def frame_interval(self) -> float:
+        return 1.0 / self.max_fps if self.max_fps else 0.0
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_flag = False
+        self._thread = Thread(name="redraw", target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        with self._wakeup:
+            self._stop_flag = True
+            self._dirty.clear()
+            self._wakeup.notify()
+
+    def mark_dirty(self, signal):
+        with self._wakeup:
+            self._dirty[id(signal)] = signal
+            self._wakeup.notify()
+
+    def _run(self):
+        while True:
+            with self._wakeup:
+                while not self._dirty and not self._stop_flag:
+                    self._wakeup.wait()
+                if self._stop_flag:
+                    return
+                # Wait for the next frame slot, more signals may become dirty meanwhile.
+                delay = self._last_frame + self.frame_interval - time.monotonic()
+                if delay > 0:
+                    self._wakeup.wait_for(lambda: self._stop_flag, timeout=delay)
+                    if self._stop_flag:
+                        return
+                signals = list(self._dirty.values())
+                self._dirty.clear()
+
+            self._last_frame = time.monotonic()
+            try:
+                self.callback(signals)
+            except Exception as e:
+                logger.error(f"Redraw of {len(signals)} signals failed: {e}")
@@ -0,0 +1,161 @@
+# Copyright (c) 2020-2025 ITER Organization,
+#               CS 90046
+#               13067 St Paul Lez Durance Cedex
+#               France
+# Author IO
+#
+# This file is part of iplotlib module.
+# iplotlib python module is free software: you can redistribute it and/or modify it under
+# the terms of the MIT license.
+#
+# This file is part of ITER CODAC software.
+# For the terms and conditions of redistribution or use of this software
+# refer to the file LICENSE located in the top level directory
+# of the distribution package
+#
+
+
+"""
+A preallocated buffer for the samples of a streaming signal.
+"""
+
+from typing import List, Optional
+
+import numpy as np
+
+
+class RingBuffer:
+    """
+    Stores the columns of a streaming signal (time, data, ...) in preallocated arrays that share one write cursor.
+
+    Appending a batch costs amortized O(batch size). When the arrays are full, the retained window is moved into
+    newly allocated arrays with at least as much free room, so the arrays handed out by :meth:`view` are never
+    written to again and can be used by processing and drawing without copying.
+
+    The retention window is bounded by `max_samples` (number of samples) and/or `max_span` (distance between the
+    first and the last value of the first column, which must be monotonic). Use None to keep everything.
+
+    `version` changes whenever the retained samples change. `generation` only changes when samples are rewritten
+    rather than appended or dropped from the front, so consumers that mirror the buffer sample by sample must start
+    over.
+    """
+
+    def __init__(self, max_samples: int = None, max_span=None, capacity: int = 1024):
+        self.max_samples = max_samples
+        self.max_span = max_span
+        self.version = 0
+        self.generation = 0
+        self._capacity = max(1, capacity)
+        self._columns = []  # type: List[Optional[np.ndarray]]
+        self._start = 0
+        self._end = 0
+
+    def __len__(self):
+        return self._end - self._start
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def clear(self):
+        """
+        Drop all samples and the column layout.
+        """
+        self._columns.clear()
+        self._start = 0
+        self._end = 0
+        self.version += 1
+        self.generation += 1
+
+    def append(self, *columns):
+        """
+        Append a batch of samples. The first column is the independent variable and dictates the batch size.
+        Columns whose length does not match the first column are treated as empty from then on.
+        """
+        arrays = [np.asarray(c) for c in columns]
+        if not arrays:
+            return
+        n = len(arrays[0])
+        if n == 0:
+            return
+        arrays = [arr if arr.ndim > 0 and len(arr) == n else None for arr in arrays]
+
+        if not self._columns:
+            self._allocate(arrays, max(self._capacity, n))
+
+        # A batch larger than the retention window only contributes its tail.
+        if self.max_samples is not None and n > self.max_samples:
+            arrays = [arr[-self.max_samples:] if arr is not None else None for arr in arrays]
+            n = self.max_samples
+            self._start = self._end
+
+        # Discard the oldest samples that would fall out of the window once this batch is in.
+        if self.max_samples is not None and len(self) + n > self.max_samples:
+            self._start = self._end + n - self.max_samples
+
+        if self._end + n > self._capacity:
+            self._reserve(n)
+
+        for i, arr in enumerate(arrays):
+            col = self._columns[i] if i < len(self._columns) else None
+            if col is None:
+                continue
+            if arr is None:
+                # The column lost its samples for this batch, it cannot stay aligned with the others.
+                self._columns[i] = None
+                continue
+            if not np.can_cast(arr.dtype, col.dtype, casting='same_kind'):
+                col = self._columns[i] = col.astype(np.result_type(col, arr))
+            col[self._end:self._end + n] = arr
+        self._end += n
+
+        if self.max_span is not None and self._columns[0] is not None:
+            t = self._columns[0]
+            cutoff = t[self._end - 1] - self.max_span
+            self._start += int(np.searchsorted(t[self._start:self._end], cutoff, side='left'))
+
+        self.version += 1
+
+    def keep_last(self, n: int):
+        """
+        Drop the oldest samples so that at most `n` remain.
+        """
+        if len(self) > n:
+            self._start = self._end - max(0, n)
+            self.version += 1
+
+    def view(self, idx: int) -> np.ndarray:
+        """
+        Returns the retained samples of column `idx` without copying. Empty columns return an empty array.
+        """
+        if idx >= len(self._columns) or self._columns[idx] is None:
+            return np.empty(0)
+        return self._columns[idx][self._start:self._end]
+
+    def views(self) -> List[np.ndarray]:
+        return [self.view(i) for i in range(len(self._columns))]
+
+    def _allocate(self, arrays: List[Optional[np.ndarray]], capacity: int):
+        self._capacity = capacity
+        self._columns = [np.empty((capacity,) + arr.shape[1:], dtype=arr.dtype) if arr is not None else None
+                         for arr in arrays]
+        self._start = 0
+        self._end = 0
+
+    def _reserve(self, n: int):
+        live = len(self)
+        capacity = self._capacity
+        while live + n > capacity // 2:
+            capacity *= 2
+        columns = []
+        for col in self._columns:
+            if col is None:
+                columns.append(None)
+                continue
+            new_col = np.empty((capacity,) + col.shape[1:], dtype=col.dtype)
+            new_col[:live] = col[self._start:self._end]
+            columns.append(new_col)
+        self._columns = columns
+        self._capacity = capacity
+        self._start = 0
+        self._end = live
@@ -0,0 +1,89 @@
+# Copyright (c) 2020-2025 ITER Organization,
+#               CS 90046
+#               13067 St Paul Lez Durance Cedex
+#               France
+# Author IO
+#
+# This file is part of iplotlib module.
+# iplotlib python module is free software: you can redistribute it and/or modify it under
+# the terms of the MIT license.
+#
+# This file is part of ITER CODAC software.
+# For the terms and conditions of redistribution or use of this software
+# refer to the file LICENSE located in the top level directory
+# of the distribution package
+#
+
+
+
+"""
+Sliding window minimum and maximum of a streaming signal.
+"""
+
+from collections import deque
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+class RollingExtrema:
+    """
+    Tracks the minimum and maximum of the samples whose x value lies within `span` of the newest sample.
+
+    Two monotonic queues hold the only samples that can still become the window minimum or maximum, so each
+    sample is pushed and popped at most once and :meth:`extrema` is O(1) however long the stream has run.
+    Samples must be appended in increasing x order.
+    """
+
+    def __init__(self, span):
+        self.span = span
+        self.last_x = None
+        self._min = deque()  # (x, -y) with decreasing -y
+        self._max = deque()  # (x, y) with decreasing y
+
+    def clear(self):
+        self.last_x = None
+        self._min.clear()
+        self._max.clear()
+
+    def update(self, x, y_min, y_max=None):
+        """
+        Append a batch of samples. For multi-column signals, `y_min` and `y_max` are the per-sample extrema
+        of the columns; for single-column signals `y_max` can be omitted.
+        """
+        x = np.asarray(x)
+        y_min = np.asarray(y_min, dtype=float)
+        y_max = y_min if y_max is None else np.asarray(y_max, dtype=float)
+        if len(x) == 0:
+            return
+        self.last_x = x[-1]
+
+        valid = ~(np.isnan(y_min) | np.isnan(y_max))
+        if not valid.all():
+            x, y_min, y_max = x[valid], y_min[valid], y_max[valid]
+        if len(x):
+            self._push(self._max, x, y_max)
+            self._push(self._min, x, -y_min)
+
+        cutoff = self.last_x - self.span
+        for queue in (self._min, self._max):
+            while queue and queue[0][0] < cutoff:
+                queue.popleft()
+
+    def extrema(self) -> Optional[Tuple[float, float]]:
+        """
+        Returns (min, max) of the samples in the window or None if the window has no valid sample.
+        """
+        if not self._min or not self._max:
+            return None
+        return -self._min[0][1], self._max[0][1]
+
+    @staticmethod
+    def _push(queue: deque, x: np.ndarray, y: np.ndarray):
+        # Only the samples larger than everything after them in the batch can ever become the window maximum.
+        later_max = np.maximum.accumulate(y[::-1])[::-1]
+        keep = np.ones(len(y), dtype=bool)
+        keep[:-1] = y[:-1] > later_max[1:]
+        while queue and queue[-1][1] <= later_max[0]:
+            queue.pop()
+        queue.extend(zip(x[keep].tolist(), y[keep].tolist()))
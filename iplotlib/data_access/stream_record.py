@@ -0,0 +1,158 @@
+# Copyright (c) 2020-2025 ITER Organization,
+#               CS 90046
+#               13067 St Paul Lez Durance Cedex
+#               France
+# Author IO
+#
+# This file is part of iplotlib module.
+# iplotlib python module is free software: you can redistribute it and/or modify it under
+# the terms of the MIT license.
+#
+# This file is part of ITER CODAC software.
+# For the terms and conditions of redistribution or use of this software
+# refer to the file LICENSE located in the top level directory
+# of the distribution package
+#
+
+
+
+"""
+Record the batches received by a CanvasStreamer and play them back as a data source.
+
+A recording is an append-only file. Each batch is stored as one JSON header line (wall-clock time, data source,
+variable name and units) followed by its x and y arrays in ``.npy`` format.
+"""
+
+import json
+import time
+from collections import defaultdict, deque
+from threading import Event, Lock
+from typing import Callable, Deque, Dict, Optional, Tuple
+
+import numpy as np
+
+import iplotLogging.setupLogger as Sl
+
+logger = Sl.get_logger(__name__)
+
+
+class RecordedData:
+    """
+    A batch of samples read from a recording. It has the attributes of the data objects returned by a data access
+    module that are used while streaming.
+    """
+
+    def __init__(self, xdata: np.ndarray, ydata: np.ndarray, xunit: str = '', yunit: str = ''):
+        self.xdata = xdata
+        self.ydata = ydata
+        self.xunit = xunit
+        self.yunit = yunit
+
+
+class StreamRecorder:
+    """
+    Appends every batch given to :meth:`record` to the file at `path`. It is safe to record from several threads.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'ab')
+        self._lock = Lock()
+
+    def record(self, ds: str, varname: str, dobj):
+        header = dict(t=time.time(), ds=ds, var=varname,
+                      xunit=getattr(dobj, 'xunit', '') or '', yunit=getattr(dobj, 'yunit', '') or '')
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.write(json.dumps(header).encode() + b'\n')
+            np.save(self._file, np.asarray(dobj.xdata), allow_pickle=False)
+            np.save(self._file, np.asarray(dobj.ydata), allow_pickle=False)
+            self._file.flush()
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+def read_recording(path: str):
+    """
+    Yields (time, ds, varname, data) for each batch of a recording. A batch truncated by an interrupted recording
+    ends the iteration.
+    """
+    with open(path, 'rb') as f:
+        while True:
+            line = f.readline()
+            if not line:
+                return
+            try:
+                header = json.loads(line)
+                xdata = np.load(f, allow_pickle=False)
+                ydata = np.load(f, allow_pickle=False)
+            except (ValueError, EOFError) as e:
+                logger.warning(f"Recording {path} ends with an incomplete batch: {e}")
+                return
+            yield header['t'], header['ds'], header['var'], RecordedData(xdata, ydata, header['xunit'],
+                                                                         header['yunit'])
+
+
+class StreamReplay:
+    """
+    A data source that plays a recording back through the subscription interface used by
+    :class:`~iplotlib.data_access.CanvasStreamer`.
+
+    `speed` scales the recorded pace: 1 plays in real time, N plays N times faster and None (or 0) delivers the
+    batches as fast as possible, which turns a replay into a throughput benchmark of the whole streaming path.
+    `listener(ds, varname)` is called after each delivered batch. A CanvasStreamer sets it to its ``notify``.
+    """
+
+    def __init__(self, path: str, speed: Optional[float] = 1.0, listener: Callable = None):
+        self.path = path
+        self.speed = speed
+        self.listener = listener
+        self.finished = Event()
+        self._queues = defaultdict(deque)  # type: Dict[Tuple[str, str], Deque[RecordedData]]
+        self._stopped = {}  # type: Dict[str, Event] # key is data source
+        self._running = 0
+        self._lock = Lock()
+
+    def start_subscription(self, ds: str, params=None):
+        """
+        Deliver the batches of `ds` for the variables in `params` (all of them if None). Blocks until the end of
+        the recording or until :meth:`stop_subscription` is called.
+        """
+        stopped = self._stopped[ds] = Event()
+        varnames = set(params) if params is not None else None
+        with self._lock:
+            self._running += 1
+            self.finished.clear()
+        start = None
+        for t, rec_ds, varname, dobj in read_recording(self.path):
+            if rec_ds != ds or (varnames is not None and varname not in varnames):
+                continue
+            if start is None:
+                start = (time.monotonic(), t)
+            elif self.speed:
+                delay = start[0] + (t - start[1]) / self.speed - time.monotonic()
+                if delay > 0 and stopped.wait(delay):
+                    break
+            if stopped.is_set():
+                break
+            self._queues[(ds, varname)].append(dobj)
+            if self.listener is not None:
+                self.listener(ds, varname)
+        with self._lock:
+            self._running -= 1
+            if not self._running:
+                self.finished.set()
+
+    def get_next_data(self, ds: str, varname: str) -> Optional[RecordedData]:
+        try:
+            return self._queues[(ds, varname)].popleft()
+        except IndexError:
+            return None
+
+    def stop_subscription(self, ds: str):
+        stopped = self._stopped.get(ds)
+        if stopped is not None:
+            stopped.set()
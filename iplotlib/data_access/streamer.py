@@ -17,9 +17,16 @@
 
 import time
 from functools import partial
-from threading import Thread
+from threading import Condition, Thread
+from typing import Dict, Optional, Sequence, Set, Tuple
+
+import numpy as np
 
 import iplotLogging.setupLogger as Sl
+from iplotlib.data_access.redraw_scheduler import RedrawScheduler
+from iplotlib.data_access.ring_buffer import RingBuffer
+from iplotlib.data_access.stream_record import StreamRecorder
+from iplotlib.data_access.tiered_buffer import TieredBuffer
 
 logger = Sl.get_logger(__name__)
 
@@ -28,16 +35,67 @@ logger = Sl.get_logger(__name__)
 # CTRL-SYSM-CUB-4505-61:CU0001-HTH-TT
 
 class CanvasStreamer:
+    """
+    Subscribes to the data sources of all streamable signals in a canvas and appends the received samples to them.
+
+    `max_samples` and `max_span` bound the history kept per signal (see :class:`~iplotlib.data_access.RingBuffer`).
+    Use None to keep every sample. With `tiers`, samples older than `max_span` are not dropped but summarized
+    into progressively coarser min/max tiers (see :class:`~iplotlib.data_access.TieredBuffer`).
+
+    Each data source has one collector thread. When a variable has pending data, the collector drains all of it
+    (up to `max_batches` packets) and hands it to the callback as a single batch.
+
+    A data source with a `listener` attribute, like :class:`~iplotlib.data_access.StreamReplay`, reports each
+    delivered batch: the streamer sets the listener to :meth:`notify` and the collector sleeps until a variable is
+    notified, idle variables cost nothing. Other data sources, like iplotDataAccess, are polled: variables that had
+    nothing to deliver are polled less and less often, from `min_poll_interval` up to `max_poll_interval` seconds,
+    and :meth:`notify` wakes the collector before its next poll.
+
+    A :class:`~iplotlib.data_access.StreamRecorder` given as `recorder` saves every batch handed to the signals.
 
-    def __init__(self, da):
+    When :meth:`start` is given a `frame_callback`, updated signals are collected by a
+    :class:`~iplotlib.data_access.RedrawScheduler` and redrawn together at most `max_fps` times per second.
+    """
+
+    def __init__(self, da, max_samples: int = None, max_span=None, min_poll_interval: float = 0.001,
+                 max_poll_interval: float = 0.1, max_batches: int = 1000, max_fps: float = 25.0,
+                 tiers: Sequence[Tuple] = None, recorder: StreamRecorder = None):
         self.da = da
+        self.max_samples = max_samples
+        self.max_span = max_span
+        self.tiers = tiers
+        self.recorder = recorder
+        self.min_poll_interval = min_poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.max_batches = max_batches
+        self.max_fps = max_fps
         self.stop_flag = False
         self.signals = {}
         self.collectors = []
         self.streamers = []
+        self._wakeups = {}  # type: Dict[str, Condition] # key is data source
+        self._deadlines = {}  # type: Dict[str, Dict[str, float]] # key is data source, then varname
+        self._notified = {}  # type: Dict[str, Set[str]] # key is data source
+        self._scheduler = None  # type: Optional[RedrawScheduler]
+        self._callback = None  # called with each signal whose data changed
+        self._push = False  # the data source calls notify, see _listen
+        self._da_listener = None  # the listener of the data source before _listen
+
+    def start(self, canvas, callback=None, frame_callback=None):
+        """
+        Start streaming the signals of `canvas`.
 
-    def start(self, canvas, callback):
+        :param callback: called with each signal as soon as it has received new samples
+        :param frame_callback: called with the list of signals updated since the previous frame, replaces `callback`
+        """
         self.stop_flag = False
+        if frame_callback is not None:
+            self._scheduler = RedrawScheduler(frame_callback, max_fps=self.max_fps)
+            self._scheduler.start()
+            callback = self._scheduler.mark_dirty
+        self._callback = callback
+        if not self._push:
+            self._push = self._listen()
         all_signals = []
         for col in canvas.plots:
             for plot in col:
@@ -50,6 +108,7 @@ class CanvasStreamer:
         signals = {}
         for s in all_signals:
             signals[s.name] = signals.get(s.name, []) + [s]
+            s.stream_buffer = self.create_buffer()
         self.signals = signals
 
         signals_by_ds = dict()
@@ -64,7 +123,16 @@ class CanvasStreamer:
             logger.info(F"Starting streamer for data source: {ds}")
             self.start_stream(ds, signals_by_ds[ds], partial(self.handler, callback))
 
+    def create_buffer(self) -> RingBuffer:
+        if self.tiers and self.max_span is not None:
+            return TieredBuffer(self.max_span, self.tiers)
+        return RingBuffer(max_samples=self.max_samples, max_span=self.max_span)
+
     def start_stream(self, ds, varnames, callback):
+        self._wakeups[ds] = Condition()
+        self._deadlines[ds] = {varname: 0.0 for varname in varnames}
+        # The data queued before the listener was set is drained first
+        self._notified[ds] = set(varnames) if self._push else set()
         collect_thread = Thread(name="collector", target=self.stream_thread, args=(ds, varnames, callback), daemon=True)
 
         collect_thread.start()
@@ -77,13 +145,47 @@ class CanvasStreamer:
         streaming_thread.start()
         self.streamers.append(streaming_thread)
 
+        wakeup = self._wakeups[ds]
+        deadlines = self._deadlines[ds]
+        notified = self._notified[ds]
+        intervals = {varname: self.min_poll_interval for varname in varnames}
+
         while not self.stop_flag:
-            for varname in varnames:
-                dobj = self.da.get_next_data(ds, varname)
+            now = time.monotonic()
+            with wakeup:
+                if self._push:
+                    due = list(notified)
+                else:
+                    due = [varname for varname, deadline in deadlines.items()
+                           if deadline <= now or varname in notified]
+                notified.clear()
 
-                if dobj is not None and dobj.xdata is not None and len(dobj.xdata) > 0 and callback is not None:
-                    callback(varname, dobj)
-            time.sleep(0.1)
+            for varname in due:
+                dobj = self._drain(ds, varname)
+                if dobj is not None:
+                    intervals[varname] = self.min_poll_interval
+                    if callback is not None:
+                        callback(varname, dobj)
+                    if self._push:
+                        # A drain stops after max_batches packets, look again
+                        with wakeup:
+                            notified.add(varname)
+                else:
+                    intervals[varname] = min(intervals[varname] * 2, self.max_poll_interval)
+            pending_at = self._process_pending(varnames)
+
+            with wakeup:
+                now = time.monotonic()
+                timeout = None
+                if not self._push:
+                    for varname in due:
+                        deadlines[varname] = now + intervals[varname]
+                    timeout = min(deadlines.values()) - now if deadlines else self.max_poll_interval
+                if pending_at is not None:
+                    timeout = pending_at - now if timeout is None else min(timeout, pending_at - now)
+                # Notifications received while draining are handled right away.
+                if (timeout is None or timeout > 0) and not notified and not self.stop_flag:
+                    wakeup.wait(timeout)
 
         logger.info("Issuing stop subscription...")
 
@@ -91,16 +193,85 @@ class CanvasStreamer:
         stopping_thread = Thread(name="stopper", target=self.da.stop_subscription, args=(ds,))
         stopping_thread.start()
 
+    def notify(self, ds, varname=None):
+        """
+        Wake the collector of data source `ds` to drain `varname` (or all variables if None). Data sources with a
+        `listener` call this after each delivered batch, for the others it can be called by code that knows when
+        data arrives. It is safe to call this from any thread.
+        """
+        wakeup = self._wakeups.get(ds)
+        if wakeup is None:
+            return
+        with wakeup:
+            if varname is None:
+                self._notified[ds].update(self._deadlines[ds].keys())
+            elif varname in self._deadlines[ds]:
+                self._notified[ds].add(varname)
+            wakeup.notify()
+
+    def _listen(self) -> bool:
+        """
+        Have the data source call :meth:`notify` after each delivered batch, along with the listener it already
+        had. Returns False if the data source has no `listener`, it is then polled.
+        """
+        if not hasattr(self.da, 'listener'):
+            return False
+        self._da_listener = listener = self.da.listener
+        if listener is None or listener == self.notify:
+            self.da.listener = self.notify
+        else:
+            def notify(ds, varname):
+                listener(ds, varname)
+                self.notify(ds, varname)
+
+            self.da.listener = notify
+        return True
+
     def stop(self):
         self.stop_flag = True
+        if self._push:
+            self.da.listener = self._da_listener
+            self._push = False
+        if self._scheduler is not None:
+            self._scheduler.stop()
+            self._scheduler = None
+        for wakeup in self._wakeups.values():
+            with wakeup:
+                wakeup.notify()
         self.collectors.clear()
         self.streamers.clear()
 
+    def _drain(self, ds, varname):
+        """
+        Collect all the data currently queued for `varname` and merge it into the first data object.
+        Batches whose data does not match their times are skipped. Returns None if nothing was queued.
+        """
+        batches = []
+        for _ in range(self.max_batches):
+            dobj = self.da.get_next_data(ds, varname)
+            if dobj is None or dobj.xdata is None or len(dobj.xdata) == 0:
+                break
+            if dobj.ydata is None or np.ndim(dobj.ydata) == 0 or len(dobj.ydata) != len(dobj.xdata):
+                logger.warning(f"Skipped a batch of {varname} with {len(dobj.xdata)} times and no matching data")
+                continue
+            batches.append(dobj)
+
+        if not batches:
+            return None
+        dobj = batches[0]
+        if len(batches) > 1:
+            dobj.xdata = np.concatenate([b.xdata for b in batches])
+            dobj.ydata = np.concatenate([b.ydata for b in batches])
+            logger.debug(f"Merged {len(batches)} batches of {varname}")
+        return dobj
+
     def handler(self, callback, varname, dobj):
         signals_by_name = self.signals.get(varname)
         if signals_by_name is None:
             logger.warning(f'signal name {varname} was not found')
             return
+        if self.recorder is not None:
+            self.recorder.record(signals_by_name[0].data_source, varname, dobj)
         for signal in signals_by_name:
             if hasattr(signal, 'inject_external'):
                 result = dict(alias_map={
@@ -115,6 +286,25 @@ class CanvasStreamer:
                     d1_unit=dobj.yunit,
                     d2_unit='',
                     d3_unit='')
-                signal.inject_external(append=True, **result)
+                updated = signal.inject_external(append=True, **result)
                 logger.debug(f"Updated {varname} with {len(dobj.xdata)} new samples")
-                callback(signal)
+                if updated and callback is not None:
+                    callback(signal)
+
+    def _process_pending(self, varnames) -> Optional[float]:
+        """
+        Process the samples of the signals of `varnames` whose processing was put off, as soon as they are due
+        (see :meth:`~iplotlib.interface.IplotSignalAdapter.process_pending`), so that the last batches of a stream
+        are shown even if no other batch follows. Returns the earliest time at which samples are still pending.
+        """
+        pending_at = None
+        for varname in varnames:
+            for signal in self.signals.get(varname, []):
+                if not hasattr(signal, 'process_pending'):
+                    continue
+                if signal.process_pending() and self._callback is not None:
+                    self._callback(signal)
+                signal_pending_at = signal.stream_pending_at
+                if signal_pending_at is not None and (pending_at is None or signal_pending_at < pending_at):
+                    pending_at = signal_pending_at
+        return pending_at
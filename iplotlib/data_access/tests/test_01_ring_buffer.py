@@ -0,0 +1,68 @@
+# Copyright (c) 2020-2025 ITER Organization,
+#               CS 90046
+#               13067 St Paul Lez Durance Cedex
+#               France
+# Author IO
+#
+# This file is part of iplotlib module.
+# iplotlib python module is free software: you can redistribute it and/or modify it under
+# the terms of the MIT license.
+#
+# This file is part of ITER CODAC software.
+# For the terms and conditions of redistribution or use of this software
+# refer to the file LICENSE located in the top level directory
+# of the distribution package
+#
+
+
+import unittest
+
+import numpy as np
+
+from iplotlib.data_access.ring_buffer import RingBuffer
+
+
+class TestRingBuffer(unittest.TestCase):
+
+    def test_append_matches_concatenation(self):
+        buffer = RingBuffer(capacity=4)
+        expected_t, expected_y = [], []
+        for i in range(50):
+            t = np.arange(i * 3, i * 3 + 3, dtype=np.int64)
+            y = t * 0.5
+            buffer.append(t, y, [], [])
+            expected_t.append(t)
+            expected_y.append(y)
+
+        np.testing.assert_array_equal(buffer.view(0), np.concatenate(expected_t))
+        np.testing.assert_array_equal(buffer.view(1), np.concatenate(expected_y))
+        self.assertEqual(len(buffer.view(2)), 0)
+        self.assertEqual(len(buffer), 150)
+
+    def test_views_are_not_overwritten(self):
+        buffer = RingBuffer(max_samples=8, capacity=4)
+        buffer.append(np.arange(6), np.arange(6))
+        first = buffer.view(1)
+        snapshot = first.copy()
+        for i in range(20):
+            buffer.append(np.arange(6, 9) + i * 3, np.arange(6, 9) + i * 3)
+        np.testing.assert_array_equal(first, snapshot)
+
+    def test_max_samples(self):
+        buffer = RingBuffer(max_samples=10, capacity=4)
+        for i in range(100):
+            buffer.append([i], [i * 2.0])
+        np.testing.assert_array_equal(buffer.view(0), np.arange(90, 100))
+        self.assertLessEqual(buffer.capacity, 40)
+
+        buffer.append(np.arange(100, 125), np.arange(100, 125))
+        np.testing.assert_array_equal(buffer.view(0), np.arange(115, 125))
+
+    def test_max_span(self):
+        buffer = RingBuffer(max_span=10)
+        buffer.append(np.arange(0, 100, 2), np.zeros(50))
+        np.testing.assert_array_equal(buffer.view(0), np.arange(88, 100, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
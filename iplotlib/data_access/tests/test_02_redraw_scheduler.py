@@ -0,0 +1,50 @@
+# Copyright (c) 2020-2025 ITER Organization,
+#               CS 90046
+#               13067 St Paul Lez Durance Cedex
+#               France
+# Author IO
+#
+# This file is part of iplotlib module.
+# iplotlib python module is free software: you can redistribute it and/or modify it under
+# the terms of the MIT license.
+#
+# This file is part of ITER CODAC software.
+# For the terms and conditions of redistribution or use of this software
+# refer to the file LICENSE located in the top level directory
+# of the distribution package
+#
+
+
+
+import threading
+import unittest
+
+from iplotlib.data_access.redraw_scheduler import RedrawScheduler
+
+
+class TestRedrawScheduler(unittest.TestCase):
+
+    def test_updates_are_coalesced(self):
+        frames = []
+        done = threading.Event()
+
+        def on_frame(signals):
+            frames.append(signals)
+            if sum(len(f) for f in frames) >= 2:
+                done.set()
+
+        scheduler = RedrawScheduler(on_frame, max_fps=10)
+        signal_a, signal_b = object(), object()
+        # The first frame is due immediately; hold the lock so all updates land before it is taken.
+        with scheduler._wakeup:
+            scheduler.start()
+            for _ in range(100):
+                scheduler.mark_dirty(signal_a)
+                scheduler.mark_dirty(signal_b)
+        self.assertTrue(done.wait(2.0))
+        scheduler.stop()
+
+        self.assertEqual(len(frames), 1)
+        self.assertEqual(len(frames[0]), 2)
+        self.assertIs(frames[0][0], signal_a)
+        self.assertIs(frames[0][1], signal_b)
@@ -0,0 +1,46 @@
+# Copyright (c) 2020-2025 ITER Organization,
+#               CS 90046
+#               13067 St Paul Lez Durance Cedex
+#               France
+# Author IO
+#
+# This file is part of iplotlib module.
+# iplotlib python module is free software: you can redistribute it and/or modify it under
+# the terms of the MIT license.
+#
+# This file is part of ITER CODAC software.
+# For the terms and conditions of redistribution or use of this software
+# refer to the file LICENSE located in the top level directory
+# of the distribution package
+#
+
+
+
+import unittest
+
+import numpy as np
+
+from iplotlib.data_access.rolling_extrema import RollingExtrema
+
+
+class TestRollingExtrema(unittest.TestCase):
+
+    def test_matches_window_min_max(self):
+        rng = np.random.default_rng(0)
+        span = 50
+        tracker = RollingExtrema(span)
+        x = np.arange(1000, dtype=np.int64) * 2
+        y = rng.normal(size=1000).cumsum()
+        y[::37] = np.nan
+        start = 0
+        for end in np.sort(rng.integers(1, 1000, size=60)).tolist() + [1000]:
+            tracker.update(x[start:end], y[start:end])
+            start = end
+            in_window = x[:end] >= x[end - 1] - span
+            self.assertEqual(tracker.extrema(), (np.nanmin(y[:end][in_window]), np.nanmax(y[:end][in_window])))
+
+    def test_empty_window(self):
+        tracker = RollingExtrema(10)
+        self.assertIsNone(tracker.extrema())
+        tracker.update([0, 1], [np.nan, np.nan])
+        self.assertIsNone(tracker.extrema())
@@ -0,0 +1,53 @@
+# Copyright (c) 2020-2025 ITER Organization,
+#               CS 90046
+#               13067 St Paul Lez Durance Cedex
+#               France
+# Author IO
+#
+# This file is part of iplotlib module.
+# iplotlib python module is free software: you can redistribute it and/or modify it under
+# the terms of the MIT license.
+#
+# This file is part of ITER CODAC software.
+# For the terms and conditions of redistribution or use of this software
+# refer to the file LICENSE located in the top level directory
+# of the distribution package
+#
+
+
+
+import unittest
+
+import numpy as np
+
+from iplotlib.data_access.tiered_buffer import TieredBuffer
+
+
+class TestTieredBuffer(unittest.TestCase):
+
+    def test_retention(self):
+        rng = np.random.default_rng(0)
+        buffer = TieredBuffer(recent_span=1000, tiers=[(10, 9000), (100, 90000)])
+        all_t, all_y = [], []
+        for i in range(2000):
+            t = np.arange(i * 100, i * 100 + 100, dtype=np.int64)
+            y = rng.normal(size=100)
+            buffer.append(t, y)
+            all_t.append(t)
+            all_y.append(y)
+        all_t = np.concatenate(all_t)
+        all_y = np.concatenate(all_y)
+        t, y = buffer.view(0), buffer.view(1)
+
+        # Memory is bounded, the recent window is intact and the oldest samples are dropped.
+        self.assertLess(len(buffer), 10000)
+        self.assertTrue(np.all(np.diff(t) > 0))
+        recent = all_t >= all_t[-1] - 1000
+        np.testing.assert_array_equal(t[-recent.sum():], all_t[recent])
+        np.testing.assert_array_equal(y[-recent.sum():], all_y[recent])
+        self.assertGreater(t[0], 90000)
+
+        # The summaries keep the envelope of the retained history.
+        kept = all_t >= t[0]
+        self.assertEqual(y.max(), all_y[kept].max())
+        self.assertEqual(y.min(), all_y[kept].min())
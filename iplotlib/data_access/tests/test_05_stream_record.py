@@ -0,0 +1,57 @@
+# Copyright (c) 2020-2025 ITER Organization,
+#               CS 90046
+#               13067 St Paul Lez Durance Cedex
+#               France
+# Author IO
+#
+# This file is part of iplotlib module.
+# iplotlib python module is free software: you can redistribute it and/or modify it under
+# the terms of the MIT license.
+#
+# This file is part of ITER CODAC software.
+# For the terms and conditions of redistribution or use of this software
+# refer to the file LICENSE located in the top level directory
+# of the distribution package
+#
+
+
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from iplotlib.data_access.stream_record import RecordedData, StreamRecorder, StreamReplay
+
+
+class TestStreamRecord(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.rec')
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_record_replay(self):
+        recorder = StreamRecorder(self.path)
+        for i in range(10):
+            varname = 'a' if i % 2 else 'b'
+            recorder.record('ds', varname, RecordedData(np.arange(i, i + 5, dtype=np.int64), np.full(5, i * 0.5),
+                                                        'ns', 'V'))
+        recorder.close()
+
+        notified = []
+        replay = StreamReplay(self.path, speed=None, listener=lambda ds, varname: notified.append(varname))
+        replay.start_subscription('ds', params=['a'])
+        self.assertTrue(replay.finished.is_set())
+        self.assertEqual(notified, ['a'] * 5)
+
+        for i in range(1, 10, 2):
+            dobj = replay.get_next_data('ds', 'a')
+            np.testing.assert_array_equal(dobj.xdata, np.arange(i, i + 5))
+            np.testing.assert_array_equal(dobj.ydata, np.full(5, i * 0.5))
+            self.assertEqual((dobj.xunit, dobj.yunit), ('ns', 'V'))
+        self.assertIsNone(replay.get_next_data('ds', 'a'))
+        self.assertIsNone(replay.get_next_data('ds', 'b'))
@@ -0,0 +1,42 @@
+# Copyright (c) 2020-2025 ITER Organization,
+#               CS 90046
+#               13067 St Paul Lez Durance Cedex
+#               France
+# Author IO
+#
+# This file is part of iplotlib module.
+# iplotlib python module is free software: you can redistribute it and/or modify it under
+# the terms of the MIT license.
+#
+# This file is part of ITER CODAC software.
+# For the terms and conditions of redistribution or use of this software
+# refer to the file LICENSE located in the top level directory
+# of the distribution package
+#
+
+
+
+import subprocess
+import sys
+import unittest
+
+
+class TestImports(unittest.TestCase):
+
+    def check_import(self, module: str):
+        # A fresh interpreter, modules imported by the other tests would hide an import cycle
+        result = subprocess.run([sys.executable, '-c', f'import {module}'], capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+    def test_import_interface(self):
+        self.check_import('iplotlib.interface')
+
+    def test_import_data_access(self):
+        self.check_import('iplotlib.data_access')
+
+    def test_import_core(self):
+        self.check_import('iplotlib.core')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+# Copyright (c) 2020-2025 ITER Organization,
+#               CS 90046
+#               13067 St Paul Lez Durance Cedex
+#               France
+# Author IO
+#
+# This file is part of iplotlib module.
+# iplotlib python module is free software: you can redistribute it and/or modify it under
+# the terms of the MIT license.
+#
+# This file is part of ITER CODAC software.
+# For the terms and conditions of redistribution or use of this software
+# refer to the file LICENSE located in the top level directory
+# of the distribution package
+#
+
+
+
+import time
+import unittest
+
+import numpy as np
+
+from iplotlib.core import SignalXY
+from iplotlib.data_access.ring_buffer import RingBuffer
+from iplotlib.data_access.streamer import CanvasStreamer
+
+ALIAS_MAP = {'time': {'idx': 0, 'independent': True}, 'data': {'idx': 1}}
+
+
+def inject(signal, t, y, append=True):
+    return signal.inject_external(append=append, d0=t, d1=y, d2=[], d3=[], alias_map=ALIAS_MAP)
+
+
+class TestStreamProcessing(unittest.TestCase):
+
+    def test_pending_processing(self):
+        signal = SignalXY(name='s', uid='s', data_access_enabled=False, y_expr='np.cumsum(${self}.data_store[1])')
+        signal.stream_processing_interval = 0.05
+        inject(signal, np.arange(10.), np.ones(10), append=False)
+        self.assertIsNone(signal.stream_pending_at)
+
+        self.assertTrue(inject(signal, np.arange(10., 12.), np.ones(2)))
+        self.assertFalse(inject(signal, np.arange(12., 14.), np.ones(2)))
+        self.assertEqual(len(signal.y_data), 12)
+        self.assertIsNotNone(signal.stream_pending_at)
+
+        # The stream goes quiet, the last batch is processed once the interval is over.
+        streamer = CanvasStreamer(da=None)
+        streamer.signals = {'s': [signal]}
+        updated = []
+        streamer._callback = updated.append
+        time.sleep(max(0., signal.stream_pending_at - time.monotonic()))
+        self.assertIsNone(streamer._process_pending(['s']))
+        self.assertEqual(updated, [signal])
+        self.assertEqual(len(signal.y_data), 14)
+        self.assertEqual(signal.y_data[-1], 14.)
+        self.assertIsNone(signal.stream_pending_at)
+
+    def test_inf_count(self):
+        signal = SignalXY(name='s', uid='s', data_access_enabled=False, y_expr='${self}.data_store[1] * 2')
+        inject(signal, np.arange(10.), np.r_[np.inf, np.ones(9)], append=False)
+        inject(signal, np.arange(10., 12.), np.r_[np.inf, 1.])
+        self.assertEqual(signal.status_info.inf, 2)
+
+        # The samples dropped from the front are taken off the count.
+        signal.stream_buffer.max_samples = 5
+        inject(signal, np.arange(12., 14.), np.r_[-np.inf, 1.])
+        self.assertEqual(len(signal.y_data), 5)
+        self.assertEqual(signal.status_info.inf, 2)
+
+        inject(signal, np.arange(0., 3.), np.ones(3), append=False)
+        self.assertEqual(signal.status_info.inf, 0)
+
+    def test_first_batch(self):
+        # CanvasStreamer gives each signal an empty buffer before the first batch arrives
+        signal = SignalXY(name='s', uid='s', data_access_enabled=False)
+        signal.stream_buffer = RingBuffer()
+        self.assertTrue(inject(signal, np.arange(5.), np.ones(5)))
+        np.testing.assert_array_equal(signal.x_data, np.arange(5.))
+        self.assertTrue(inject(signal, np.arange(5., 7.), np.zeros(2)))
+        np.testing.assert_array_equal(signal.y_data, np.r_[np.ones(5), np.zeros(2)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+# Copyright (c) 2020-2025 ITER Organization,
+#               CS 90046
+#               13067 St Paul Lez Durance Cedex
+#               France
+# Author IO
+#
+# This file is part of iplotlib module.
+# iplotlib python module is free software: you can redistribute it and/or modify it under
+# the terms of the MIT license.
+#
+# This file is part of ITER CODAC software.
+# For the terms and conditions of redistribution or use of this software
+# refer to the file LICENSE located in the top level directory
+# of the distribution package
+#
+
+
+
+import time
+import unittest
+from collections import Counter, defaultdict, deque
+from threading import Event
+
+import numpy as np
+
+from iplotlib.data_access.stream_record import RecordedData
+from iplotlib.data_access.streamer import CanvasStreamer
+
+
+class QueuedSource:
+    def __init__(self, batches):
+        self.batches = list(batches)
+
+    def get_next_data(self, ds, varname):
+        return self.batches.pop(0) if self.batches else None
+
+
+class SubscribedSource:
+    """Queues the batches given to `deliver` and counts the calls to get_next_data."""
+
+    def __init__(self):
+        self.queues = defaultdict(deque)
+        self.polls = Counter()
+
+    def start_subscription(self, ds, params=None):
+        pass
+
+    def stop_subscription(self, ds):
+        pass
+
+    def deliver(self, ds, varname, dobj):
+        self.queues[varname].append(dobj)
+
+    def get_next_data(self, ds, varname):
+        self.polls[varname] += 1
+        queue = self.queues[varname]
+        return queue.popleft() if queue else None
+
+
+class PushingSource(SubscribedSource):
+    """Reports each delivered batch to its listener, like StreamReplay."""
+
+    def __init__(self):
+        super().__init__()
+        self.listener = None
+
+    def deliver(self, ds, varname, dobj):
+        super().deliver(ds, varname, dobj)
+        if self.listener is not None:
+            self.listener(ds, varname)
+
+
+class TestStreamer(unittest.TestCase):
+
+    def test_drain(self):
+        source = QueuedSource([RecordedData(np.arange(0, 3), np.zeros(3)),
+                               RecordedData(np.arange(3, 5), None),
+                               RecordedData(np.arange(5, 7), np.ones(3)),
+                               RecordedData(np.arange(7, 9), np.ones(2))])
+        dobj = CanvasStreamer(source)._drain('ds', 'a')
+        np.testing.assert_array_equal(dobj.xdata, [0, 1, 2, 7, 8])
+        np.testing.assert_array_equal(dobj.ydata, [0, 0, 0, 1, 1])
+        self.assertIsNone(CanvasStreamer(source)._drain('ds', 'a'))
+
+    def test_drain_malformed(self):
+        source = QueuedSource([RecordedData(np.arange(0, 3), None)])
+        self.assertIsNone(CanvasStreamer(source)._drain('ds', 'a'))
+
+    def stream(self, source, **kwargs):
+        streamer = CanvasStreamer(source, **kwargs)
+        received = Event()
+        streamer._push = streamer._listen()
+        streamer.start_stream('ds', ['a', 'b'], lambda varname, dobj: received.set())
+        self.addCleanup(streamer.stop)
+        return streamer, received
+
+    def test_notified(self):
+        source = PushingSource()
+        # Polling alone would only look again after min_poll_interval
+        streamer, received = self.stream(source, min_poll_interval=10.0, max_poll_interval=10.0)
+        time.sleep(0.1)
+        source.deliver('ds', 'a', RecordedData(np.arange(0, 3), np.zeros(3)))
+        self.assertTrue(received.wait(1.0))
+        time.sleep(0.1)
+        # The idle variable was only drained once, at the start
+        self.assertEqual(source.polls['b'], 1)
+
+        streamer.stop()
+        self.assertIsNone(source.listener)
+
+    def test_polled(self):
+        source = SubscribedSource()
+        streamer, received = self.stream(source, min_poll_interval=0.001, max_poll_interval=0.01)
+        self.assertFalse(streamer._push)
+        time.sleep(0.1)
+        source.deliver('ds', 'a', RecordedData(np.arange(0, 3), np.zeros(3)))
+        self.assertTrue(received.wait(1.0))
+        # Idle variables are still polled
+        self.assertGreater(source.polls['b'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
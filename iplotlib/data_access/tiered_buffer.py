@@ -0,0 +1,98 @@
+# Copyright (c) 2020-2025 ITER Organization,
+#               CS 90046
+#               13067 St Paul Lez Durance Cedex
+#               France
+# Author IO
+#
+# This file is part of iplotlib module.
+# iplotlib python module is free software: you can redistribute it and/or modify it under
+# the terms of the MIT license.
+#
+# This file is part of ITER CODAC software.
+# For the terms and conditions of redistribution or use of this software
+# refer to the file LICENSE located in the top level directory
+# of the distribution package
+#
+
+
+
+"""
+A streaming buffer that keeps recent samples at full resolution and older samples as min/max summaries.
+"""
+
+from typing import Sequence, Tuple
+
+import numpy as np
+
+from iplotlib.data_access.ring_buffer import RingBuffer
+
+
+class TieredBuffer(RingBuffer):
+    """
+    A :class:`~iplotlib.data_access.RingBuffer` for long-running streams with bounded memory.
+
+    Samples within `recent_span` of the newest sample keep their full resolution. Older samples go through `tiers`,
+    a list of (bucket width, span) pairs from the finest to the coarsest: within each tier only the minimum and the
+    maximum of every bucket are retained. Samples older than all the tiers are dropped. Spans and bucket widths are
+    expressed in units of the first column (time).
+
+    The summaries are rebuilt in new arrays once the samples that left the recent window exceed a quarter of the
+    buffer, which keeps appending at amortized O(batch size). Each rebuild increments `generation`.
+    """
+
+    def __init__(self, recent_span, tiers: Sequence[Tuple] = (), capacity: int = 1024):
+        super().__init__(capacity=capacity)
+        self.recent_span = recent_span
+        self.tiers = list(tiers)
+        self._summarized = 0  # number of leading samples that are already summaries
+
+    def clear(self):
+        super().clear()
+        self._summarized = 0
+
+    def append(self, *columns):
+        super().append(*columns)
+        if not self._columns or self._columns[0] is None or not len(self):
+            return
+        t = self.view(0)
+        pending = int(np.searchsorted(t, t[-1] - self.recent_span, side='left')) - self._summarized
+        if pending > max(self._capacity // 8, len(self) // 4):
+            self._summarize()
+
+    def _summarize(self):
+        # iplotlib.core imports the data access package through the signal adapter
+        from iplotlib.core.decimation import minmax_indices
+
+        t = self.view(0)
+        reference = self.view(1) if len(self.view(1)) == len(t) else t
+        boundary = t[-1] - self.recent_span
+        hi = int(np.searchsorted(t, boundary, side='left'))
+        recent = np.arange(hi, len(t))
+
+        pieces = [recent]
+        for bucket, span in self.tiers:
+            boundary -= span
+            lo = int(np.searchsorted(t, boundary, side='left'))
+            pieces.insert(0, lo + minmax_indices(t[lo:hi], reference[lo:hi], bucket))
+            hi = lo
+        keep = np.concatenate(pieces)
+
+        live = len(keep)
+        capacity = self._capacity
+        while live > capacity // 2:
+            capacity *= 2
+        columns = []
+        for i, col in enumerate(self._columns):
+            if col is None:
+                columns.append(None)
+                continue
+            new_col = np.empty((capacity,) + col.shape[1:], dtype=col.dtype)
+            new_col[:live] = self.view(i)[keep]
+            columns.append(new_col)
+        self._columns = columns
+        self._capacity = capacity
+        self._start = 0
+        self._end = live
+        self._summarized = live - len(recent)
+        self.generation += 1
+        self.version += 1
@@ -0,0 +1,151 @@
+# Copyright (c) 2020-2025 ITER Organization,
+#               CS 90046
+#               13067 St Paul Lez Durance Cedex
+#               France
+# Author IO
+#
+# This file is part of iplotlib module.
+# iplotlib python module is free software: you can redistribute it and/or modify it under
+# the terms of the MIT license.
+#
+# This file is part of ITER CODAC software.
+# For the terms and conditions of redistribution or use of this software
+# refer to the file LICENSE located in the top level directory
+# of the distribution package
+#
+
+
+
+"""
+Partial redraws of a matplotlib figure.
+"""
+
+import numpy as np
+from matplotlib.backend_bases import DrawEvent, FigureCanvasBase
+from matplotlib.transforms import Bbox
+
+from iplotLogging import setupLogger
+
+logger = setupLogger.get_logger(__name__)
+
+
+class AxesBlitter:
+    """
+    Repaints only the axes of a figure that changed since they were last drawn.
+
+    matplotlib marks an axes stale whenever its limits or any of its artists change. :meth:`blit` clears the area
+    of every stale axes (including its ticks and labels) with the empty figure background, draws those axes again
+    and blits the area to the screen. Axes whose area overlaps a cleared one are drawn again as well.
+
+    A full draw of the figure is still required when the figure size or the position of the axes changes,
+    and whenever figure-level artists changed. :meth:`blit` returns False in these cases.
+    """
+
+    def __init__(self, canvas: FigureCanvasBase):
+        self.canvas = canvas
+        self._layout = None
+        self._regions = dict()  # key is axes, value is the display Bbox of the axes with its decorations
+        self._background = None
+        self._blitting = False
+        canvas.mpl_connect('draw_event', self._on_draw)
+
+    def invalidate(self):
+        """Require a full draw before the next partial redraw."""
+        self._layout = None
+        self._background = None
+
+    def _layout_key(self):
+        figure = self.canvas.figure
+        return (tuple(figure.bbox.bounds),
+                tuple((id(ax), ax.bbox.bounds, ax.get_visible()) for ax in figure.axes))
+
+    def _on_draw(self, event: DrawEvent):
+        if self._blitting:
+            return
+        figure = self.canvas.figure
+        self._layout = self._layout_key()
+        self._background = None
+        self._regions = {ax: self._decorated_bbox(ax, event.renderer) for ax in figure.axes if ax.get_visible()}
+
+    def _figure_artists_stale(self) -> bool:
+        figure = self.canvas.figure
+        return any(artist.stale for artist in figure.texts + figure.legends + figure.patches + figure.lines +
+                   figure.images + figure.artists + figure.subfigs)
+
+    def can_blit(self) -> bool:
+        return (self.canvas.supports_blit and self._layout is not None and self._layout == self._layout_key()
+                and not self._figure_artists_stale())
+
+    def blit(self) -> bool:
+        """
+        Redraw the stale axes over the cached background. Returns False, without drawing anything, when a full draw
+        of the figure is needed instead.
+        """
+        if not self.can_blit():
+            return False
+        figure = self.canvas.figure
+        dirty = [ax for ax in figure.axes if ax.stale and ax in self._regions]
+        if not dirty:
+            return False
+
+        renderer = self.canvas.get_renderer()
+        buffer = np.asarray(self.canvas.buffer_rgba())
+        if self._background is None:
+            self._background = self._empty_background(renderer, buffer)
+
+        # Decorations move with the limits, clear both where they were and where they will be.
+        regions = dict()
+        for ax in dirty:
+            regions[ax] = Bbox.union([self._regions[ax], self._decorated_bbox(ax, renderer)])
+        pending = [ax for ax in self._regions if ax not in regions]
+        overlapping = True
+        while overlapping:
+            overlapping = [ax for ax in pending
+                           if any(self._regions[ax].overlaps(region) for region in regions.values())]
+            for ax in overlapping:
+                regions[ax] = self._regions[ax]
+                pending.remove(ax)
+
+        height = buffer.shape[0]
+        for region in regions.values():
+            x0, y0, x1, y1 = self._pixel_extents(region, buffer)
+            # The buffer rows go from the top of the figure down.
+            buffer[height - y1:height - y0, x0:x1] = self._background[height - y1:height - y0, x0:x1]
+
+        self._blitting = True
+        try:
+            for ax in sorted(regions, key=lambda a: a.get_zorder()):
+                ax.draw(renderer)
+                self._regions[ax] = self._decorated_bbox(ax, renderer)
+            self.canvas.blit(Bbox.union(list(regions.values())))
+            # Let listeners that cache the rendered figure, like the crosshair cursor, know it changed.
+            self.canvas.callbacks.process('draw_event', DrawEvent('draw_event', self.canvas, renderer))
+        finally:
+            self._blitting = False
+        logger.debug(f"Blitted {len(dirty)} stale axes, {len(regions) - len(dirty)} overlapping axes")
+        return True
+
+    @staticmethod
+    def _decorated_bbox(ax, renderer) -> Bbox:
+        # Laying out the title marks the axes stale although nothing changed since they were drawn.
+        stale = ax.stale
+        bbox = ax.get_tightbbox(renderer)
+        ax.stale = stale
+        return bbox
+
+    def _empty_background(self, renderer, buffer: np.ndarray) -> np.ndarray:
+        figure_image = buffer.copy()
+        renderer.clear()
+        self.canvas.figure.patch.draw(renderer)
+        background = buffer.copy()
+        buffer[...] = figure_image
+        return background
+
+    @staticmethod
+    def _pixel_extents(region: Bbox, buffer: np.ndarray):
+        height, width = buffer.shape[:2]
+        x0 = int(np.clip(np.floor(region.x0) - 1, 0, width))
+        x1 = int(np.clip(np.ceil(region.x1) + 1, 0, width))
+        y0 = int(np.clip(np.floor(region.y0) - 1, 0, height))
+        y1 = int(np.clip(np.ceil(region.y1) + 1, 0, height))
+        return x0, y0, x1, y1
@@ -0,0 +1,104 @@
+# Copyright (c) 2020-2025 ITER Organization,
+#               CS 90046
+#               13067 St Paul Lez Durance Cedex
+#               France
+# Author IO
+#
+# This file is part of iplotlib module.
+# iplotlib python module is free software: you can redistribute it and/or modify it under
+# the terms of the MIT license.
+#
+# This file is part of ITER CODAC software.
+# For the terms and conditions of redistribution or use of this software
+# refer to the file LICENSE located in the top level directory
+# of the distribution package
+#
+
+
+
+"""
+Screen-resolution reduction of the grids of matplotlib contours.
+"""
+
+from typing import Tuple
+
+import numpy as np
+from matplotlib.axes import Axes as MPLAxes
+from matplotlib.collections import Collection
+
+
+def grid_bounds(x_data, y_data) -> Tuple[Tuple[float, float], Tuple[float, float]]:
+    """
+    Returns the (min, max) of `x_data` and of `y_data`, NaNs are ignored. Empty or all-NaN grids give (nan, nan).
+    """
+    bounds = []
+    for data in (x_data, y_data):
+        data = np.asarray(data)
+        if data.size == 0 or np.isnan(data).all():
+            bounds.append((np.nan, np.nan))
+        else:
+            bounds.append((float(np.nanmin(data)), float(np.nanmax(data))))
+    return bounds[0], bounds[1]
+
+
+def grid_strides(mpl_axes: MPLAxes, bounds, shape) -> Tuple[int, int]:
+    """
+    Returns the (row, column) steps that reduce a grid of `shape` to at most about one cell per pixel of the part
+    visible in `mpl_axes`. Columns are assumed to follow x and rows to follow y, like the grids of `numpy.meshgrid`.
+    `bounds` are the x and y bounds of the grid, see :func:`grid_bounds`.
+
+    The steps are powers of two so that panning and small zooms keep the same steps.
+    """
+    if len(shape) != 2 or mpl_axes is None:
+        return 1, 1
+    width, height = mpl_axes.bbox.width, mpl_axes.bbox.height
+    x_bounds, y_bounds = bounds
+    row_fraction = _visible_fraction(y_bounds, None if mpl_axes.get_autoscaley_on() else mpl_axes.get_ylim())
+    col_fraction = _visible_fraction(x_bounds, None if mpl_axes.get_autoscalex_on() else mpl_axes.get_xlim())
+    return _stride(shape[0] * row_fraction, height), _stride(shape[1] * col_fraction, width)
+
+
+def decimate_grid(strides: Tuple[int, int], *grids):
+    """
+    Returns the grids with every `strides[0]`-th row and `strides[1]`-th column. The last row and column are
+    always kept so the contours span the same extent.
+    """
+    if strides == (1, 1):
+        return grids
+    rows = _stride_indices(grids[0].shape[0], strides[0])
+    cols = _stride_indices(grids[0].shape[1], strides[1])
+    return tuple(grid[np.ix_(rows, cols)] for grid in grids)
+
+
+def remove_contour(contour_set):
+    """
+    Remove the artists of `contour_set`, including its labels, from their axes.
+    """
+    if isinstance(contour_set, Collection):
+        # Since matplotlib 3.8 a contour set is a single collection that also removes its labels
+        contour_set.remove()
+        return
+    for collection in contour_set.collections:
+        collection.remove()
+    for text in getattr(contour_set, 'labelTexts', []):
+        text.remove()
+
+
+def _visible_fraction(bounds, limits) -> float:
+    data_min, data_max = bounds
+    if limits is None or not data_max > data_min:
+        return 1.0
+    return float(np.clip(abs(limits[1] - limits[0]) / (data_max - data_min), 0.0, 1.0))
+
+
+def _stride(cells: float, pixels: float) -> int:
+    if pixels <= 0 or cells <= pixels:
+        return 1
+    return 1 << int(np.floor(np.log2(cells / pixels)))
+
+
+def _stride_indices(n: int, stride: int) -> np.ndarray:
+    indices = np.arange(0, n, stride)
+    if indices[-1] != n - 1:
+        indices = np.r_[indices, n - 1]
+    return indices
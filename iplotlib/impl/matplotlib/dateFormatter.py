@@ -15,10 +15,10 @@
 #
 
 
-import datetime
+from collections import OrderedDict
 
+import numpy as np
 from matplotlib.ticker import ScalarFormatter
-import pandas
 
 import iplotLogging.setupLogger as Sl
 
@@ -41,6 +41,9 @@ class NanosecondDateFormatter(ScalarFormatter):
     """Formats for each date segment"""
     formats = ["{:4d}", "{:02d}", "{:02d}", "{:02d}", "{:02d}", "{:02d}", "{:03d}", "{:03d}", "{:03d}"]
 
+    """Number of tick sets whose labels are remembered"""
+    cache_size = 32
+
     def __init__(self, ax_idx: int, label_segments=4, postfix_end=True, postfix_start=False, offset_lut: list = None,
                  roundh=False):
         super().__init__()
@@ -52,6 +55,8 @@ class NanosecondDateFormatter(ScalarFormatter):
         self._offset_lut = offset_lut
         self._ax_idx = ax_idx
         self._round = roundh
+        self._labels = dict()  # labels of the current ticks, key is the tick location
+        self._tick_cache = OrderedDict()  # key is (offset, locs), value is (cut_start, offset_str, labels)
 
     @property
     def offset_ns(self):
@@ -65,14 +70,33 @@ class NanosecondDateFormatter(ScalarFormatter):
         if locs is None or len(locs) == 0:
             return
 
-        self.cut_start = self.lcp(self.offset_ns + int(locs[0]), self.offset_ns + int(locs[-1]))
+        offset = int(self.offset_ns)
+        key = (offset, tuple(locs))
+        cached = self._tick_cache.get(key)
+        if cached is None:
+            # Every tick is decomposed once, the common part and the labels are read from the same segments
+            segments = self.decompose(offset + np.asarray(locs).astype(np.int64))
+            cut_start = self._lcp_segments(segments[0], segments[-1])
+            offset_str = 'UTC:' + self._format_segments(segments[0], self.YEAR, cut_start,
+                                                        postfix_end=self.postfix_end,
+                                                        postfix_start=self.postfix_start)
+            labels = [self._format_segments(row, cut_start + 1, cut_start + self.label_segments) for row in segments]
+            cached = (cut_start, offset_str, labels)
+            self._tick_cache[key] = cached
+            if len(self._tick_cache) > self.cache_size:
+                self._tick_cache.popitem(last=False)
+        else:
+            self._tick_cache.move_to_end(key)
 
-        self.offset_str = 'UTC:' + self.date_fmt(self.offset_ns + locs[0], self.YEAR, self.cut_start,
-                                                 postfix_end=self.postfix_end, postfix_start=self.postfix_start)
+        self.cut_start, self.offset_str, labels = cached
+        self._labels = dict(zip(locs, labels))
 
         super().set_locs(locs)
 
     def __call__(self, x, pos=None):
+        label = self._labels.get(x)
+        if label is not None:
+            return label
         return self.date_fmt(int(self.offset_ns) + int(x), self.cut_start + 1, self.cut_start + self.label_segments)
 
     def format_data_short(self, value):
@@ -84,19 +108,37 @@ class NanosecondDateFormatter(ScalarFormatter):
     def get_offset(self):
         return self.offset_str
 
+    @classmethod
+    def decompose(cls, ts_numeric) -> np.ndarray:
+        """Split nanosecond timestamps into rows of the nine date segments (year ... nanosecond)"""
+        ns = np.atleast_1d(np.asarray(ts_numeric).astype(np.int64))
+        dt = ns.astype('datetime64[ns]')
+        years = dt.astype('datetime64[Y]')
+        months = dt.astype('datetime64[M]')
+        days = dt.astype('datetime64[D]')
+        ns_of_day = (dt - days).astype(np.int64)
+
+        segments = np.empty((len(ns), 9), dtype=np.int64)
+        segments[:, cls.YEAR] = years.astype(np.int64) + 1970
+        segments[:, cls.MONTH] = (months - years.astype('datetime64[M]')).astype(np.int64) + 1
+        segments[:, cls.DAY] = (days - months.astype('datetime64[D]')).astype(np.int64) + 1
+        segments[:, cls.HOUR] = ns_of_day // 3_600_000_000_000
+        segments[:, cls.MINUTE] = ns_of_day // 60_000_000_000 % 60
+        segments[:, cls.SECOND] = ns_of_day // 1_000_000_000 % 60
+        segments[:, cls.MILISECOND] = ns_of_day // 1_000_000 % 1000
+        segments[:, cls.MICROSECOND] = ns_of_day // 1000 % 1000
+        segments[:, cls.NANOSECOND] = ns_of_day % 1000
+        return segments
+
     def date_part(self, ts_numeric, part):
         """Extract date part from numerical timestamp"""
-        ts = pandas.Timestamp(ts_numeric)
-
-        if part == self.MILISECOND:
-            return int(ts.microsecond / 1000)
-        elif part == self.MICROSECOND:
-            return ts.microsecond % 1000
-        else:
-            return getattr(ts, self.attrs[part])
+        return int(self.decompose(ts_numeric)[0, part])
 
     def date_fmt(self, date, start=YEAR, end=NANOSECOND, postfix_end=False, postfix_start=False):
         """Formats date and returns only part between start segment and end segment"""
+        return self._format_segments(self.decompose(date)[0], start, end, postfix_end, postfix_start)
+
+    def _format_segments(self, segments, start=YEAR, end=NANOSECOND, postfix_end=False, postfix_start=False):
         ret = ""
         if end is None:
             end = self.NANOSECOND
@@ -105,47 +147,35 @@ class NanosecondDateFormatter(ScalarFormatter):
                 ret += self.postfixes[i - 1]
 
             if i < len(self.formats):
-                ret += self.formats[i].format(self.date_part(date, i))
+                ret += self.formats[i].format(int(segments[i]))
 
             if (i < end or postfix_end) and i < len(self.postfixes):
                 ret += self.postfixes[i]
 
         if self._round and 'T' in ret:
             # Implemented rounding only at the hour level, so the separator must be in that exact position
-            if ret[2] == 'T' or ret[5] == 'T':
+            if ret[2:3] == 'T' or ret[5:6] == 'T':
                 return self.round_hour(ret)
         return ret
 
     @staticmethod
     def round_hour(ret):
-        parts = ret.split('T')
-        hour_str = parts[1]
-
-        if len(hour_str) == 5:
-            hour = datetime.datetime.strptime(hour_str, '%H:%M')
-        else:
-            hour = datetime.datetime.strptime(hour_str, '%H:%M:%S')
-
-        if hour.minute >= 30:
-            hour += datetime.timedelta(hours=1)
-
-        if len(hour_str) == 5:
-            hour = hour.replace(minute=0)
-            round_hour_str = hour.strftime('%H:%M')
-        else:
-            hour = hour.replace(minute=0, second=0)
-            round_hour_str = hour.strftime('%H:%M:%S')
+        """Round a date ending with HH:MM or HH:MM:SS to the nearest hour. Other endings are returned as they are."""
+        date, _, time = ret.partition('T')
+        fields = time.split(':')
+        if len(fields) not in (2, 3) or not all(len(f) == 2 and f.isdigit() for f in fields):
+            return ret
 
-        new_ret = f"{parts[0]}T{round_hour_str}"
-
-        return new_ret
+        hour = int(fields[0])
+        if int(fields[1]) >= 30:
+            hour = (hour + 1) % 24
+        return f"{date}T{hour:02d}" + ":00" * (len(fields) - 1)
 
     def lcp(self, start, end):
         """Returns last common segment of two dates given as start and end"""
-        for i in range(self.YEAR, self.NANOSECOND + 1):
-            val_s, val_e = self.date_part(start, i), self.date_part(end, i)
-
-            if val_s != val_e:
-                return i - 1
+        segments = self.decompose([start, end])
+        return self._lcp_segments(segments[0], segments[1])
 
-        return 0
+    def _lcp_segments(self, start, end):
+        different = np.flatnonzero(start != end)
+        return int(different[0]) - 1 if len(different) else 0
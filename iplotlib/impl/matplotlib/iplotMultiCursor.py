@@ -15,17 +15,20 @@
 #
 
 
+import time
 from typing import List
 import numpy as np
 
 from matplotlib.axes import Axes as MPLAxes
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
+from matplotlib.backend_bases import FigureCanvasBase
 from matplotlib.lines import Line2D
 from matplotlib.text import Annotation
+from matplotlib.transforms import Bbox
 from matplotlib.widgets import Widget
 
 from iplotlib.core import SignalContour
 from iplotlib.core.impl_base import ImplementationPlotCacheTable
+from iplotlib.impl.matplotlib.lineDecimation import get_line_data, line_data_sorted
 from iplotLogging import setupLogger
 
 logger = setupLogger.get_logger(__name__)
@@ -40,7 +43,7 @@ class IplotMultiCursor(Widget):
 
     Parameters
     ----------
-    canvas : `matplotlib.backend_bases.FigureCanvasQTAgg`
+    canvas : `matplotlib.backend_bases.FigureCanvasBase`
         The FigureCanvas that contains all the axes.
 
     axes : list of `matplotlib.axes.Axes`
@@ -55,6 +58,10 @@ class IplotMultiCursor(Widget):
     vert_on: bool, default: True
         Whether to draw the vertical line.
 
+    refresh_rate: float, default: 60
+        Mouse motion is handled at most this many times per second, the last
+        event of a burst is always handled. Use None to handle every event.
+
     Other Parameters
     ----------------
     **line_props
@@ -66,7 +73,7 @@ class IplotMultiCursor(Widget):
     See :doc:`/gallery/widgets/multicursor`.
     """
 
-    def __init__(self, canvas: FigureCanvasQTAgg,
+    def __init__(self, canvas: FigureCanvasBase,
                  axes: List[MPLAxes],
                  x_label: bool = True,
                  y_label: bool = True,
@@ -78,6 +85,7 @@ class IplotMultiCursor(Widget):
                  text_color: str = "white",
                  font_size: int = 8,
                  cache_table: ImplementationPlotCacheTable = None,
+                 refresh_rate: float = 60.,
                  **line_props):
 
         self.canvas = canvas
@@ -102,6 +110,16 @@ class IplotMultiCursor(Widget):
         self.background = None
         self.need_clear = False
 
+        self.min_interval = 1. / refresh_rate if refresh_rate else 0.
+        self._last_move = float('-inf')
+        self._pending_event = None
+        self._timer = None
+        self._timer_started = False
+
+        self._lookups = dict()  # key is the annotation, value is (line data, sorted x, y data, sort order)
+        self._drawn_state = dict()  # key is the artist, value is what was last drawn (None if hidden)
+        self._drawn_extent = dict()  # key is the artist, value is the (x0, y0, x1, y1) it was last drawn in
+
         if self.use_blit:
             line_props['animated'] = True
 
@@ -199,6 +217,10 @@ class IplotMultiCursor(Widget):
         for annotation in self.value_annotations:
             annotation.set_visible(False)
 
+        # The background does not contain any cursor artist
+        self._drawn_state.clear()
+        self._drawn_extent.clear()
+
     def remove(self):
         for arrow in self.x_arrows + self.y_arrows:
             arrow.set_visible(False)
@@ -213,27 +235,38 @@ class IplotMultiCursor(Widget):
         self.disconnect()
 
     def on_move(self, event):
-        def get_values_from_line(lines, x_value):
-            if len(lines) == 1:
-                x, y = lines[0].get_xdata(), lines[0].get_ydata()
-            else:
-                x = lines[0].get_xdata()
-                y = (lines[0].get_ydata() + lines[1].get_ydata()) / 2
-            ix = np.searchsorted(x, x_value)
-            if ix == len(x):
-                ix = len(x) - 1
-
-            # Either return values at index or values at index-1
-            if ix > 0 and abs(x[ix - 1] - x_value) < abs(x[ix] - x_value):
-                ix = ix - 1
-            return x[ix], y[ix]
-
         if self.ignore(event):
             return
         if event.inaxes is None:
             return
         if not self.canvas.widgetlock.available(self):
             return
+
+        # Only the last event of a burst matters, the others would be overwritten before being displayed
+        self._pending_event = event
+        wait = self._last_move + self.min_interval - time.perf_counter()
+        if wait <= 0:
+            self._process_pending()
+        elif not self._timer_started:
+            # The timer is reused, backends may not support releasing it from its own callback
+            if self._timer is None:
+                self._timer = self.canvas.new_timer()
+                self._timer.single_shot = True
+                self._timer.add_callback(self._process_pending)
+            self._timer.interval = max(1, int(wait * 1000))
+            self._timer.start()
+            self._timer_started = True
+
+    def _process_pending(self):
+        self._timer_started = False
+        event, self._pending_event = self._pending_event, None
+        if event is None or event.inaxes is None or not self.canvas.widgetlock.available(self):
+            return
+        self._last_move = time.perf_counter()
+        self.move(event)
+
+    def move(self, event):
+        """Moves the cursor to the position of `event` right away."""
         self.need_clear = True
         if self.vert_on:
             for line in self.v_lines:
@@ -274,7 +307,7 @@ class IplotMultiCursor(Widget):
                         ax = annotation.axes
 
                         xvalue = event.xdata
-                        values = get_values_from_line(line, xvalue)
+                        values = self._values_at(annotation, xvalue)
                         logger.debug(F"Found {values} for xvalue: {xvalue}")
                         dx = abs(xvalue - values[0])
                         x_min, x_max = ax.get_xbound()
@@ -289,35 +322,117 @@ class IplotMultiCursor(Widget):
                     annotation.set_visible(False)
         self._update()
 
-    def _update(self):
-        if self.use_blit:
-            if self.background is not None:
-                self.canvas.restore_region(self.background)
-
-            if self.vert_on:
-                for ax, line in zip(self.axes, self.v_lines):
-                    ax.draw_artist(line)
-
-            if self.horiz_on:
-                for ax, line in zip(self.axes, self.h_lines):
-                    ax.draw_artist(line)
-
-            if self.x_label:
-                for ax, arrow in zip(self.axes, self.x_arrows):
-                    ax.draw_artist(arrow)
-
-            if self.y_label:
-                for ax, arrow in zip(self.axes, self.y_arrows):
-                    ax.draw_artist(arrow)
-
-            if self.value_label:
-                for annotation in self.value_annotations:
-                    annotation.axes.draw_artist(annotation)
-            self.canvas.blit()
+    def _values_at(self, annotation: Annotation, x_value):
+        """
+        Returns the sample of the line of `annotation` nearest to `x_value` along x. Envelopes give the middle of
+        their lower and upper line.
+        """
+        lines = annotation.line if len(annotation.line) == 1 else annotation.line[:2]
+        data = tuple(arr for line in lines for arr in get_line_data(line))
+        lookup = self._lookups.get(annotation)
+        if lookup is None or len(lookup[0]) != len(data) or any(a is not b for a, b in zip(lookup[0], data)):
+            # The lookup arrays only change with the data of the lines
+            x = np.asarray(data[0])
+            order = None if line_data_sorted(lines[0]) else np.argsort(x, kind='stable')
+            lookup = (data, x if order is None else x[order], [np.asarray(y) for y in data[1::2]], order)
+            self._lookups[annotation] = lookup
+        _, x, ys, order = lookup
+
+        ix = np.searchsorted(x, x_value)
+        if ix == len(x):
+            ix = len(x) - 1
+
+        # Either return values at index or values at index-1
+        if ix > 0 and abs(x[ix - 1] - x_value) < abs(x[ix] - x_value):
+            ix = ix - 1
+        iy = ix if order is None else order[ix]
+        y = ys[0][iy] if len(ys) == 1 else (ys[0][iy] + ys[1][iy]) / 2
+        return x[ix], y
+
+    def _artists(self) -> list:
+        return self.v_lines + self.h_lines + self.x_arrows + self.y_arrows + self.value_annotations
+
+    @staticmethod
+    def _artist_state(artist):
+        if not artist.get_visible():
+            return None
+        if isinstance(artist, Line2D):
+            return tuple(np.ravel(artist.get_xdata())), tuple(np.ravel(artist.get_ydata()))
+        return artist.get_position(), artist.get_text()
+
+    def _artist_extent(self, artist, renderer) -> tuple:
+        """
+        Returns the display region (x0, y0, x1, y1) covered by `artist` when it was last drawn, rounded out to whole
+        pixels. The box drawn around annotations is placed while drawing, it gives their extent without a new text
+        layout.
+        """
+        patch = artist.get_bbox_patch() if isinstance(artist, Annotation) else None
+        if patch is not None:
+            # The corners of the box are enough, its rounding stays within the pad
+            x, y, w, h = patch.get_x(), patch.get_y(), patch.get_width(), patch.get_height()
+            corners = patch.get_transform().transform([(x, y), (x + w, y), (x, y + h), (x + w, y + h)])
+            (x0, y0), (x1, y1) = corners.min(axis=0), corners.max(axis=0)
         else:
+            x0, y0, x1, y1 = artist.get_window_extent(renderer).extents
+        pad = 2 + (artist.get_linewidth() if isinstance(artist, Line2D) else 1) * self.canvas.figure.dpi / 72
+        return np.floor(x0 - pad), np.floor(y0 - pad), np.ceil(x1 + pad), np.ceil(y1 + pad)
+
+    def _update(self):
+        if not self.use_blit:
             self.canvas.draw_idle()
+            return
+        if self.background is None:
+            for artist in self._artists():
+                artist.axes.draw_artist(artist)
+            self.canvas.blit()
+            return
+
+        # Only the regions of the artists that changed since they were last drawn are restored and blitted
+        artists = self._artists()
+        redraw = {artist for artist in artists if self._artist_state(artist) != self._drawn_state.get(artist)}
+        if not redraw:
+            return
+        regions = [self._drawn_extent[artist] for artist in redraw if self._drawn_extent.get(artist) is not None]
+
+        # Unchanged artists overlapping those regions are erased with them and must be drawn again
+        others = [artist for artist in artists if artist not in redraw and self._drawn_extent.get(artist) is not None]
+        while regions and others:
+            r = np.array(regions)
+            erased = [artist for artist in others if np.any(
+                (r[:, 0] < self._drawn_extent[artist][2]) & (self._drawn_extent[artist][0] < r[:, 2]) &
+                (r[:, 1] < self._drawn_extent[artist][3]) & (self._drawn_extent[artist][1] < r[:, 3]))]
+            if not erased:
+                break
+            redraw.update(erased)
+            regions.extend(self._drawn_extent[artist] for artist in erased)
+            others = [artist for artist in others if artist not in redraw]
+
+        # The buffer is addressed from the top-left corner while display coordinates start at the bottom-left
+        height = self.canvas.figure.bbox.height
+        for x0, y0, x1, y1 in regions:
+            self.canvas.restore_region(self.background, bbox=(x0, height - y1, x1, height - y0), xy=(0, 0))
+
+        renderer = self.canvas.get_renderer()
+        for artist in artists:
+            if artist not in redraw:
+                continue
+            self._drawn_state[artist] = self._artist_state(artist)
+            self._drawn_extent[artist] = None
+            if artist.get_visible():
+                artist.axes.draw_artist(artist)
+                self._drawn_extent[artist] = self._artist_extent(artist, renderer)
+                regions.append(self._drawn_extent[artist])
+
+        if regions:
+            r = np.array(regions)
+            region = Bbox.intersection(Bbox([r[:, :2].min(axis=0), r[:, 2:].max(axis=0)]), self.canvas.figure.bbox)
+            if region is not None:
+                self.canvas.blit(region)
 
     def disconnect(self):
         """Disconnect events."""
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer_started = False
         self.canvas.mpl_disconnect(self._cid_motion)
         self.canvas.mpl_disconnect(self._cid_draw)
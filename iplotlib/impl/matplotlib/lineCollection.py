@@ -0,0 +1,227 @@
+# Copyright (c) 2020-2025 ITER Organization,
+#               CS 90046
+#               13067 St Paul Lez Durance Cedex
+#               France
+# Author IO
+#
+# This file is part of iplotlib module.
+# iplotlib python module is free software: you can redistribute it and/or modify it under
+# the terms of the MIT license.
+#
+# This file is part of ITER CODAC software.
+# For the terms and conditions of redistribution or use of this software
+# refer to the file LICENSE located in the top level directory
+# of the distribution package
+#
+
+
+
+"""
+Lines of signals drawn together as a single matplotlib artist.
+"""
+
+from typing import List
+
+import numpy as np
+from matplotlib import rcParams
+from matplotlib.axes import Axes as MPLAxes
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
+
+from iplotlib.core.windowing import is_sorted
+from iplotlib.impl.matplotlib.lineDecimation import decimation_indices
+
+
+class CollectionLine:
+    """
+    One line of a :class:`SignalLineCollection`.
+
+    It offers the part of the `Line2D` interface used for the lines of signals (data, visibility, color, label),
+    so it can be stored in `signal.lines` and in the legend map like a `Line2D`. The full data is kept like the data
+    given to :func:`iplotlib.impl.matplotlib.lineDecimation.set_line_data`.
+    """
+
+    def __init__(self, collection: 'SignalLineCollection', x_data, y_data, color=None, linewidth=None,
+                 linestyle=None, label=None):
+        self.collection = collection
+        self.ipl_full_data = (x_data, y_data)
+        self.ipl_sorted = is_sorted(x_data)
+        self._color = color
+        self._linewidth = rcParams['lines.linewidth'] if linewidth is None else linewidth
+        self._linestyle = linestyle or rcParams['lines.linestyle']
+        self._label = label or ''
+        self._visible = True
+
+    @property
+    def axes(self) -> MPLAxes:
+        return self.collection.axes
+
+    def set_data(self, x_data, y_data):
+        self.ipl_full_data = (x_data, y_data)
+        self.ipl_sorted = is_sorted(x_data)
+        self.collection.invalidate()
+
+    def get_xdata(self):
+        return self.ipl_full_data[0]
+
+    def get_ydata(self):
+        return self.ipl_full_data[1]
+
+    def get_visible(self) -> bool:
+        return self._visible
+
+    def set_visible(self, visible: bool):
+        if visible != self._visible:
+            self._visible = visible
+            self.collection.invalidate()
+
+    def get_color(self):
+        return self._color
+
+    def set_color(self, color):
+        self._color = color
+        self.collection.invalidate()
+
+    def get_linewidth(self):
+        return self._linewidth
+
+    def set_linewidth(self, linewidth):
+        self._linewidth = linewidth
+        self.collection.invalidate()
+
+    def get_linestyle(self):
+        return self._linestyle
+
+    def set_linestyle(self, linestyle):
+        self._linestyle = linestyle
+        self.collection.invalidate()
+
+    def get_label(self) -> str:
+        return self._label
+
+    def set_label(self, label):
+        self._label = '' if label is None else str(label)
+
+    @staticmethod
+    def get_marker():
+        return 'None'
+
+    def set(self, color=None, linewidth=None, linestyle=None, label=None, **kwargs):
+        """
+        Apply the style properties a collection can draw per line. Markers and draw styles are not supported
+        and are ignored.
+        """
+        if color is not None:
+            self.set_color(color)
+        if linewidth is not None:
+            self.set_linewidth(linewidth)
+        if linestyle is not None:
+            self.set_linestyle(linestyle)
+        if label is not None:
+            self.set_label(label)
+
+    def remove(self):
+        self.collection.remove_line(self)
+
+    def legend_handle(self) -> Line2D:
+        """
+        Returns a line with the style of this one, to be used as legend handle.
+        """
+        return Line2D([], [], color=self._color, linewidth=self._linewidth, linestyle=self._linestyle,
+                      label=self._label)
+
+
+class SignalLineCollection(LineCollection):
+    """
+    Draws the lines of an axes as the segments of one `LineCollection`.
+
+    The lines are added with :meth:`add_line` and keep their full data. The segments are rebuilt on the next draw
+    after a line changed, or after the width or the x range of the axes changed, reduced to the pixel width of the
+    axes with the `decimation` method like `Line2D` lines. Hidden lines are left out of the segments.
+    """
+
+    def __init__(self, decimation: str = 'm4'):
+        super().__init__([], label='_nolegend_', capstyle=rcParams['lines.solid_capstyle'],
+                         joinstyle=rcParams['lines.solid_joinstyle'])
+        self.decimation = decimation
+        self.lines = []  # type: List[CollectionLine]
+        self._segments_key = None
+
+    def add_line(self, x_data, y_data, color=None, linewidth=None, linestyle=None, label=None) -> CollectionLine:
+        if color is None and self.axes is not None:
+            color = self.axes._get_lines.get_next_color()
+        line = CollectionLine(self, x_data, y_data, color=color, linewidth=linewidth, linestyle=linestyle,
+                              label=label)
+        self.lines.append(line)
+        self.invalidate()
+        return line
+
+    def remove_line(self, line: CollectionLine):
+        if line in self.lines:
+            self.lines.remove(line)
+            self.invalidate()
+
+    def invalidate(self):
+        self._segments_key = None
+        self.stale = True
+
+    def update_segments(self):
+        segments, colors, widths, styles = [], [], [], []
+        for line in self.lines:
+            if not line.get_visible():
+                continue
+            x_data, y_data = line.ipl_full_data
+            indices = decimation_indices(line, x_data, y_data, self.decimation)
+            if indices is not None:
+                x_data, y_data = x_data[indices], y_data[indices]
+            segments.append(np.column_stack((x_data, y_data)))
+            colors.append(line.get_color())
+            widths.append(line.get_linewidth())
+            styles.append(line.get_linestyle())
+        self.set_segments(segments)
+        if segments:
+            self.set_color(colors)
+            self.set_linewidth(widths)
+            self.set_linestyle(styles)
+
+    def draw(self, renderer):
+        if self.axes is not None:
+            key = (self.axes.bbox.width, None if self.axes.get_autoscalex_on() else self.axes.get_xlim())
+            if key != self._segments_key:
+                self.update_segments()
+                self._segments_key = key
+        super().draw(renderer)
+
+
+def get_line_collection(mpl_axes: MPLAxes, decimation: str = 'm4') -> SignalLineCollection:
+    """
+    Returns the line collection of `mpl_axes`, it is created on first use.
+    """
+    collection = getattr(mpl_axes, 'ipl_line_collection', None)
+    if collection is None or collection.axes is not mpl_axes:
+        collection = SignalLineCollection(decimation)
+        mpl_axes.add_collection(collection, autolim=False)
+        mpl_axes.ipl_line_collection = collection
+    return collection
+
+
+def get_collection_lines(mpl_axes: MPLAxes) -> List[CollectionLine]:
+    """
+    Returns the lines drawn by the line collection of `mpl_axes`.
+    """
+    collection = getattr(mpl_axes, 'ipl_line_collection', None)
+    if collection is None or collection.axes is not mpl_axes:
+        return []
+    return list(collection.lines)
+
+
+def update_datalim(mpl_axes: MPLAxes, x_data, y_data):
+    """
+    Extend the data limits of `mpl_axes` with the finite bounds of the given data and autoscale its view.
+    """
+    x_data, y_data = np.asarray(x_data), np.asarray(y_data)
+    x_data = x_data[np.isfinite(x_data)]
+    y_data = y_data[np.isfinite(y_data)]
+    if x_data.size and y_data.size:
+        mpl_axes.update_datalim([[np.min(x_data), np.min(y_data)], [np.max(x_data), np.max(y_data)]])
+        mpl_axes.autoscale_view()
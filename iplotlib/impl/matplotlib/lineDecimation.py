@@ -0,0 +1,136 @@
+# Copyright (c) 2020-2025 ITER Organization,
+#               CS 90046
+#               13067 St Paul Lez Durance Cedex
+#               France
+# Author IO
+#
+# This file is part of iplotlib module.
+# iplotlib python module is free software: you can redistribute it and/or modify it under
+# the terms of the MIT license.
+#
+# This file is part of ITER CODAC software.
+# For the terms and conditions of redistribution or use of this software
+# refer to the file LICENSE located in the top level directory
+# of the distribution package
+#
+
+
+
+"""
+Screen-resolution decimation of matplotlib lines and envelope bands.
+"""
+
+import numpy as np
+from matplotlib import cbook
+from matplotlib.collections import PolyCollection
+from matplotlib.lines import Line2D
+
+from iplotlib.core.decimation import lttb_indices, m4_indices, minmax_indices
+from iplotlib.core.windowing import is_sorted
+
+DECIMATION_METHODS = ['m4', 'minmax', 'lttb']
+
+
+def set_line_data(line: Line2D, x_data, y_data, method: str = 'm4'):
+    """
+    Set the data of `line`, reduced to what its axes can display across their width in pixels.
+
+    'm4' (first, last, min, max per pixel column) and 'minmax' rasterize like the full data, 'lttb' keeps about
+    two samples per pixel column. Lines with markers and lines with few samples are not decimated.
+    The full data remains available with :func:`get_line_data`.
+    """
+    line.ipl_full_data = (x_data, y_data)
+    line.ipl_sorted = is_sorted(x_data)
+    indices = decimation_indices(line, x_data, y_data, method)
+    if indices is None:
+        line.set_data(x_data, y_data)
+    else:
+        line.set_data(x_data[indices], y_data[indices])
+
+
+def get_line_data(line: Line2D):
+    """
+    Returns the x and y data given to :func:`set_line_data`, or the data of the line if it was set otherwise.
+    """
+    data = getattr(line, 'ipl_full_data', None)
+    if data is None:
+        return line.get_xdata(), line.get_ydata()
+    return data
+
+
+def line_data_sorted(line: Line2D) -> bool:
+    """
+    Returns True if the x data of :func:`get_line_data` is sorted. The answer is kept until the data changes.
+    """
+    if getattr(line, 'ipl_full_data', None) is None:
+        return is_sorted(line.get_xdata())
+    return line.ipl_sorted
+
+
+def set_band_data(band: PolyCollection, x_data, y1_data, y2_data, method: str = 'm4', step: str = None):
+    """
+    Set the area between `y1_data` and `y2_data` as the polygon of `band`, a collection made by `fill_between`.
+
+    The samples are reduced to the pixel width of the axes like the lines of :func:`set_line_data`, keeping the
+    extremes of both bounds, and the vertices of the existing collection are replaced in place.
+    `step` is the `fill_between` step ('pre', 'post', 'mid' or None).
+    """
+    band.ipl_full_data = (x_data, y1_data, y2_data)
+    indices = None
+    if is_sorted(x_data):
+        # LTTB selects along a single curve, it follows the middle of the band
+        y_data = (y1_data + y2_data) / 2 if method == 'lttb' else np.column_stack((y1_data, y2_data))
+        indices = axes_decimation_indices(band.axes, x_data, y_data, method)
+    if indices is not None:
+        x_data, y1_data, y2_data = x_data[indices], y1_data[indices], y2_data[indices]
+    band.set_verts([band_vertices(x_data, y1_data, y2_data, step)] if len(x_data) else [])
+
+
+def band_vertices(x_data, y1_data, y2_data, step: str = None) -> np.ndarray:
+    """
+    Returns the vertices of the polygon `fill_between` draws between the two curves: along `y1_data` forward and
+    along `y2_data` backward.
+    """
+    x_data, y1_data, y2_data = np.asarray(x_data), np.asarray(y1_data), np.asarray(y2_data)
+    if step is not None:
+        x_data, y1_data, y2_data = cbook.STEP_LOOKUP_MAP['steps-' + step](x_data, y1_data, y2_data)
+    n = len(x_data)
+    vertices = np.empty((2 * n + 2, 2))
+    vertices[0] = x_data[0], y2_data[0]
+    vertices[1:n + 1, 0] = x_data
+    vertices[1:n + 1, 1] = y1_data
+    vertices[n + 1] = x_data[-1], y2_data[-1]
+    vertices[n + 2:, 0] = x_data[::-1]
+    vertices[n + 2:, 1] = y2_data[::-1]
+    return vertices
+
+
+def decimation_indices(line: Line2D, x_data, y_data, method: str = 'm4'):
+    if line.get_marker() not in (None, '', 'None', 'none', ' ') or not line.ipl_sorted:
+        return None
+    return axes_decimation_indices(line.axes, x_data, y_data, method)
+
+
+def axes_decimation_indices(axes, x_data, y_data, method: str = 'm4'):
+    if method not in DECIMATION_METHODS or axes is None:
+        return None
+    width = int(np.ceil(axes.bbox.width))
+    if width <= 0 or len(x_data) <= 4 * width:
+        return None
+
+    data_min, data_max = np.nanmin(x_data), np.nanmax(x_data)
+    # Size the pixel columns from the data while the view limits follow it. The limits are only read otherwise,
+    # reading them would apply a pending autoscale before the data limits include this line.
+    if axes.get_autoscalex_on():
+        x_min, x_max = data_min, data_max
+    else:
+        x_min, x_max = axes.get_xlim()
+        if not (x_min < data_max and x_max > data_min):
+            x_min, x_max = data_min, data_max
+    if method == 'lttb':
+        return lttb_indices(x_data, y_data, 2 * width)
+    elif method == 'minmax':
+        indices = minmax_indices(x_data, y_data, (x_max - x_min) / width)
+        return np.unique(np.r_[0, indices, len(x_data) - 1])
+    else:
+        return m4_indices(x_data, y_data, x_min, x_max, width)
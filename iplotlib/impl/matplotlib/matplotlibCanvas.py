@@ -18,6 +18,7 @@
 # Changelog:
 #   Jan 2023:   -Added support for legend position and layout [Alberto Luengo]
 
+import contextlib
 from typing import Any, Callable, Collection, List
 import pandas
 import numpy as np
@@ -48,8 +49,16 @@ from iplotlib.core import (Axis,
                            Signal,
                            SignalXY,
                            SignalContour)
+from iplotlib.data_access.rolling_extrema import RollingExtrema
+from iplotlib.impl.matplotlib.contourDecimation import decimate_grid, grid_bounds, grid_strides, remove_contour
 from iplotlib.impl.matplotlib.dateFormatter import NanosecondDateFormatter
 from iplotlib.impl.matplotlib.iplotMultiCursor import IplotMultiCursor
+from iplotlib.core.nearest import nearest_index
+from iplotlib.core.range_query import get_range_index
+from iplotlib.core.windowing import window, window_selector
+from iplotlib.impl.matplotlib.lineCollection import (CollectionLine, get_collection_lines, get_line_collection,
+                                                     update_datalim)
+from iplotlib.impl.matplotlib.lineDecimation import get_line_data, line_data_sorted, set_band_data, set_line_data
 
 logger = setupLogger.get_logger(__name__)
 STEP_MAP = {"linear": "default", "mid": "steps-mid", "post": "steps-post", "pre": "steps-pre",
@@ -62,19 +71,38 @@ class MatplotlibParser(BackendParserBase):
                  tight_layout: bool = True,
                  focus_plot=None,
                  focus_plot_stack_key=None,
-                 impl_flush_method: Callable = None) -> None:
+                 impl_flush_method: Callable = None,
+                 line_decimation: str = 'm4',
+                 line_collections: bool = False,
+                 reconcile: bool = True) -> None:
         """Initialize underlying matplotlib classes.
+
+        `line_decimation` selects how lines are reduced to the pixel width of their axes ('m4', 'minmax', 'lttb'),
+        None draws every sample.
+        With `line_collections`, the lines of signals without markers or steps, including each channel of a
+        multi-channel signal, are drawn as the segments of a single `LineCollection` per axes.
+        With `reconcile`, processing a canvas again keeps the axes of the plots that did not change and only applies
+        their properties, see :meth:`reconcile_ipl_canvas`.
         """
         super().__init__(canvas=canvas, focus_plot=focus_plot, focus_plot_stack_key=focus_plot_stack_key,
                          impl_flush_method=impl_flush_method)
 
         self.map_legend_to_ax = {}
         self.legend_size = 8
+        self.line_decimation = line_decimation
+        self.line_collections = line_collections
+        self.reconcile = reconcile
+        self._rendered_layout = None
         self._cursors = []
 
         register_matplotlib_converters()
         self.figure = Figure()
         self._impl_plot_ranges_hash = dict()
+        self._draw_deferred = False
+        self._deferred_streaming_limits = dict()
+        self._streaming_extrema = dict()  # key is id(signal)
+        self._signal_source_lut = dict()  # key is id(signal), the data its lines were drawn from
+        self._offset_data_cache = dict()  # key is (id(signal), ax_idx)
 
         if tight_layout:
             self.enable_tight_layout()
@@ -82,6 +110,8 @@ class MatplotlibParser(BackendParserBase):
             self.disable_tight_layout()
 
     def export_image(self, filename: str, **kwargs):
+        """Render `canvas` to `filename`. `width` and `height` are in pixels at `dpi`, `format` defaults to the
+        file extension."""
         super().export_image(filename, **kwargs)
         dpi = kwargs.get("dpi") or 300
         width = kwargs.get("width") or 18.5
@@ -89,17 +119,25 @@ class MatplotlibParser(BackendParserBase):
 
         self.figure.set_size_inches(width / dpi, height / dpi)
         self.process_ipl_canvas(kwargs.get('canvas'))
-        self.figure.savefig(filename)
+        self.figure.savefig(filename, dpi=dpi, format=kwargs.get('format'))
 
     def legend_downsampled_signal(self, signal, mpl_axes, plot_lines):
         """
         Add or removes a '*' in the legend label to indicate if the signal is downsampled or not
         """
         if mpl_axes.get_legend():
-            # Filter out '_child' lines from mpl_axes, which are automatically added in envelope plots
-            # These auxiliary lines should not be considered when matching lines to legend entries
-            valid_lines = [line for line in mpl_axes.get_lines() if not line.get_label().startswith("_child")]
-            pos = valid_lines.index(plot_lines[0][0])
+            if get_collection_lines(mpl_axes):
+                # The legend handles of collection lines are proxies, find the entry in the legend map instead
+                legend_lines = mpl_axes.get_legend().get_lines()
+                pos = next((i for i, legend_line in enumerate(legend_lines)
+                            if self.map_legend_to_ax.get(legend_line, [None])[0] is plot_lines[0]), None)
+                if pos is None:
+                    return
+            else:
+                # Filter out '_child' lines from mpl_axes, which are automatically added in envelope plots
+                # These auxiliary lines should not be considered when matching lines to legend entries
+                valid_lines = [line for line in mpl_axes.get_lines() if not line.get_label().startswith("_child")]
+                pos = valid_lines.index(plot_lines[0][0])
 
             legend_text = mpl_axes.get_legend().get_texts()[pos].get_text()
             if legend_text.endswith('*') and not signal.isDownsampled:
@@ -107,6 +145,63 @@ class MatplotlibParser(BackendParserBase):
             elif not legend_text.endswith('*') and signal.isDownsampled:
                 mpl_axes.get_legend().get_texts()[pos].set_text(legend_text + '*')
 
+    def request_draw(self):
+        """
+        Schedule a repaint of the figure. While a batch of signals is processed, the repaint is postponed until
+        the whole batch has been applied.
+        """
+        if not self._draw_deferred:
+            self.figure.canvas.draw_idle()
+
+    def update_streaming_limits(self, mpl_axes: MPLAxes, plot: Plot, cache_item, x_data):
+        """
+        Follow the newest samples of a streamed stack: slide the x range and fit the y range to the visible data.
+        While a batch of signals is processed, this is done once per axes at the end of the batch.
+        """
+        if self._draw_deferred:
+            self._deferred_streaming_limits[id(mpl_axes)] = (mpl_axes, plot, cache_item, x_data)
+            return
+
+        ax_window = mpl_axes.get_xlim()[1] - mpl_axes.get_xlim()[0]
+        y_min, y_max = None, None
+        for signal in plot.signals[cache_item.stack_key]:
+            if signal.lines[0][0].get_visible() and len(signal.x_data) > 0:
+                extrema = self.get_streaming_extrema(signal, ax_window)
+                if extrema is None:
+                    continue
+                y_min = extrema[0] if y_min is None else min(y_min, extrema[0])
+                y_max = extrema[1] if y_max is None else max(y_max, extrema[1])
+        if y_min is not None:
+            diff = (y_max - y_min) / 15
+            mpl_axes.set_ylim(y_min - diff, y_max + diff)
+        if len(x_data):
+            mpl_axes.set_xlim(x_data[-1] - ax_window, x_data[-1])
+
+    def get_streaming_extrema(self, signal: Signal, span):
+        """
+        Returns (min, max) of the y data of a streamed signal over the last `span` of its x data.
+        Only the samples received since the previous call are examined.
+        """
+        x_data = np.asarray(signal.x_data)
+        y_data = np.asarray(signal.y_data)
+        if len(x_data) != len(y_data):
+            return None
+        tracker = self._streaming_extrema.get(id(signal))  # type: RollingExtrema
+        # The window width drifts by rounding errors as the x range slides, only a real change invalidates it.
+        if (tracker is None or tracker.last_x is None or x_data[-1] < tracker.last_x
+                or not np.isclose(tracker.span, span, rtol=1e-6, atol=0)):
+            tracker = self._streaming_extrema[id(signal)] = RollingExtrema(span)
+            start = np.searchsorted(x_data, x_data[-1] - span, side='left')
+        else:
+            start = np.searchsorted(x_data, tracker.last_x, side='right')
+
+        y_data = y_data[start:]
+        if y_data.ndim > 1:
+            tracker.update(x_data[start:], np.min(y_data, axis=1), np.max(y_data, axis=1))
+        else:
+            tracker.update(x_data[start:], y_data)
+        return tracker.extrema()
+
     def do_mpl_line_plot(self, signal: Signal, mpl_axes: MPLAxes, data: List[BufferObject]):
         try:
             cache_item = self._impl_plot_cache_table.get_cache_item(mpl_axes)
@@ -129,11 +224,6 @@ class MatplotlibParser(BackendParserBase):
 
     def do_mpl_line_plot_xy(self, signal: SignalXY, mpl_axes: MPLAxes, plot: PlotXY, cache_item, x_data, y_data):
 
-        def _get_visible_data(xd, yd, lo, hi):
-            x_displayed = xd[((xd > lo) & (xd < hi))]
-            y_displayed = yd[((xd > lo) & (xd < hi))]
-            return x_displayed, y_displayed
-
         def _update_marker_by_point_count(marker_line: Line2D, signal_x_data, signal_style: dict):
             if len(signal_x_data) == 1:
                 marker_line.set_marker('x')
@@ -142,6 +232,13 @@ class MatplotlibParser(BackendParserBase):
                 marker_line.set_marker(signal_style.get('marker') or "")
                 marker_line.set_markersize(signal_style.get('markersize'))
 
+        def _set_line_data(line, signal_x_data, signal_y_data):
+            if isinstance(line, CollectionLine):
+                line.set_data(signal_x_data, signal_y_data)
+            else:
+                _update_marker_by_point_count(line, signal_x_data, style)
+                set_line_data(line, signal_x_data, signal_y_data, self.line_decimation)
+
         plot_lines = self._signal_impl_shape_lut.get(id(signal))  # type: List[List[Line2D]]
         style = self.get_signal_style(signal)
         params = dict(**style)
@@ -158,51 +255,70 @@ class MatplotlibParser(BackendParserBase):
         # Processed signals already use the visible range.
         # Skip this step in case of streaming mode, as x_data and y_data may be empty and lead to errors.
         if not signal.extremities and signal.x_expr == "${self}.time" and not self.canvas.streaming:
-            x_data, y_data = _get_visible_data(x_data, y_data, *mpl_axes.get_xlim())
+            x_lo, x_hi = mpl_axes.get_xlim()
+            x_data, y_data = window(x_data, y_data, lo=x_lo, hi=x_hi)
+
+        use_collection = self.line_collections and self.is_collection_style(style)
+        if isinstance(plot_lines, list) and isinstance(plot_lines[0][0], CollectionLine) != use_collection:
+            # The style moved the signal in or out of the line collection of the axes
+            for line in plot_lines:
+                line[0].remove()
+            plot_lines = None
 
         if isinstance(plot_lines, list):
+            # Style properties may have changed since the lines were created.
+            line_props = {k: v for k, v in params.items() if v is not None}
             if x_data.ndim == 1 and y_data.ndim == 1:
                 line = plot_lines[0][0]
-                line.set_xdata(x_data)
-                line.set_ydata(y_data)
-                _update_marker_by_point_count(line, x_data, style)
+                line.set(**line_props)
+                _set_line_data(line, x_data, y_data)
             elif x_data.ndim == 1 and y_data.ndim == 2:
+                line_props.pop('label', None)
                 for i, line in enumerate(plot_lines):
-                    line[0].set_xdata(x_data)
-                    line[0].set_ydata(y_data[:, i])
-                    _update_marker_by_point_count(line[0], x_data, style)
+                    line[0].set(**line_props)
+                    _set_line_data(line[0], x_data, y_data[:, i])
 
-            # Put this out in a method only for streaming
             if self.canvas.streaming:
-                ax_window = mpl_axes.get_xlim()[1] - mpl_axes.get_xlim()[0]
-                all_y_data = []
-                for signal in plot.signals[cache_item.stack_key]:
-                    if signal.lines[0][0].get_visible() and len(signal.x_data) > 0:
-                        max_x_data = signal.x_data.max()[0]
-                        for x_temp, y_temp in zip(signal.x_data, signal.y_data):
-                            if max_x_data - ax_window <= x_temp <= max_x_data:
-                                all_y_data.append(y_temp)
-                if all_y_data:
-                    diff = (max(all_y_data) - min(all_y_data)) / 15
-                    mpl_axes.set_ylim(min(all_y_data) - diff, max(all_y_data) + diff)
-                mpl_axes.set_xlim(max(x_data) - ax_window, max(x_data))
-            self.figure.canvas.draw_idle()
+                self.update_streaming_limits(mpl_axes, plot, cache_item, x_data)
+            elif any(a is not b for a, b in zip(self._signal_source_lut.get(id(signal), (None, None)),
+                                                (signal.x_data, signal.y_data))):
+                # The lines were drawn from other data, the data limits of the axes no longer hold
+                self.relim(mpl_axes)
+            self.request_draw()
             # Preserve visible status for lines
             for new, old in zip(plot_lines, signal.lines):
                 for n, o in zip(new, old):
                     n.set_visible(o.get_visible())
+        elif use_collection:
+            # All the lines of the axes are segments of one artist, the channels share the x data
+            collection = get_line_collection(mpl_axes, self.line_decimation)
+            line_props = {k: params.get(k) for k in ('color', 'linewidth', 'linestyle', 'label')}
+            if x_data.ndim == 1 and y_data.ndim == 1:
+                plot_lines = [[collection.add_line(x_data, y_data, **line_props)]]
+            elif x_data.ndim == 1 and y_data.ndim == 2:
+                plot_lines = []
+                for i in range(y_data.shape[1]):
+                    line_props.update(label=f"{signal.label}[{i}]")
+                    plot_lines.append([collection.add_line(x_data, y_data[:, i], **line_props)])
+            update_datalim(mpl_axes, x_data, y_data)
         else:
             if x_data.ndim == 1 and y_data.ndim == 1:
-                plot_lines = [draw_fn(x_data, y_data, **params)]
-                _update_marker_by_point_count(plot_lines[0][0], x_data, style)
+                plot_lines = [draw_fn([], [], **params)]
+                _set_line_data(plot_lines[0][0], x_data, y_data)
+                mpl_axes.update_datalim(plot_lines[0][0].get_xydata())
             elif x_data.ndim == 1 and y_data.ndim == 2:
-                lines = draw_fn(x_data, y_data, **params)
+                lines = draw_fn(x_data[:0], y_data[:0], **params)
                 plot_lines = [[line] for line in lines]
                 for i, line in enumerate(plot_lines):
                     line[0].set_label(f"{signal.label}[{i}]")
-                    _update_marker_by_point_count(line[0], x_data, style)
+                    _set_line_data(line[0], x_data, y_data[:, i])
+                    mpl_axes.update_datalim(line[0].get_xydata())
+            # The decimation may have read the limits while the lines were empty, which applied the pending
+            # autoscale to data limits without these lines.
+            mpl_axes.autoscale_view()
 
         signal.lines = plot_lines
+        self._signal_source_lut[id(signal)] = (signal.x_data, signal.y_data)
 
         return plot_lines
 
@@ -227,21 +343,9 @@ class MatplotlibParser(BackendParserBase):
                     line[0].set_xdata(x_data)
                     line[0].set_ydata(ysub_data[:, i])
 
-            # Put this out in a method only for streaming
             if self.canvas.streaming:
-                ax_window = mpl_axes.get_xlim()[1] - mpl_axes.get_xlim()[0]
-                all_y_data = []
-                for signal in plot.signals[cache_item.stack_key]:
-                    if signal.lines[0][0].get_visible() and len(signal.x_data) > 0:
-                        max_x_data = signal.x_data.max()[0]
-                        for x_temp, y_temp in zip(signal.x_data, signal.y_data):
-                            if max_x_data - ax_window <= x_temp <= max_x_data:
-                                all_y_data.append(y_temp)
-                if all_y_data:
-                    diff = (max(all_y_data) - min(all_y_data)) / 15
-                    mpl_axes.set_ylim(min(all_y_data) - diff, max(all_y_data) + diff)
-                mpl_axes.set_xlim(max(x_data) - ax_window, max(x_data))
-            self.figure.canvas.draw_idle()
+                self.update_streaming_limits(mpl_axes, plot, cache_item, x_data)
+            self.request_draw()
         else:
             style = self.get_signal_style(signal)
             params = dict(**style)
@@ -271,42 +375,49 @@ class MatplotlibParser(BackendParserBase):
         contour_levels = self._pm.get_value(signal, 'contour_levels')
         color_map = self._pm.get_value(signal, 'color_map')
 
-        if isinstance(plot_lines, QuadContourSet):
-            for tp in plot_lines.collections:
-                tp.remove()
-            if contour_filled:
-                draw_fn = mpl_axes.contourf
+        if x_data.ndim == y_data.ndim == z_data.ndim == 2:
+            # Contour at most about one grid cell per pixel of the visible part of the grid
+            if isinstance(plot_lines, QuadContourSet) and plot_lines.ipl_contour_key[0] == signal.data_version:
+                bounds = plot_lines.ipl_contour_bounds
             else:
-                draw_fn = mpl_axes.contour
-            if x_data.ndim == y_data.ndim == z_data.ndim == 2:
-                plot_lines = draw_fn(x_data, y_data, z_data, levels=contour_levels, cmap=color_map)
-                if legend_format == 'in_lines':
-                    if not contour_filled:
-                        plt.clabel(plot_lines, inline=1, fontsize=10)
-            if equivalent_units:
-                mpl_axes.set_aspect('equal', adjustable='box')
-            self.figure.canvas.draw_idle()
-        else:
-            if contour_filled:
-                draw_fn = mpl_axes.contourf
+                bounds = grid_bounds(x_data, y_data)
+            strides = grid_strides(mpl_axes, bounds, z_data.shape)
+            contour_key = (signal.data_version, contour_levels, color_map, contour_filled, legend_format, strides)
+            if isinstance(plot_lines, QuadContourSet):
+                # With the same data and settings, the contours follow the view through the axes transforms
+                if plot_lines.ipl_contour_key != contour_key:
+                    remove_contour(plot_lines)
+                    plot_lines = self.draw_mpl_contour(mpl_axes, x_data, y_data, z_data, strides, contour_levels,
+                                                       color_map, contour_filled)
+                    if legend_format == 'in_lines':
+                        if not contour_filled:
+                            mpl_axes.clabel(plot_lines, inline=1, fontsize=10)
+                    self.request_draw()
             else:
-                draw_fn = mpl_axes.contour
-            if x_data.ndim == y_data.ndim == z_data.ndim == 2:
-                plot_lines = draw_fn(x_data, y_data, z_data, levels=contour_levels, cmap=color_map)
+                plot_lines = self.draw_mpl_contour(mpl_axes, x_data, y_data, z_data, strides, contour_levels,
+                                                   color_map, contour_filled)
                 if legend_format == 'color_bar':
                     color_bar = self.figure.colorbar(plot_lines, ax=mpl_axes, location='right')
                     color_bar.set_label(z_data.unit, size=self.legend_size)
                 else:
                     if not contour_filled:
-                        plt.clabel(plot_lines, inline=1, fontsize=10)
+                        mpl_axes.clabel(plot_lines, inline=1, fontsize=10)
                 # 2 Legend in line for multiple signal contour in one plot contour
                 # plt.clabel(plot_lines, inline=True)
                 # self.proxies = [Line2D([], [], color=c) for c in ['viridis']]
-            if equivalent_units:
-                mpl_axes.set_aspect('equal', adjustable='box')
+            plot_lines.ipl_contour_key = contour_key
+            plot_lines.ipl_contour_bounds = bounds
+        if equivalent_units:
+            mpl_axes.set_aspect('equal', adjustable='box')
 
         return plot_lines
 
+    @staticmethod
+    def draw_mpl_contour(mpl_axes: MPLAxes, x_data, y_data, z_data, strides, levels, cmap, filled: bool):
+        draw_fn = mpl_axes.contourf if filled else mpl_axes.contour
+        x_data, y_data, z_data = decimate_grid(strides, x_data, y_data, z_data)
+        return draw_fn(x_data, y_data, z_data, levels=levels, cmap=cmap)
+
     def do_mpl_envelope_plot(self, signal: Signal, mpl_axes: MPLAxes, x_data, y1_data, y2_data):
         shapes = self._signal_impl_shape_lut.get(id(signal))  # type: List[List[Line2D]]
         try:
@@ -324,18 +435,21 @@ class MatplotlibParser(BackendParserBase):
 
         if shapes is not None:
             if x_data.ndim == 1 and y1_data.ndim == 1 and y2_data.ndim == 1:
-                shapes[0][0].set_xdata(x_data)
-                shapes[0][0].set_ydata(y1_data)
-                shapes[0][1].set_xdata(x_data)
-                shapes[0][1].set_ydata(y2_data)
-                shapes[0][2].remove()
-                shapes[0][2] = mpl_axes.fill_between(x_data, y1_data, y2_data,
-                                                     alpha=0.3,
-                                                     color=shapes[0][0].get_color(),
-                                                     step=STEP_MAP[style['drawstyle']])
+                # Style properties may have changed since the lines were created.
+                line_props = {k: v for k, v in style.items() if v is not None}
+                shapes[0][0].set(**line_props)
+                line_props.pop('label', None)
+                line_props.update(color=shapes[0][0].get_color())
+                shapes[0][1].set(**line_props)
+                set_line_data(shapes[0][0], x_data, y1_data, self.line_decimation)
+                set_line_data(shapes[0][1], x_data, y2_data, self.line_decimation)
+                # Reuse the band, only its polygon changes
+                shapes[0][2].set_color(shapes[0][0].get_color())
+                set_band_data(shapes[0][2], x_data, y1_data, y2_data, self.line_decimation,
+                              STEP_MAP[style['drawstyle']])
                 shapes[0][2].set_visible(shapes[0][0].get_visible())
 
-            self.figure.canvas.draw_idle()
+            self.request_draw()
 
             # TODO elif x_data.ndim == 1 and y1_data.ndim == 2 and y2_data.ndim == 2:
         else:
@@ -346,15 +460,20 @@ class MatplotlibParser(BackendParserBase):
             #  draw_fn = mpl_axes.step
 
             if x_data.ndim == 1 and y1_data.ndim == 1 and y2_data.ndim == 1:
-                line_1 = draw_fn(x_data, y1_data, **params)
+                line_1 = draw_fn([], [], **params)
+                set_line_data(line_1[0], x_data, y1_data, self.line_decimation)
                 params2 = params.copy()
                 signal.color = line_1[0].get_color()
                 params2.update(color=signal.color, label='')
-                line_2 = draw_fn(x_data, y2_data, **params2)
-                area = mpl_axes.fill_between(x_data, y1_data, y2_data,
+                line_2 = draw_fn([], [], **params2)
+                set_line_data(line_2[0], x_data, y2_data, self.line_decimation)
+                area = mpl_axes.fill_between(x_data[:0], y1_data[:0], y2_data[:0],
                                              alpha=0.3,
                                              color=params2['color'],
                                              step=STEP_MAP[style['drawstyle']])
+                set_band_data(area, x_data, y1_data, y2_data, self.line_decimation, STEP_MAP[style['drawstyle']])
+                mpl_axes.update_datalim(line_1[0].get_xydata())
+                mpl_axes.update_datalim(line_2[0].get_xydata())
                 lines = [line_1 + line_2 + [area]]
                 for new, old in zip(lines, signal.lines):
                     for n, o in zip(new, old):
@@ -365,6 +484,10 @@ class MatplotlibParser(BackendParserBase):
 
     def clear(self):
         super().clear()
+        self._streaming_extrema.clear()
+        self._signal_source_lut.clear()
+        self._offset_data_cache.clear()
+        self._rendered_layout = None
         for ax in list(self.figure.axes):
             self.figure.delaxes(ax)
 
@@ -386,28 +509,9 @@ class MatplotlibParser(BackendParserBase):
             return
         if isinstance(base_plot, PlotXYWithSlider):
             return []
-        shared = list()
-        base_limits = self.get_plot_limits(base_plot, which='original')
-        base_begin, base_end = base_limits.axes_ranges[0].begin, base_limits.axes_ranges[0].end
-
-        if (base_begin, base_end) != (None, None) or (base_begin, base_end) == (None, None):
-            for axes in self.figure.axes:
-                cache_item = self._impl_plot_cache_table.get_cache_item(axes)
-                if not hasattr(cache_item, 'plot'):
-                    continue
-                plot = cache_item.plot()
-                if not isinstance(plot, Plot):
-                    continue
-                limits = self.get_plot_limits(plot, which='original')
-                begin, end = limits.axes_ranges[0].begin, limits.axes_ranges[0].end
-                # Check if it is date and the max difference is 1 second
-                # Need to differentiate if it is absolute or relative
-                max_diff = self._pm.get_value(self.canvas, 'max_diff')
-                max_diff_ns = max_diff * 1e9 if plot.axes[0].is_date or isinstance(plot, PlotXYWithSlider) else max_diff
-                if ((begin, end) == (base_begin, base_end) or (
-                        abs(begin - base_begin) <= max_diff_ns and abs(end - base_end) <= max_diff_ns)):
-                    shared.append(axes)
-        return shared
+
+        shared = self.get_shared_x_groups().get(id(base_plot), [])
+        return [axes for plot in shared for axes in self._plot_impl_plot_lut.get(id(plot), [])]
 
     def process_ipl_canvas(self, canvas: Canvas):
         """This method analyzes the iplotlib canvas data structure and maps it
@@ -422,7 +526,10 @@ class MatplotlibParser(BackendParserBase):
             self.clear()
             return
 
-        # 1. Clear layout.
+        # 1. Keep what is already rendered for this canvas if the layout allows it, otherwise clear layout.
+        if self.reconcile and self.reconcile_ipl_canvas(canvas):
+            self.process_ipl_canvas_title()
+            return
         self.clear()
 
         # 2. Allocate
@@ -448,15 +555,107 @@ class MatplotlibParser(BackendParserBase):
                         plot.slider = None
                 else:
                     self.process_ipl_plot(plot, i, j)
+        self._rendered_layout = self.get_canvas_layout(canvas)
 
         # 4. Update the title at the top of canvas.
+        self.process_ipl_canvas_title()
+
+    def process_ipl_canvas_title(self):
+        """Update the title at the top of canvas."""
         if self._pm.get_value(self.canvas, 'title') is not None:
             if not self._pm.get_value(self.canvas, 'font_size'):
-                canvas.font_size = None
+                self.canvas.font_size = None
             self.figure.suptitle(self._pm.get_value(self.canvas, 'title'),
                                  size=self._pm.get_value(self.canvas, 'font_size'),
                                  color=self._pm.get_value(self.canvas, 'font_color') or 'black')
 
+    def get_canvas_layout(self, canvas: Canvas):
+        """Describes what the axes and artists created for `canvas` depend on: the grid and, for each position,
+        the plot with its stacks and signals. Properties that can be applied to existing axes are left out."""
+        grid = (id(canvas), canvas.rows, canvas.cols, id(self._focus_plot), self._focus_plot_stack_key,
+                canvas.full_mode_all_stack, canvas.streaming, self._pm.get_value(canvas, 'title') is not None)
+        plots = dict()
+        for i, col in enumerate(canvas.plots):
+            for j, plot in enumerate(col):
+                if not isinstance(plot, Plot):
+                    continue
+                stacks = tuple((key, tuple(id(signal) for signal in plot.signals.get(key) or []))
+                               for key in sorted(plot.signals.keys()))
+                legend_format = self._pm.get_value(plot, 'legend_format') if isinstance(plot, PlotContour) else None
+                plots[(i, j)] = (id(plot), type(plot), plot.row_span, plot.col_span, stacks, legend_format)
+        return grid, plots
+
+    def reconcile_ipl_canvas(self, canvas: Canvas) -> bool:
+        """Bring the rendered figure up to date with `canvas` without rebuilding it.
+
+        The layout of `canvas` is compared with the one rendered last. The axes of the plots that are no longer at
+        the same position are removed, plots that are new at a position are created, and the properties of all
+        other plots are applied to their existing axes and lines, which keep their data.
+        Returns False, without changing anything, if the grid itself changed and the canvas must be rebuilt.
+        """
+        if self._rendered_layout is None or self._focus_plot is not None or self._focus_plot_stack_key is not None:
+            return False
+        grid, plots = self.get_canvas_layout(canvas)
+        rendered_grid, rendered_plots = self._rendered_layout
+        if grid != rendered_grid:
+            return False
+
+        changed = [pos for pos in set(plots) | set(rendered_plots) if plots.get(pos) != rendered_plots.get(pos)]
+        # The slider of a plot has axes of its own, these are only laid out with the whole canvas.
+        for pos in changed:
+            if any(layout is not None and issubclass(layout[1], PlotXYWithSlider)
+                   for layout in (plots.get(pos), rendered_plots.get(pos))):
+                return False
+
+        logger.debug(f"Reconciling canvas, {len(changed)} of {len(plots)} plots changed")
+        for pos in changed:
+            if pos in rendered_plots:
+                plot_id, _, _, _, stacks, _ = rendered_plots[pos]
+                self.remove_ipl_plot(plot_id, [signal_id for _, signal_ids in stacks for signal_id in signal_ids])
+
+        self.canvas = canvas
+        self.canvas.focus_plot = None
+        self.map_legend_to_ax.clear()
+        for i, col in enumerate(canvas.plots):
+            for j, plot in enumerate(col):
+                if (i, j) in changed:
+                    self.process_ipl_plot(plot, i, j)
+                elif isinstance(plot, Plot):
+                    self.update_ipl_plot(plot)
+        self._rendered_layout = (grid, plots)
+        return True
+
+    def remove_ipl_plot(self, plot_id: int, signal_ids: List[int]):
+        """Remove the axes of a rendered plot along with everything the parser keeps for them and for the
+        signals that were drawn in them."""
+        removed_axes = self._plot_impl_plot_lut.pop(plot_id, [])
+        for mpl_axes in removed_axes:
+            self._impl_plot_cache_table.drop(mpl_axes)
+            self.figure.delaxes(mpl_axes)
+        for lut in (self._axis_impl_plot_lut, self._signal_impl_plot_lut):
+            for k in [k for k, mpl_axes in lut.items() if mpl_axes in removed_axes]:
+                del lut[k]
+        for signal_id in signal_ids:
+            self._signal_impl_shape_lut.pop(signal_id, None)
+            self._streaming_extrema.pop(signal_id, None)
+            self._signal_source_lut.pop(signal_id, None)
+        self._offset_data_cache = {k: v for k, v in self._offset_data_cache.items() if k[0] not in signal_ids}
+
+    def update_ipl_plot(self, plot: Plot):
+        """Apply the properties of `plot` to the axes created for it by :meth:`process_ipl_plot`."""
+        mpl_axes = None
+        plot_axes = self._plot_impl_plot_lut.get(id(plot)) or []
+        # As when the axes are created, the limits set along the way are not reported to the limit callbacks,
+        # which would otherwise store limits autoscaled to the previous data in the axes of the plot.
+        with contextlib.ExitStack() as blocked:
+            for axes in plot_axes:
+                blocked.enter_context(axes.callbacks.blocked(signal='xlim_changed'))
+                blocked.enter_context(axes.callbacks.blocked(signal='ylim_changed'))
+            for stack_id, (key, mpl_axes) in enumerate(zip(sorted(plot.signals.keys()), plot_axes)):
+                signals = plot.signals.get(key) or list()
+                self.process_ipl_stack(plot, stack_id, key, signals, mpl_axes, False)
+        self.observe_axis_limits(mpl_axes)
+
     def process_ipl_plot_xy(self):
         pass
 
@@ -589,155 +788,182 @@ class MatplotlibParser(BackendParserBase):
                 mpl_axes = self.figure.add_subplot(subgrid_item[row_id, 0], sharex=mpl_axes_prev)
                 mpl_axes_prev = mpl_axes
                 self._plot_impl_plot_lut[id(plot)].append(mpl_axes)
-                # Keep references to iplotlib instances for ease of access in callbacks.
-                self._impl_plot_cache_table.register(mpl_axes, self.canvas, plot, key, signals)
-                mpl_axes.set_xmargin(0)
-                mpl_axes.set_autoscalex_on(True)
-                mpl_axes.set_autoscaley_on(True)
-
-                # Set the plot title
-                if plot.plot_title is not None and stack_id == 0:
-                    fc = self._pm.get_value(plot, 'font_color')
-                    fs = self._pm.get_value(plot, 'font_size')
-                    if not fs:
-                        fs = None
-                    mpl_axes.set_title(plot.plot_title, color=fc, size=fs)
-
-                # Set the background color
-                mpl_axes.set_facecolor(self._pm.get_value(plot, 'background_color'))
-
-                # If this is a stacked plot the X axis should be visible only at the bottom
-                # plot of the stack except it is focused
-                # Hides an axis in a way that grid remains visible,
-                # By default in matplotlib the grid is treated as part of the axis
-                visible = ((stack_id + 1 == len(plot.signals.values())) or
-                           (is_stack_plot_focused and not self.canvas.full_mode_all_stack))
-                for e in mpl_axes.get_xaxis().get_children():
-                    if isinstance(e, Tick):
-                        e.tick1line.set_visible(visible)
-                        # e.tick2line.set_visible(visible)
-                        e.label1.set_visible(visible)
-                        # e.label2.set_visible(visible)
-                    else:
-                        e.set_visible(visible)
-
-                # Show the grid if enabled
-                show_grid = self._pm.get_value(plot, 'grid')
-                log_scale = self._pm.get_value(plot, 'log_scale')
-
-                if show_grid:
-                    if log_scale:
-                        mpl_axes.grid(show_grid, which='both')
-                    else:
-                        mpl_axes.grid(show_grid, which='major')
-                else:
-                    mpl_axes.grid(show_grid, which='both')
-
-                x_axis = None
-                # Update properties of the plot axes
-                for ax_idx in range(len(plot.axes)):
-                    if isinstance(plot.axes[ax_idx], Collection):
-                        y_axis = plot.axes[ax_idx][stack_id]
-                        self.process_ipl_axis(y_axis, ax_idx, plot, mpl_axes)
-                    else:
-                        x_axis = plot.axes[ax_idx]
-                        self.process_ipl_axis(x_axis, ax_idx, plot, mpl_axes)
-
-                for signal in signals:
-                    # self._signal_impl_plot_lut.update({id(signal): mpl_axes})
-                    self._signal_impl_plot_lut.update({signal.uid: mpl_axes})
-                    self.process_ipl_signal(signal)
-
-                # Set limits for processed signals
-                if isinstance(x_axis, RangeAxis) and x_axis.begin is None and x_axis.end is None:
-                    self.update_range_axis(x_axis, 0, mpl_axes, which='current')
-                    if isinstance(plot, PlotXYWithSlider):
-                        # In the case of PlotXYWithSlider, the 'original' limits must correspond to the dates stored
-                        # in the z_data
-                        limits = plot.signals[1][0].z_data[0], plot.signals[1][0].z_data[-1]
-                        x_axis.set_limits(*limits, 'original')
-                    else:
-                        self.update_range_axis(x_axis, 0, mpl_axes, which='original')
-
-                # In the case of Plots of type PlotXYWithSlider, the limits for the Y axis must be initialized because
-                # for this type of plot no refreshing of the data is carried out and therefore no new data is fetched
-                if isinstance(plot, PlotXYWithSlider):
-                    y_axis = plot.axes[1]
-                    self.update_multi_range_axis(y_axis, 1, mpl_axes)
-
-                # Show the plot legend if enabled
-                show_legend = self._pm.get_value(plot, 'legend')
-                if show_legend and mpl_axes.get_lines():
-                    plot_leg_position = self._pm.get_value(plot, 'legend_position')
-                    canvas_leg_position = self._pm.get_value(self.canvas, 'legend_position')
-                    plot_leg_layout = self._pm.get_value(plot, 'legend_layout')
-                    canvas_leg_layout = self._pm.get_value(self.canvas, 'legend_layout')
-
-                    plot_leg_position = canvas_leg_position if plot_leg_position == 'same as canvas' \
-                        else plot_leg_position
-                    plot_leg_layout = canvas_leg_layout if plot_leg_layout == 'same as canvas' \
-                        else plot_leg_layout
-
-                    legend_props = dict(size=self.legend_size)
-
-                    # Legend creation process:
-                    #   - Vertical legend: it has one column, which will be increased until there is no overlapping of
-                    #   lines up to a maximum of 3 columns, (1, 3).
-                    #   - Horizontal legend: the number of columns corresponds to the number of signals contained in the
-                    #   plot. If there is line overlapping, the number of columns will be reduced, (len(signals), 1).
-                    leg_ver = (1, 3)
-                    leg_hor = (len(signals), 1)
-                    # The case is established as follows
-                    case = leg_ver if plot_leg_layout == 'vertical' else leg_hor
-                    start, stop = case
-                    step = 1 if start < stop else -1
-                    leg = None
-                    for col in range(start, stop + step, step):
-                        leg = mpl_axes.legend(prop=legend_props, loc=plot_leg_position, ncol=col)
-                        if self.figure.get_tight_layout():
-                            leg.set_in_layout(False)
-                        # Check if the legend's edges are outside the axes' bounds in the figure
-                        legend_bbox = leg.get_window_extent()
-                        axes_bbox = mpl_axes.get_window_extent()
-                        legend_bbox = legend_bbox.transformed(self.figure.transFigure.inverted())
-                        axes_bbox = axes_bbox.transformed(self.figure.transFigure.inverted())
-                        legend_outside = (
-                                legend_bbox.xmin < axes_bbox.xmin or
-                                legend_bbox.xmax > axes_bbox.xmax or
-                                legend_bbox.ymin < axes_bbox.ymin or
-                                legend_bbox.ymax > axes_bbox.ymax
-                        )
-                        if not legend_outside:
-                            break
-
-                    # Check the text of the legend lines in case there is a '$' to be escaped
-                    for line in leg.texts:
-                        current_text = line.get_text()
-                        if '$' in current_text:
-                            new_text = current_text.replace("$", r"\$")
-                            line.set_text(new_text)
-
-                    legend_lines = leg.get_lines()
-                    ix_legend = 0
-                    for signal in signals:
-                        for line in self._signal_impl_shape_lut.get(id(signal)):
-                            self.map_legend_to_ax[legend_lines[ix_legend]] = [line, signal]
-                            alpha = 1 if legend_lines[ix_legend].get_visible() else 0.2
-                            legend_lines[ix_legend].set_picker(3)
-                            legend_lines[ix_legend].set_visible(True)
-                            legend_lines[ix_legend].set_alpha(alpha)
-                            # Check if signal is downsampled at the start
-                            if signal.isDownsampled:
-                                legend_label = leg.texts[ix_legend].get_text() + '*'
-                                leg.texts[ix_legend].set_text(legend_label)
-                            ix_legend += 1
-
-        # Observe the axis limit change events
-        if not self.canvas.streaming:
+                self.process_ipl_stack(plot, stack_id, key, signals, mpl_axes, is_stack_plot_focused)
+
+        self.observe_axis_limits(mpl_axes)
+
+    @staticmethod
+    def relim(mpl_axes: MPLAxes):
+        """Compute the data limits of `mpl_axes` again from its artists and autoscale its view.
+        Unlike :meth:`MPLAxes.relim`, the lines of the line collection of the axes are included."""
+        mpl_axes.relim()
+        for line in get_collection_lines(mpl_axes):
+            update_datalim(mpl_axes, line.get_xdata(), line.get_ydata())
+        mpl_axes.autoscale_view()
+
+    def observe_axis_limits(self, mpl_axes: MPLAxes):
+        """Observe the axis limit change events of `mpl_axes` and the axes sharing its x axis."""
+        if mpl_axes is not None and not self.canvas.streaming:
             for axes in mpl_axes.get_shared_x_axes().get_siblings(mpl_axes):
                 axes.callbacks.connect('xlim_changed', self._axis_update_callback)
                 axes.callbacks.connect('ylim_changed', self._axis_update_callback)
 
+    def process_ipl_stack(self, plot: Plot, stack_id: int, key, signals: List[Signal], mpl_axes: MPLAxes,
+                          is_stack_plot_focused: bool):
+        """Apply the properties of a stack of `plot` to its axes and draw its signals.
+        The axes may be new or already configured by a previous call."""
+        # Keep references to iplotlib instances for ease of access in callbacks.
+        self._impl_plot_cache_table.register(mpl_axes, self.canvas, plot, key, signals)
+        mpl_axes.set_xmargin(0)
+        mpl_axes.set_autoscalex_on(True)
+        mpl_axes.set_autoscaley_on(True)
+
+        # Set the plot title
+        if plot.plot_title is not None and stack_id == 0:
+            fc = self._pm.get_value(plot, 'font_color')
+            fs = self._pm.get_value(plot, 'font_size')
+            if not fs:
+                fs = None
+            mpl_axes.set_title(plot.plot_title, color=fc, size=fs)
+
+        # Set the background color
+        mpl_axes.set_facecolor(self._pm.get_value(plot, 'background_color'))
+
+        # If this is a stacked plot the X axis should be visible only at the bottom
+        # plot of the stack except it is focused
+        # Hides an axis in a way that grid remains visible,
+        # By default in matplotlib the grid is treated as part of the axis
+        visible = ((stack_id + 1 == len(plot.signals.values())) or
+                   (is_stack_plot_focused and not self.canvas.full_mode_all_stack))
+        for e in mpl_axes.get_xaxis().get_children():
+            if isinstance(e, Tick):
+                e.tick1line.set_visible(visible)
+                # e.tick2line.set_visible(visible)
+                e.label1.set_visible(visible)
+                # e.label2.set_visible(visible)
+            else:
+                e.set_visible(visible)
+
+        # Show the grid if enabled
+        show_grid = self._pm.get_value(plot, 'grid')
+        log_scale = self._pm.get_value(plot, 'log_scale')
+
+        if show_grid:
+            if log_scale:
+                mpl_axes.grid(show_grid, which='both')
+            else:
+                mpl_axes.grid(show_grid, which='major')
+        else:
+            mpl_axes.grid(show_grid, which='both')
+
+        x_axis = None
+        # Update properties of the plot axes
+        for ax_idx in range(len(plot.axes)):
+            if isinstance(plot.axes[ax_idx], Collection):
+                y_axis = plot.axes[ax_idx][stack_id]
+                self.process_ipl_axis(y_axis, ax_idx, plot, mpl_axes)
+            else:
+                x_axis = plot.axes[ax_idx]
+                self.process_ipl_axis(x_axis, ax_idx, plot, mpl_axes)
+
+        for signal in signals:
+            # self._signal_impl_plot_lut.update({id(signal): mpl_axes})
+            self._signal_impl_plot_lut.update({signal.uid: mpl_axes})
+            self.process_ipl_signal(signal)
+
+        # Set limits for processed signals
+        if isinstance(x_axis, RangeAxis) and x_axis.begin is None and x_axis.end is None:
+            self.update_range_axis(x_axis, 0, mpl_axes, which='current')
+            if isinstance(plot, PlotXYWithSlider):
+                # In the case of PlotXYWithSlider, the 'original' limits must correspond to the dates stored
+                # in the z_data
+                limits = plot.signals[1][0].z_data[0], plot.signals[1][0].z_data[-1]
+                x_axis.set_limits(*limits, 'original')
+            else:
+                self.update_range_axis(x_axis, 0, mpl_axes, which='original')
+
+        # In the case of Plots of type PlotXYWithSlider, the limits for the Y axis must be initialized because
+        # for this type of plot no refreshing of the data is carried out and therefore no new data is fetched
+        if isinstance(plot, PlotXYWithSlider):
+            y_axis = plot.axes[1]
+            self.update_multi_range_axis(y_axis, 1, mpl_axes)
+
+        # Show the plot legend if enabled
+        show_legend = self._pm.get_value(plot, 'legend')
+        if mpl_axes.get_legend() is not None:
+            mpl_axes.get_legend().remove()
+        if show_legend and (mpl_axes.get_lines() or get_collection_lines(mpl_axes)):
+            plot_leg_position = self._pm.get_value(plot, 'legend_position')
+            canvas_leg_position = self._pm.get_value(self.canvas, 'legend_position')
+            plot_leg_layout = self._pm.get_value(plot, 'legend_layout')
+            canvas_leg_layout = self._pm.get_value(self.canvas, 'legend_layout')
+
+            plot_leg_position = canvas_leg_position if plot_leg_position == 'same as canvas' \
+                else plot_leg_position
+            plot_leg_layout = canvas_leg_layout if plot_leg_layout == 'same as canvas' \
+                else plot_leg_layout
+
+            legend_props = dict(size=self.legend_size)
+
+            legend_entries = [(line, signal) for signal in signals
+                              for line in self._signal_impl_shape_lut.get(id(signal)) or []]
+            legend_handles = None
+            if get_collection_lines(mpl_axes):
+                # Collection lines are not artists of the axes, so the handles are given in the order of the signals
+                legend_entries = [(line, signal) for line, signal in legend_entries
+                                  if not line[0].get_label().startswith('_')]
+                legend_handles = [line[0].legend_handle() if isinstance(line[0], CollectionLine) else line[0]
+                                  for line, _ in legend_entries]
+
+            # Legend creation process:
+            #   - Vertical legend: it has one column, which will be increased until there is no overlapping of
+            #   lines up to a maximum of 3 columns, (1, 3).
+            #   - Horizontal legend: the number of columns corresponds to the number of signals contained in the
+            #   plot. If there is line overlapping, the number of columns will be reduced, (len(signals), 1).
+            leg_ver = (1, 3)
+            leg_hor = (len(signals), 1)
+            # The case is established as follows
+            case = leg_ver if plot_leg_layout == 'vertical' else leg_hor
+            start, stop = case
+            step = 1 if start < stop else -1
+            leg = None
+            for col in range(start, stop + step, step):
+                leg = mpl_axes.legend(handles=legend_handles, prop=legend_props, loc=plot_leg_position, ncol=col)
+                if self.figure.get_tight_layout():
+                    leg.set_in_layout(False)
+                # Check if the legend's edges are outside the axes' bounds in the figure
+                legend_bbox = leg.get_window_extent()
+                axes_bbox = mpl_axes.get_window_extent()
+                legend_bbox = legend_bbox.transformed(self.figure.transFigure.inverted())
+                axes_bbox = axes_bbox.transformed(self.figure.transFigure.inverted())
+                legend_outside = (
+                        legend_bbox.xmin < axes_bbox.xmin or
+                        legend_bbox.xmax > axes_bbox.xmax or
+                        legend_bbox.ymin < axes_bbox.ymin or
+                        legend_bbox.ymax > axes_bbox.ymax
+                )
+                if not legend_outside:
+                    break
+
+            # Check the text of the legend lines in case there is a '$' to be escaped
+            for line in leg.texts:
+                current_text = line.get_text()
+                if '$' in current_text:
+                    new_text = current_text.replace("$", r"\$")
+                    line.set_text(new_text)
+
+            legend_lines = leg.get_lines()
+            for ix_legend, (line, signal) in enumerate(legend_entries):
+                self.map_legend_to_ax[legend_lines[ix_legend]] = [line, signal]
+                alpha = 1 if legend_lines[ix_legend].get_visible() else 0.2
+                legend_lines[ix_legend].set_picker(3)
+                legend_lines[ix_legend].set_visible(True)
+                legend_lines[ix_legend].set_alpha(alpha)
+                # Check if signal is downsampled at the start
+                if signal.isDownsampled:
+                    legend_label = leg.texts[ix_legend].get_text() + '*'
+                    leg.texts[ix_legend].set_text(legend_label)
+
     def _update_slider(self, val, plot, slider_values, current_label, formatter):
         for c_row in plot.signals.values():
             for c_signal in c_row:
@@ -846,6 +1072,8 @@ class MatplotlibParser(BackendParserBase):
                     # Format for minor ticks
                     y_minor = LogLocator(base=10, subs=(1.0,))
                     mpl_axis.set_minor_locator(y_minor)
+                elif mpl_axis.axes.get_yscale() != 'linear':
+                    mpl_axis.axes.set_yscale('linear')
 
             fc = self._pm.get_value(axis, 'font_color')
             fs = self._pm.get_value(axis, 'font_size')
@@ -908,7 +1136,7 @@ class MatplotlibParser(BackendParserBase):
         # status: {signal.status_info.result} ")
         signal_data = signal.get_data()
 
-        data = self.transform_data(mpl_axes, signal_data)
+        data = self.transform_data(mpl_axes, signal_data, signal)
 
         if hasattr(signal, 'envelope') and signal.envelope:
             if len(data) != 3:
@@ -927,7 +1155,7 @@ class MatplotlibParser(BackendParserBase):
 
         # Check for annotations if the marker labels are visible
         if isinstance(signal, SignalXY):
-            if mpl_axes.get_lines()[0].get_marker() == 'None':
+            if not mpl_axes.get_lines() or mpl_axes.get_lines()[0].get_marker() == 'None':
                 return
             if signal.markers_list:
                 annotations_names = [child.get_text() for child in mpl_axes.get_children() if
@@ -944,30 +1172,53 @@ class MatplotlibParser(BackendParserBase):
                                               bbox=dict(boxstyle="round,pad=0.3", edgecolor="black",
                                                         facecolor=marker.color))
 
+    @BackendParserBase.run_in_one_thread
+    def process_ipl_signals(self, signals: List[Signal]):
+        """Refresh a batch of signals with a single repaint of the figure.
+
+        Args:
+            signals (List[Signal]): The signals whose data has changed since the previous repaint
+        """
+        self._draw_deferred = True
+        try:
+            for signal in signals:
+                self.process_ipl_signal(signal)
+        finally:
+            self._draw_deferred = False
+        deferred_limits = list(self._deferred_streaming_limits.values())
+        self._deferred_streaming_limits.clear()
+        for mpl_axes, plot, cache_item, x_data in deferred_limits:
+            self.update_streaming_limits(mpl_axes, plot, cache_item, x_data)
+        self.figure.canvas.draw_idle()
+
     def autoscale_y_axis(self, impl_plot, margin=0.1):
         """This function rescales the y-axis based on the data that is visible given the current xlim of the axis.
         ax -- a matplotlib axes object
         margin -- the fraction of the total height of the y-data to pad the upper and lower ylims"""
 
         def get_bottom_top(x_line):
-            xd = x_line.get_xdata()
-            yd = x_line.get_ydata()
             lo, hi = impl_plot.get_xlim()
-            y_displayed = yd[((xd > lo) & (xd < hi))]
-
+            x_data, y_data = get_line_data(x_line)
+            selector = window_selector(x_data, lo=lo, hi=hi, assume_sorted=line_data_sorted(x_line))
+            index = get_range_index(x_line, y_data) if isinstance(selector, slice) else None
+            if index is not None:
+                stats = index.query(selector.start, selector.stop)
+                return stats.min, stats.max
+
+            y_displayed = y_data[selector]
             # Check if the visible Y data contains valid values
             if len(y_displayed) > 0:
                 # Check if there exist NaN values in the y_displayed array
                 if np.isnan(y_displayed).any():
                     y_displayed = y_displayed[~np.isnan(y_displayed)]
-                min_bot = np.min(y_displayed)
-                max_top = np.max(y_displayed)
+                min_bot = np.min(y_displayed) if len(y_displayed) > 0 else np.inf
+                max_top = np.max(y_displayed) if len(y_displayed) > 0 else -np.inf
             else:
                 min_bot = np.inf
                 max_top = -np.inf
             return min_bot, max_top
 
-        lines = impl_plot.get_lines()
+        lines = impl_plot.get_lines() + get_collection_lines(impl_plot)
         lines = [line for line in lines if line.get_label() not in ["CrossX", "CrossY"]]
         bot, top = np.inf, -np.inf
 
@@ -1121,7 +1372,8 @@ class MatplotlibParser(BackendParserBase):
         self._focus_plot_stack_key = stack_key
 
     @BackendParserBase.run_in_one_thread
-    def activate_cursor(self):
+    def activate_cursor(self, refresh_rate: float = 60.):
+        """Creates the crosshair cursors. Mouse motion is handled at most `refresh_rate` times per second."""
 
         if self.canvas.crosshair_per_plot:
             plots = {}
@@ -1154,7 +1406,8 @@ class MatplotlibParser(BackendParserBase):
                                  horiz_on=False or self.canvas.crosshair_horizontal,
                                  vert_on=self.canvas.crosshair_vertical,
                                  use_blit=True,
-                                 cache_table=self._impl_plot_cache_table))
+                                 cache_table=self._impl_plot_cache_table,
+                                 refresh_rate=refresh_rate))
 
     @BackendParserBase.run_in_one_thread
     def deactivate_cursor(self):
@@ -1179,59 +1432,47 @@ class MatplotlibParser(BackendParserBase):
 
         return style
 
+    @staticmethod
+    def is_collection_style(style: dict) -> bool:
+        """Returns True if lines with `style` can be drawn as segments of a line collection."""
+        return style.get('marker') in (None, '', 'None', 'none', ' ') and style.get('drawstyle') in (None, 'default')
+
     def add_marker_scaled(self, mpl_axes: MPLAxes, plot: PlotXY, x_coord, y_coord):
         """
         Function that returns the nearest point of the plot to create the corresponding marker.
-        As the scale of the axes is very different, a normalization of the data is done to adjust the data to a
-        common scale.
+        Distances are measured in pixels of `mpl_axes`, so the very different scales of the axes do not bias the
+        search. Only the samples within the visible x range are considered.
         """
-
-        ranges = []
         marker_signal = None
         nearest_point = None
         minor_dist = float('inf')
 
-        for ax_idx, ax in enumerate(plot.axes):
-            if isinstance(ax, RangeAxis):
-                ranges = ax.get_limits()
-
-        # With the new X axis limits, we obtain the points within that range
-        for stack in plot.signals.values():
-            for signal in stack:
-                idx1 = np.searchsorted(signal.x_data, ranges[0])
-                idx2 = np.searchsorted(signal.x_data, ranges[1])
-
-                x_zoom = signal.data_store[0][idx1:idx2]
-                y_zoom = signal.data_store[1][idx1:idx2]
-
-                # If the number of samples per signal is less than 50 we continue, if not the user shall keep zooming
-                if len(x_zoom) > 50:
-                    return None, len(x_zoom)
-
-                # Get the points (x,y) for each signal
-                points = list(zip(x_zoom, y_zoom))
-
-                # Normalization of the points
-                x_min, x_max = min(x_zoom), max(x_zoom)
-                y_min, y_max = min(y_zoom), max(y_zoom)
-
-                x_range = x_max - x_min if x_max != x_min else 1
-                y_range = y_max - y_min if y_max != y_min else 1
-                scaled_points = [((px - x_min) / x_range, (py - y_min) / y_range) for px, py in points]
-
-                # Normalization of the coordinates where the user clicked
-                x_coord_transform = self.transform_value(mpl_axes, 0, x_coord)
-                scaled_x = (x_coord_transform - x_min) / x_range
-                scaled_y = (y_coord - y_min) / y_range
+        signals = [signal for stack in plot.signals.values() for signal in stack]
+        # Signals of the other stacks are drawn on other axes, they cannot be under the cursor
+        in_axes = [signal for signal in signals if self._signal_impl_plot_lut.get(signal.uid) is mpl_axes]
+        signals = in_axes or signals
+
+        x_lim, y_lim = mpl_axes.get_xlim(), mpl_axes.get_ylim()
+        x_scale = mpl_axes.bbox.width / ((x_lim[1] - x_lim[0]) or 1)
+        y_scale = mpl_axes.bbox.height / ((y_lim[1] - y_lim[0]) or 1)
+        x_begin = self.transform_value(mpl_axes, 0, min(x_lim))
+        x_end = self.transform_value(mpl_axes, 0, max(x_lim))
+        x_coord_transform = self.transform_value(mpl_axes, 0, x_coord)
+
+        for signal in signals:
+            x_data = np.asarray(signal.data_store[0])
+            y_data = np.asarray(signal.data_store[1])
+            if x_data.ndim != 1 or y_data.ndim != 1:
+                continue
 
-                # Get the nearest point using the Euclidian distance
-                distances = [np.sqrt((px - scaled_x) ** 2 + (py - scaled_y) ** 2) for px, py in scaled_points]
-                idx_result = np.argmin(distances)
+            idx1 = int(np.searchsorted(x_data, x_begin))
+            idx2 = int(np.searchsorted(x_data, x_end, side='right'))
+            idx, dist = nearest_index(x_data, y_data, x_coord_transform, y_coord, x_scale, y_scale, idx1, idx2)
 
-                if distances[idx_result] < minor_dist:
-                    minor_dist = distances[idx_result]
-                    nearest_point = points[idx_result]
-                    marker_signal = signal
+            if idx is not None and dist < minor_dist:
+                minor_dist = dist
+                nearest_point = (x_data[idx], y_data[idx])
+                marker_signal = signal
 
         return nearest_point, marker_signal
 
@@ -1311,9 +1552,10 @@ class MatplotlibParser(BackendParserBase):
         float when offset is int)"""
         return self._impl_plot_cache_table.transform_value(impl_plot, ax_idx, value, inverse=inverse)
 
-    def transform_data(self, impl_plot: Any, data):
+    def transform_data(self, impl_plot: Any, data, signal: Signal = None):
         """This function post processes data if it cannot be plotted with matplotlib directly.
-        Currently, it transforms data if it is a large integer which can cause overflow in matplotlib"""
+        Currently, it transforms data if it is a large integer which can cause overflow in matplotlib.
+        When the data belongs to `signal`, the shifted arrays are kept until its data or the offset change."""
         ret = []
         if isinstance(data, Collection):
             for i, d in enumerate(data):
@@ -1325,13 +1567,25 @@ class MatplotlibParser(BackendParserBase):
                 if ci and ci.offsets[i] is not None:
                     logger.debug(f"\tApplying data offsets {ci.offsets[i]} to to plot {id(impl_plot)} ax_idx: {i}")
                     if isinstance(d, Collection):
-                        ret.append(BufferObject([np.int64(e) - ci.offsets[i] for e in d]))
+                        ret.append(self.shift_data(d, ci.offsets[i], None if signal is None else (id(signal), i)))
                     else:
                         ret.append(np.int64(d) - ci.offsets[i])
                 else:
                     ret.append(d)
         return ret
 
+    def shift_data(self, data, offset, cache_key=None) -> BufferObject:
+        """Returns `data` as int64 minus `offset`. With a `cache_key`, the result is reused as long as the same
+        data array and offset are given for that key."""
+        cached = self._offset_data_cache.get(cache_key) if cache_key is not None else None
+        if cached is not None and cached[0] is data and cached[1] == offset:
+            return cached[2]
+
+        shifted = BufferObject(np.asarray(data, dtype=np.int64) - np.int64(offset))
+        if cache_key is not None:
+            self._offset_data_cache[cache_key] = (data, offset, shifted)
+        return shifted
+
 
 def get_data_range(data, axis_idx):
     """Returns first and last value from data[axis_idx] or None"""
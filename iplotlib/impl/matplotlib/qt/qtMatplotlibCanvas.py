@@ -29,7 +29,7 @@
 #   May 2022:   -Port to PySide6 and use new backend_qtagg from matplotlib[Leon Kos]
 from collections import defaultdict
 
-from PySide6.QtCore import QMargins, Qt, Slot, Signal
+from PySide6.QtCore import QMargins, Qt, QTimer, Slot, Signal
 from PySide6.QtGui import QKeyEvent
 from PySide6.QtWidgets import QMessageBox, QSizePolicy, QVBoxLayout, QMenu
 
@@ -42,6 +42,7 @@ from matplotlib.backends.backend_qtagg import NavigationToolbar2QT as Navigation
 from iplotlib.core import PlotContour, SignalXY, PlotXY, PlotXYWithSlider
 from iplotlib.core.canvas import Canvas
 from iplotlib.core.distance import DistanceCalculator
+from iplotlib.impl.matplotlib.axesBlitter import AxesBlitter
 from iplotlib.impl.matplotlib.matplotlibCanvas import MatplotlibParser
 from iplotlib.qt.gui.IplotQtStatistics import IplotQtStatistics
 from iplotlib.qt.gui.iplotQtCanvas import IplotQtCanvas
@@ -51,6 +52,43 @@ import iplotLogging.setupLogger as Sl
 logger = Sl.get_logger(__name__)
 
 
+class BlitFigureCanvas(FigureCanvas):
+    """A matplotlib Qt canvas that repaints only the axes that changed when possible"""
+
+    def __init__(self, figure=None):
+        super().__init__(figure)
+        self.blitter = AxesBlitter(self)
+        self._redraw_pending = False
+
+    def draw(self):
+        """Full draw of the figure"""
+        self._redraw_pending = False
+        super().draw()
+
+    def draw_idle(self):
+        """Queue a redraw that repaints the changed axes, or the whole figure if required"""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            QTimer.singleShot(0, self._redraw_idle)
+
+    def _redraw_idle(self):
+        if not self._redraw_pending:
+            return
+        self._redraw_pending = False
+        try:
+            if self.height() <= 0 or self.width() <= 0:
+                return
+            self.redraw()
+        except Exception as e:
+            logger.error(f"Redraw failed: {e}")
+
+    def redraw(self):
+        """Repaint the changed axes now, falls back to a full draw on resize or layout change"""
+        self._redraw_pending = False
+        if not self.blitter.blit():
+            self.draw()
+
+
 class QtMatplotlibCanvas(IplotQtCanvas):
     """Qt widget that internally uses a matplotlib canvas backend"""
 
@@ -72,7 +110,7 @@ class QtMatplotlibCanvas(IplotQtCanvas):
 
         self._mpl_size_pol = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self._parser = MatplotlibParser(tight_layout=tight_layout, impl_flush_method=self.draw_in_main_thread, **kwargs)
-        self._mpl_renderer = FigureCanvas(self._parser.figure)
+        self._mpl_renderer = BlitFigureCanvas(self._parser.figure)
         self._mpl_renderer.setParent(self)
         self._mpl_renderer.setSizePolicy(self._mpl_size_pol)
         self._mpl_toolbar = NavigationToolbar(self._mpl_renderer, self)
@@ -105,6 +143,8 @@ class QtMatplotlibCanvas(IplotQtCanvas):
 
         self._parser.deactivate_cursor()
         self._parser.process_ipl_canvas(canvas)
+        # Properties may have changed the size of labels, lay the figure out again.
+        self._mpl_renderer.blitter.invalidate()
 
         if canvas:
             self.set_mouse_mode(self._mmode or canvas.mouse_mode)
@@ -305,7 +345,7 @@ class QtMatplotlibCanvas(IplotQtCanvas):
                     self.push_view_lim_cmd()
 
                 # Redraw canvas to reflect changes
-                self._parser.figure.canvas.draw()
+                self._mpl_renderer.redraw()
 
     def autoscale_all_y(self):
         """
@@ -335,7 +375,7 @@ class QtMatplotlibCanvas(IplotQtCanvas):
             self.push_view_lim_cmd()
 
         # Redraw canvas to reflect changes
-        self._parser.figure.canvas.draw()
+        self._mpl_renderer.redraw()
 
     def set_mouse_mode(self, mode: str):
         super().set_mouse_mode(mode)
@@ -352,7 +392,7 @@ class QtMatplotlibCanvas(IplotQtCanvas):
             self._mpl_toolbar.canvas.widgetlock.release(self._mpl_toolbar)
         elif mode == Canvas.MOUSE_MODE_CROSSHAIR:
             self._mpl_toolbar.canvas.widgetlock.release(self._mpl_toolbar)
-            self._parser.activate_cursor()
+            self._parser.activate_cursor(refresh_rate=self.screen().refreshRate() or 60.)
         elif mode == Canvas.MOUSE_MODE_PAN:
             self._mpl_toolbar.pan()
         elif mode == Canvas.MOUSE_MODE_ZOOM:
@@ -392,7 +432,7 @@ class QtMatplotlibCanvas(IplotQtCanvas):
 
     @Slot()
     def render(self):
-        self._mpl_renderer.draw()
+        self._mpl_renderer.redraw()
         self._parser.unstale_cache_items()
 
     # custom event handlers
@@ -480,7 +520,7 @@ class QtMatplotlibCanvas(IplotQtCanvas):
                 y_value = event.ydata
 
                 # Markers can only be created if the property 'marker' is not None
-                if mpl_axes.get_lines()[0].get_marker() != 'None':
+                if mpl_axes.get_lines() and mpl_axes.get_lines()[0].get_marker() != 'None':
                     # Check if the marker coordinates are correct and if the marker has not already been created
                     new_marker, marker_signal = self._parser.add_marker_scaled(mpl_axes, plot, x_value, y_value)
                     if new_marker is not None:
@@ -496,9 +536,7 @@ class QtMatplotlibCanvas(IplotQtCanvas):
                         else:
                             logger.warning(f"The marker {new_marker} is already created")
                     else:
-                        logger.warning(
-                            f"Cannot add marker {new_marker}: found {marker_signal} samples, but the maximum allowed"
-                            f" is 50")
+                        logger.warning("Cannot add marker: no sample of the plot is visible")
                 else:
                     logger.warning("Markers must be enabled in the plot to create signal markers")
         else:
@@ -0,0 +1,88 @@
+# Copyright (c) 2020-2025 ITER Organization,
+#               CS 90046
+#               13067 St Paul Lez Durance Cedex
+#               France
+# Author IO
+#
+# This file is part of iplotlib module.
+# iplotlib python module is free software: you can redistribute it and/or modify it under
+# the terms of the MIT license.
+#
+# This file is part of ITER CODAC software.
+# For the terms and conditions of redistribution or use of this software
+# refer to the file LICENSE located in the top level directory
+# of the distribution package
+#
+
+
+import unittest
+
+import matplotlib
+import numpy as np
+
+matplotlib.use("Agg")
+
+from iplotlib.core import Canvas, PlotXY, SignalXY
+from iplotlib.impl.matplotlib.matplotlibCanvas import MatplotlibParser
+
+
+class MatplotlibAutoscaleTesting(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.t = np.arange(100000, dtype=np.float64)
+
+    def make_canvas(self, extremities: bool):
+        signal = SignalXY(label='s', name='s', uid=f's{extremities}', data_access_enabled=False,
+                          processing_enabled=False, extremities=extremities)
+        signal.inject_external(append=False, d0=self.t, d1=5 + np.sin(self.t / 1000), d2=[], d3=[], alias_map={})
+        plot = PlotXY()
+        plot.axes[0].begin, plot.axes[0].end = 1000, 90000
+        plot.add_signal(signal)
+        canvas = Canvas(rows=1, cols=1)
+        canvas.add_plot(plot)
+        return canvas, signal
+
+    def test_01_y_autoscale_with_fixed_x_range(self):
+        for extremities in (True, False):
+            canvas, _ = self.make_canvas(extremities)
+            parser = MatplotlibParser()
+            parser.process_ipl_canvas(canvas)
+            parser.figure.canvas.draw()
+            mpl_axes = parser.figure.axes[0]
+
+            xmin, xmax = mpl_axes.get_xlim()
+            self.assertAlmostEqual(xmin, 1000)
+            self.assertAlmostEqual(xmax, 90000)
+            ymin, ymax = mpl_axes.get_ylim()
+            self.assertLess(ymin, 4.)
+            self.assertGreater(ymin, 3.8)
+            self.assertGreater(ymax, 6.)
+            self.assertLess(ymax, 6.2)
+
+    def test_02_limits_after_data_change(self):
+        for extremities in (True, False):
+            canvas, signal = self.make_canvas(extremities)
+            parser = MatplotlibParser()
+            parser.process_ipl_canvas(canvas)
+            parser.figure.canvas.draw()
+
+            signal.inject_external(append=False, d0=self.t, d1=10 + np.sin(self.t / 1000), d2=[], d3=[],
+                                   alias_map={})
+            parser.process_ipl_canvas(canvas)
+            parser.figure.canvas.draw()
+            mpl_axes = parser.figure.axes[0]
+
+            x_axis = canvas.plots[0][0].axes[0]
+            self.assertEqual((x_axis.begin, x_axis.end), (1000, 90000))
+            xmin, xmax = mpl_axes.get_xlim()
+            self.assertAlmostEqual(xmin, 1000)
+            self.assertAlmostEqual(xmax, 90000)
+            ymin, ymax = mpl_axes.get_ylim()
+            self.assertLess(ymin, 9.)
+            self.assertGreater(ymin, 8.8)
+            self.assertGreater(ymax, 11.)
+            self.assertLess(ymax, 11.2)
+
+
+if __name__ == "__main__":
+    unittest.main()
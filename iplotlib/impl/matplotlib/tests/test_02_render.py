@@ -0,0 +1,68 @@
+# Copyright (c) 2020-2025 ITER Organization,
+#               CS 90046
+#               13067 St Paul Lez Durance Cedex
+#               France
+# Author IO
+#
+# This file is part of iplotlib module.
+# iplotlib python module is free software: you can redistribute it and/or modify it under
+# the terms of the MIT license.
+#
+# This file is part of ITER CODAC software.
+# For the terms and conditions of redistribution or use of this software
+# refer to the file LICENSE located in the top level directory
+# of the distribution package
+#
+
+
+
+import os
+import tempfile
+import unittest
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+from matplotlib.image import imread
+
+from iplotlib.core import Canvas, PlotXY, SignalXY
+from iplotlib.impl.matplotlib.matplotlibCanvas import MatplotlibParser
+from iplotlib.render import main
+
+
+class RenderTesting(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        signal = SignalXY(label='s', name='s', uid='s', data_access_enabled=False)
+        plot = PlotXY()
+        plot.add_signal(signal)
+        canvas = Canvas(rows=1, cols=1)
+        canvas.add_plot(plot)
+        self.canvas = canvas
+        self.source = os.path.join(self.directory.name, 'canvas.json')
+        with open(self.source, 'w', encoding='utf-8') as fp:
+            fp.write(canvas.to_json())
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+        super().tearDown()
+
+    def test_01_render_canvas(self):
+        output_dir = os.path.join(self.directory.name, 'out')
+        self.assertEqual(main([self.source, '-o', output_dir, '-jobs', '2']), 0)
+        self.assertTrue(os.path.isfile(os.path.join(output_dir, 'canvas.png')))
+
+    def test_02_export_image_size(self):
+        # width and height are pixel sizes at the requested dpi
+        filename = os.path.join(self.directory.name, 'canvas.png')
+        MatplotlibParser().export_image(filename, canvas=self.canvas, width=800, height=400, dpi=100)
+        self.assertEqual(imread(filename).shape[:2], (400, 800))
+
+        MatplotlibParser().export_image(filename, canvas=self.canvas, width=600, height=300, dpi=50)
+        self.assertEqual(imread(filename).shape[:2], (300, 600))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+# Copyright (c) 2020-2025 ITER Organization,
+#               CS 90046
+#               13067 St Paul Lez Durance Cedex
+#               France
+# Author IO
+#
+# This file is part of iplotlib module.
+# iplotlib python module is free software: you can redistribute it and/or modify it under
+# the terms of the MIT license.
+#
+# This file is part of ITER CODAC software.
+# For the terms and conditions of redistribution or use of this software
+# refer to the file LICENSE located in the top level directory
+# of the distribution package
+#
+
+import unittest
+from unittest import mock
+
+import matplotlib
+import numpy as np
+
+matplotlib.use("Agg")
+
+from iplotlib.core import Canvas, PlotContour, SignalContour
+from iplotlib.impl.matplotlib import matplotlibCanvas
+from iplotlib.impl.matplotlib.matplotlibCanvas import MatplotlibParser
+
+
+class ContourCacheTesting(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.x, self.y = np.meshgrid(np.linspace(0, 1, 50), np.linspace(0, 2, 40))
+        self.z = self.x * self.y
+        self.signal = SignalContour(label='c', name='c', uid='c', data_access_enabled=False,
+                                    processing_enabled=False)
+        self.signal.set_data([self.x, self.y, self.z])
+        self.plot = PlotContour()
+        self.plot.add_signal(self.signal)
+        canvas = Canvas(rows=1, cols=1)
+        canvas.add_plot(self.plot)
+        self.parser = MatplotlibParser()
+        self.parser.process_ipl_canvas(canvas)
+        self.mpl_axes = self.parser.figure.axes[0]
+
+    def refresh(self):
+        return self.parser.do_mpl_line_plot_contour(self.signal, self.mpl_axes, self.plot, self.signal.x_data,
+                                                    self.signal.y_data, self.signal.z_data)
+
+    def test_01_unchanged_data(self):
+        contour = self.parser._signal_impl_shape_lut[id(self.signal)]
+        # The cached contour and the grid bounds stored with it are reused
+        with mock.patch.object(matplotlibCanvas, 'grid_bounds', wraps=matplotlibCanvas.grid_bounds) as bounds:
+            self.assertIs(self.refresh(), contour)
+            bounds.assert_not_called()
+        self.assertEqual(contour.ipl_contour_bounds, ((0., 1.), (0., 2.)))
+
+    def test_02_buffer_reused_in_place(self):
+        contour = self.parser._signal_impl_shape_lut[id(self.signal)]
+        # The same memory with new values is new data
+        self.z *= -1
+        self.signal.set_data([self.x, self.y, self.z])
+        self.assertTrue(np.shares_memory(self.signal.z_data, self.z))
+        new_contour = self.refresh()
+        self.assertIsNot(new_contour, contour)
+        self.assertLess(new_contour.levels[0], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
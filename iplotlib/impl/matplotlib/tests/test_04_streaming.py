@@ -0,0 +1,86 @@
+# Copyright (c) 2020-2025 ITER Organization,
+#               CS 90046
+#               13067 St Paul Lez Durance Cedex
+#               France
+# Author IO
+#
+# This file is part of iplotlib module.
+# iplotlib python module is free software: you can redistribute it and/or modify it under
+# the terms of the MIT license.
+#
+# This file is part of ITER CODAC software.
+# For the terms and conditions of redistribution or use of this software
+# refer to the file LICENSE located in the top level directory
+# of the distribution package
+#
+
+import os
+import time
+import unittest
+from unittest import mock
+
+import numpy as np
+from PySide6.QtWidgets import QApplication
+
+from iplotlib.core import Canvas, PlotXY, SignalXY
+from iplotlib.data_access import CanvasStreamer, RecordedData, RedrawScheduler
+from iplotlib.impl.matplotlib.qt.qtMatplotlibCanvas import QtMatplotlibCanvas
+
+
+class QueuedSource:
+    def __init__(self, batches):
+        self.batches = list(batches)
+
+    def start_subscription(self, ds, params=None):
+        pass
+
+    def stop_subscription(self, ds):
+        pass
+
+    def get_next_data(self, ds, varname):
+        return self.batches.pop(0) if self.batches else None
+
+
+@unittest.skipIf(os.getenv("DISPLAY") is None and os.getenv("QT_QPA_PLATFORM") is None, "No display")
+class StreamingTesting(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.app = QApplication.instance() or QApplication([])
+        self.signal = SignalXY(label='a', name='a', uid='a', data_source='ds', data_access_enabled=False)
+        plot = PlotXY()
+        plot.add_signal(self.signal)
+        self.canvas = Canvas(rows=1, cols=1, streaming=True)
+        self.canvas.add_plot(plot)
+        self.qt_canvas = QtMatplotlibCanvas()
+        self.qt_canvas.set_canvas(self.canvas)
+
+    def tearDown(self) -> None:
+        self.qt_canvas.stop_streaming()
+        super().tearDown()
+
+    def test_01_frames(self):
+        source = QueuedSource([RecordedData(np.arange(0., 5.), np.ones(5)),
+                               RecordedData(np.arange(5., 10.), np.zeros(5))])
+        streamer = CanvasStreamer(source)
+        parser = self.qt_canvas._parser
+        with mock.patch.object(RedrawScheduler, 'mark_dirty', autospec=True,
+                               side_effect=RedrawScheduler.mark_dirty) as mark_dirty, \
+                mock.patch.object(parser, 'process_ipl_signals', wraps=parser.process_ipl_signals) as frames:
+            self.qt_canvas.start_streaming(streamer)
+            deadline = time.monotonic() + 5
+            while time.monotonic() < deadline and len(self.signal.x_data) < 10:
+                self.app.processEvents()
+                time.sleep(0.01)
+            while time.monotonic() < deadline and not frames.called:
+                self.app.processEvents()
+                time.sleep(0.01)
+
+        self.assertIsInstance(streamer._scheduler, RedrawScheduler)
+        mark_dirty.assert_called_with(streamer._scheduler, self.signal)
+        # The updated signals reach the parser as the batch of a frame
+        frames.assert_called_with([self.signal])
+        np.testing.assert_array_equal(self.signal.x_data, np.arange(0., 10.))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -22,9 +22,11 @@
 #               -Port to PySide2 [Jaswant Sai Panchumarti]
 
 
+import time
+
 from PySide6.QtWidgets import QMessageBox, QSizePolicy, QVBoxLayout, QWidget
 from PySide6.QtGui import QResizeEvent, QShowEvent
-from PySide6.QtCore import Signal
+from PySide6.QtCore import QTimer, Signal
 
 from iplotlib.core.canvas import Canvas
 from iplotlib.core.distance import DistanceCalculator
@@ -92,6 +94,12 @@ class QtVTKCanvas(IplotQtCanvas):
         self._dist_calculator = DistanceCalculator()
         self._draw_call_counter = 0
 
+        # Mouse motion renders at most once per display frame
+        self._last_motion_render = float('-inf')
+        self._motion_render_timer = QTimer(self)
+        self._motion_render_timer.setSingleShot(True)
+        self._motion_render_timer.timeout.connect(self._motion_render)
+
         self._marker_window = IplotQtMarker()
 
         # Statistics
@@ -193,8 +201,21 @@ class QtVTKCanvas(IplotQtCanvas):
             return
         mousePos = obj.GetEventPosition()
         # self._debug_log_event(ev, f"{mousePos}") # silenced for easy debugging
-        if self._mmode == Canvas.MOUSE_MODE_CROSSHAIR:
-            self._parser.crosshair.on_move(mousePos)
+        if self._mmode == Canvas.MOUSE_MODE_CROSSHAIR and not self._parser.crosshair.on_move(mousePos):
+            return
+        self._request_motion_render()
+
+    def _request_motion_render(self):
+        """Renders now if the previous motion render is at least one display frame old, otherwise when it is."""
+        interval = 1. / (self.screen().refreshRate() or 60.)
+        wait = self._last_motion_render + interval - time.perf_counter()
+        if wait <= 0:
+            self._motion_render()
+        elif not self._motion_render_timer.isActive():
+            self._motion_render_timer.start(max(1, int(wait * 1000)))
+
+    def _motion_render(self):
+        self._last_motion_render = time.perf_counter()
         self._vtk_renderer.Render()
 
     def _vtk_mouse_press_handler(self, obj, ev):
@@ -0,0 +1,53 @@
+# Copyright (c) 2020-2025 ITER Organization,
+#               CS 90046
+#               13067 St Paul Lez Durance Cedex
+#               France
+# Author IO
+#
+# This file is part of iplotlib module.
+# iplotlib python module is free software: you can redistribute it and/or modify it under
+# the terms of the MIT license.
+#
+# This file is part of ITER CODAC software.
+# For the terms and conditions of redistribution or use of this software
+# refer to the file LICENSE located in the top level directory
+# of the distribution package
+#
+
+
+import unittest
+
+import numpy as np
+
+from iplotlib.impl.vtk.utils import step_points
+
+
+class StepPointsTesting(unittest.TestCase):
+    def setUp(self) -> None:
+        self.xs = np.array([0, 10, 20, 30], dtype=np.int64)
+        self.ys = np.array([1., 2., 3., 4.])
+
+    def test_pre_post(self):
+        xs, ys = step_points(self.xs, self.ys, "steps-pre")
+        self.assertListEqual(xs.tolist(), [0, 0, 10, 10, 20, 20, 30])
+        self.assertListEqual(ys.tolist(), [1., 2., 2., 3., 3., 4., 4.])
+
+        xs, ys = step_points(self.xs, self.ys, "steps-post")
+        self.assertListEqual(xs.tolist(), [0, 10, 10, 20, 20, 30, 30])
+        self.assertListEqual(ys.tolist(), [1., 1., 2., 2., 3., 3., 4.])
+
+    def test_mid(self):
+        xs, ys = step_points(self.xs, self.ys, "steps-mid")
+        self.assertEqual(xs.dtype, np.int64)
+        self.assertListEqual(xs.tolist(), [0, 5, 5, 10, 15, 15, 20, 25, 25, 30])
+        self.assertListEqual(ys.tolist(), [1., 1., 2., 2., 2., 3., 3., 3., 4., 4.])
+
+    def test_unchanged(self):
+        for xs, ys, step_type in [(self.xs, self.ys, "none"), (self.xs[:1], self.ys[:1], "steps-mid")]:
+            new_xs, new_ys = step_points(xs, ys, step_type)
+            self.assertListEqual(new_xs.tolist(), xs.tolist())
+            self.assertListEqual(new_ys.tolist(), ys.tolist())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+# Copyright (c) 2020-2025 ITER Organization,
+#               CS 90046
+#               13067 St Paul Lez Durance Cedex
+#               France
+# Author IO
+#
+# This file is part of iplotlib module.
+# iplotlib python module is free software: you can redistribute it and/or modify it under
+# the terms of the MIT license.
+#
+# This file is part of ITER CODAC software.
+# For the terms and conditions of redistribution or use of this software
+# refer to the file LICENSE located in the top level directory
+# of the distribution package
+#
+
+import unittest
+
+import numpy as np
+
+from iplotlib.core.canvas import Canvas
+from iplotlib.core.plot import PlotXY
+from iplotlib.core.signal import SignalXY
+from iplotlib.impl.vtk.vtkCanvas import VTKParser
+
+
+def make_signal(name, x, y, **kwargs) -> SignalXY:
+    signal = SignalXY(label=name, name=name, uid=name, data_access_enabled=False, processing_enabled=False, **kwargs)
+    signal.inject_external(append=False, d0=x, d1=y, d2=[], d3=[], alias_map={})
+    return signal
+
+
+class VTKParserDataTesting(unittest.TestCase):
+    def setUp(self) -> None:
+        self.n_samples = 200000
+        x = np.arange(self.n_samples, dtype=np.float64)
+        self.line = make_signal('line', x, np.sin(x / 1000))
+        self.step = make_signal('step', x[:50], np.cos(x[:50]), step='steps-post')
+        t = np.int64(1_700_000_000_000_000_000) + np.arange(self.n_samples, dtype=np.int64) * 1000
+        self.date = make_signal('date', t, np.sin(x / 500), hi_precision_data=True)
+
+        self.canvas = Canvas(rows=2, cols=2)
+        for signal, col in [(self.line, 0), (self.step, 1), (self.date, 1)]:
+            plot = PlotXY()
+            if signal is self.date:
+                plot.axes[0].is_date = True
+            plot.add_signal(signal)
+            self.canvas.add_plot(plot, col=col)
+
+        self.vtk_parser = VTKParser()
+        self.vtk_parser.view.GetRenderWindow().SetSize(1600, 600)
+        self.vtk_parser.process_ipl_canvas(self.canvas)
+
+    def get_line(self, signal):
+        return self.vtk_parser._signal_impl_shape_lut.get(id(signal))
+
+    def test_lod_column_width(self):
+        # Before the charts are laid out, a line gets the width of a column of the canvas
+        line = self.get_line(self.line)
+        self.assertEqual(self.vtk_parser._get_lod_width(line), 800)
+        self.assertLessEqual(line.GetInput().GetNumberOfRows(), 4 * 800 + 2)
+
+        self.vtk_parser.resize(800, 600)
+        self.assertLessEqual(line.GetInput().GetNumberOfRows(), 4 * 400 + 2)
+
+    def test_step(self):
+        line = self.get_line(self.step)
+        self.assertEqual(line.GetInput().GetNumberOfRows(), 2 * 50 - 1)
+
+    def test_hi_precision_date(self):
+        line = self.get_line(self.date)
+        self.assertGreater(line.GetInput().GetNumberOfRows(), 0)
+        # The x axis shows the 16-bit chunk that varies over the data
+        axis = line.GetXAxis()
+        self.assertLess(axis.GetMinimum(), axis.GetMaximum())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -40,6 +40,7 @@ class VTK64BitTimePlotSupport:
         self._plot = None  # type: vtkPlot
         self._activeBitSeqId = None
         self._ofstTime = None
+        self._ticsKey = None  # the state of the chart when the tick labels were last generated
 
     def enable(self):
         """
@@ -75,7 +76,7 @@ class VTK64BitTimePlotSupport:
         columnId = -1
         numCols = table.GetNumberOfColumns()
         for i in range(numCols):
-            if arr == table.GetColumn(i):
+            if arr is table.GetColumn(i):
                 columnId = i
                 break
         return columnId
@@ -150,10 +151,11 @@ class VTK64BitTimePlotSupport:
 
     @staticmethod
     def get_time_stamp_from_16bits(bitSequences: Sequence[np.uint16]) -> int:
+        # Python integers, the products of numpy 16-bit integers would overflow
         if np.little_endian:
-            bitSequencesIter = iter(bitSequences)
+            bitSequencesIter = map(int, bitSequences)
         else:
-            bitSequencesIter = reversed(bitSequences)
+            bitSequencesIter = map(int, reversed(bitSequences))
 
         retVal = (next(bitSequencesIter) + next(bitSequencesIter) * (1 << 16) +
                   (next(bitSequencesIter) + next(bitSequencesIter) *
@@ -164,6 +166,32 @@ class VTK64BitTimePlotSupport:
 
         return retVal
 
+    @staticmethod
+    def normalize_to_dtype_array(bitSequences: np.ndarray, dtype=np.uint16):
+        """Vectorized normalize_to_dtype over the rows of an (n, 4) int64 array, in place."""
+        dtypeBitWidth = np.dtype(dtype).itemsize * 8
+        dtypeMin = 0
+        dtypeMax = (1 << dtypeBitWidth) - 1
+        dtypeCapacity = dtypeMax - dtypeMin + 1
+
+        order = [0, 1, 2, 3] if np.little_endian else [3, 2, 1, 0]
+        for q, nextId in zip(order[:-1], order[1:]):
+            seq = bitSequences[:, q]
+            p = np.abs(seq - dtypeMax) // dtypeCapacity
+            bitSequences[:, nextId] += np.where(seq > dtypeMax, p, 0) - np.where(seq < dtypeMin, p, 0)
+            np.clip(seq, dtypeMin, dtypeMax, out=seq)
+        np.clip(bitSequences[:, order[-1]], dtypeMin, dtypeMax, out=bitSequences[:, order[-1]])
+
+    @staticmethod
+    def get_time_stamps_from_16bits(bitSequences: np.ndarray) -> np.ndarray:
+        """Vectorized get_time_stamp_from_16bits over the rows of an (n, 4) array of values within [0, 65535]."""
+        if not np.little_endian:
+            bitSequences = bitSequences[:, ::-1]
+        bitSequences = bitSequences.astype(np.uint64)
+        retVal = (bitSequences[:, 0] + (bitSequences[:, 1] << np.uint64(16)) +
+                  (bitSequences[:, 2] << np.uint64(32)) + (bitSequences[:, 3] << np.uint64(48)))
+        return np.minimum(retVal, np.uint64((1 << 63) - 1)).astype(np.int64)
+
     def get_x_range(self, chart: vtkChart, plotId: int) -> Tuple[float, float]:
         xr = ()
         with self.get_plot_from_chart(plotId, chart):
@@ -265,7 +293,7 @@ class VTK64BitTimePlotSupport:
                         # stepping down
                         actArr = self._table.GetColumn(actColId)
                         newArr = self._table.GetColumn(newColId)
-                        tb = np.uint16(actArr.GetRange()[0])
+                        tb = np.uint16(int(actArr.GetRange()[0]) & 0xFFFF)
                         newArr.SetName(str(tb))
                         logger.debug(f"Stepped down at {tb}")
 
@@ -393,7 +421,10 @@ class VTK64BitTimePlotSupport:
     def transformValue(self, value: Any, inverse=False):
         """Build the full 64 bit integer value corresponding to input value in 
         the context of given chart
-        The inverse operation would subtract the offset and return the 16-bit integer"""
+        The inverse operation would subtract the offset and return the 16-bit integer
+        An array of values is transformed at once."""
+        if np.ndim(value):
+            return self.transform_values(np.asarray(value), inverse)
         if not inverse:
             if self._precise and self._enabled and self._ofstTime is not None:
                 bitSequences = np.array([self._ofstTime], np.uint64).view(np.uint16)
@@ -435,6 +466,33 @@ class VTK64BitTimePlotSupport:
         else:
             return value
 
+    def transform_values(self, values: np.ndarray, inverse=False) -> np.ndarray:
+        """Vectorized transformValue for a one-dimensional array of values."""
+        bitSeqTransform = self._precise and self._enabled
+        if not inverse and bitSeqTransform and self._ofstTime is not None:
+            # Values of the active bit sequence beyond int64 once added to the offset are left to the scalar version
+            if values.dtype.kind in 'iuf' and np.all(np.abs(values) < (1 << 62)):
+                bitSequences = np.array([self._ofstTime], np.uint64).view(np.uint16).astype(np.int64)
+                bitSequences = np.repeat(bitSequences[np.newaxis, :], len(values), axis=0)
+                active = bitSequences[:, self._activeBitSeqId]
+                if values.dtype.kind == 'f':
+                    active = np.trunc(active + values).astype(np.int64)
+                else:
+                    active = active + values.astype(np.int64)
+                bitSequences[:, self._activeBitSeqId] = active
+                VTK64BitTimePlotSupport.normalize_to_dtype_array(bitSequences, dtype=np.uint16)
+                return VTK64BitTimePlotSupport.get_time_stamps_from_16bits(bitSequences)
+        elif inverse and bitSeqTransform and values.dtype.kind in 'iuf':
+            bitSequences = values.astype(np.uint64).view(np.uint16).reshape(-1, 4)
+            try:
+                return bitSequences[:, self._activeBitSeqId]
+            except (TypeError, IndexError) as _:
+                return bitSequences[:, 0]
+        elif (not inverse and self._precise) or self._enabled:
+            if values.dtype.kind == 'i' or (values.dtype.kind == 'f' and np.all(np.abs(values) < (1 << 63))):
+                return values.astype(np.int64)
+        return np.array([self.transformValue(value, inverse) for value in values])
+
     def generateTics(self, obj, ev):
         """Tick labels mark periods of time in plot data.
         These labels display only the varying periods.
@@ -445,8 +503,12 @@ class VTK64BitTimePlotSupport:
 
         chart = obj.GetParent()  # type: vtkChart
 
-        # Initially, compute simple numeric tick positions
+        # The labels of the previous call still hold while the visible range and the data are the same
         xAxis = chart.GetAxis(vtkAxis.BOTTOM)  # type: vtkAxis
+        if self._ticsKey is not None and self._ticsKey == self.get_tics_key(chart):
+            return
+
+        # Initially, compute simple numeric tick positions
         xAxis.SetCustomTickPositions(None, None)
         xAxis.SetNumberOfTicks(6)
         xAxis.SetTickLabelAlgorithm(vtkAxis.TICK_SIMPLE)
@@ -456,15 +518,7 @@ class VTK64BitTimePlotSupport:
         xAxis.Update()
         tick_positions_vtk_arr = xAxis.GetTickPositions()
         tick_positions_np_arr = numpy_support.vtk_to_numpy(tick_positions_vtk_arr)
-        tss = []
-
-        logger.debug(f"TimeStamp | Tick Position | time")
-        for pos in tick_positions_np_arr:
-            t = self.transformValue(pos)
-            if t < 0:
-                t = 0
-            tss.append(pd.to_datetime(t))
-            logger.debug(f"{tss[-1]} | {np.int64(pos)} | {t}")
+        tss = np.maximum(self.transformValue(tick_positions_np_arr), 0) if len(tick_positions_np_arr) else []
 
         timestamps = pd.to_datetime(tss)
         uniq_year = timestamps.year.nunique() == 1
@@ -507,18 +561,26 @@ class VTK64BitTimePlotSupport:
         logger.debug(f"|--Axis title: Fmt string: {prefixFmt}")
 
         tick_labels = vtkStringArray()
-        for ts in tss:
-            tick_label = ts.strftime(tickLabelFmt)
-            tick_label = tick_label.replace("nano", str(ts.nanosecond).zfill(3))
-            tick_labels.InsertNextValue(tick_label)
+        for tick_label, nanosecond in zip(timestamps.strftime(tickLabelFmt), timestamps.nanosecond):
+            tick_labels.InsertNextValue(tick_label.replace("nano", str(nanosecond).zfill(3)))
 
         xAxis.SetCustomTickPositions(tick_positions_vtk_arr, tick_labels)
         try:
-            xAxis.SetTitle(tss[0].strftime(prefixFmt))
+            xAxis.SetTitle(timestamps[0].strftime(prefixFmt))
         except IndexError:
             logger.critical(f"There is no data for chart. Setting xAxis title to 'X Axis'")
             xAxis.SetTitle('X Axis')
         xAxis.Update()
+        self._ticsKey = self.get_tics_key(chart)
+
+    def get_tics_key(self, chart: vtkChart) -> tuple:
+        """The state the tick labels depend on: the visible range, the settings and the data of the plots"""
+        xAxis = chart.GetAxis(vtkAxis.BOTTOM)  # type: vtkAxis
+        tables = []
+        for i in range(chart.GetNumberOfPlots()):
+            table = chart.GetPlot(i).GetInput()
+            tables.append((id(table), table.GetMTime() if isinstance(table, vtkTable) else None))
+        return xAxis.GetMinimum(), xAxis.GetMaximum(), self._enabled, self._precise, tuple(tables)
 
     @staticmethod
     def round_hour(ret):
@@ -67,6 +67,7 @@ class CrosshairCursorWidget:
         self.rootPlotPos = [0, 0]
         self.cursors = []
         self.cursor_kwargs = kwargs
+        self._ranges = dict()  # key is the chart index, value is (geometry, xRange and yRange in scene coordinates)
 
         self.scene = self.matrix.GetScene()
         if self.scene is None:
@@ -83,61 +84,77 @@ class CrosshairCursorWidget:
             item.SetVisible(False)
             self.cursors.append([cursor, item])
             self.scene.AddItem(item)
+        self._ranges.clear()
 
     def clear(self):
         for _, item in self.cursors:
             self.scene.RemoveItem(item)
         self.cursors.clear()
         self.charts.clear()
+        self._ranges.clear()
 
-    def hide(self):
+    def hide(self) -> bool:
+        """Hides all cursors. Returns True if any of them was visible."""
+        changed = False
         for _, item in self.cursors:
-            item.SetVisible(False)
+            if item.GetVisible():
+                item.SetVisible(False)
+                changed = True
+        return changed
 
-    def on_move(self, mousePos: tuple):
+    def on_move(self, mousePos: tuple) -> bool:
+        """Moves the cursors to the mouse position. Returns True if the scene needs to be rendered again."""
         scene = self.matrix.GetScene()
         if scene is None:
-            return
+            return False
 
         screenToScene = scene.GetTransform()
         probe = [0, 0]
         screenToScene.TransformPoints(mousePos, probe, 1)
 
-        self.hide()
-
         plotRoot = find_root_plot(self.matrix, probe)
         if plotRoot is None:
-            return
-
-        self.rootPlotPos = plotRoot.MapFromScene(vtkVector2f(probe))
-        self._update()
-
-    def _update(self):
+            return self.hide()
+
+        rootPlotPos = plotRoot.MapFromScene(vtkVector2f(probe))
+        self.rootPlotPos = [rootPlotPos[0], rootPlotPos[1]]
+        return self._update()
+
+    def _chart_ranges(self, i: int, chart, plot):
+        """Returns the axes ranges of a chart in scene coordinates. They are only mapped again when the chart moves,
+        is resized, or its axes or shift and scale change."""
+        shiftScale = plot.GetShiftScale()
+        xAxis = chart.GetAxis(vtkAxis.BOTTOM)
+        yAxis = chart.GetAxis(vtkAxis.LEFT)
+        geometry = (xAxis.GetMinimum(), xAxis.GetMaximum(), yAxis.GetMinimum(), yAxis.GetMaximum(),
+                    shiftScale.GetX(), shiftScale.GetY(), shiftScale.GetWidth(), shiftScale.GetHeight(),
+                    tuple(chart.GetPoint1()), tuple(chart.GetPoint2()))
+        cached = self._ranges.get(i)
+        if cached is not None and cached[0] == geometry:
+            return cached[1]
+
+        xMin, xMax, yMin, yMax, xShift, yShift, xScale, yScale = geometry[:8]
+        xRange, yRange = [0, 0], [0, 0]
+        for j, (x, y) in enumerate(((xMin, yMin), (xMax, yMax))):
+            xRange[j], yRange[j] = plot.MapToScene(vtkVector2f((x + xShift) * xScale, (y + yShift) * yScale))
+        self._ranges[i] = (geometry, (xRange, yRange))
+        return xRange, yRange
+
+    def _update(self) -> bool:
+        changed = False
         for i, chart in enumerate(self.charts):
             plot = chart.GetPlot(0)
             if plot is None:
                 continue
 
-            xShift = plot.GetShiftScale().GetX()
-            xScale = plot.GetShiftScale().GetWidth()
-            xAxis = chart.GetAxis(vtkAxis.BOTTOM)
-            xRange = [xAxis.GetMinimum(), xAxis.GetMaximum()]
-            xRangePlotCoords = [0, 0]
-            for j in range(2):
-                xRangePlotCoords[j] = (xRange[j] + xShift) * xScale
-
-            yShift = plot.GetShiftScale().GetY()
-            yScale = plot.GetShiftScale().GetHeight()
-            yAxis = chart.GetAxis(vtkAxis.LEFT)
-            yRange = [yAxis.GetMinimum(), yAxis.GetMaximum()]
-            yRangePlotCoords = [0, 0]
-            for j in range(2):
-                yRangePlotCoords[j] = (yRange[j] + yShift) * yScale
-
             cursor, item = self.cursors[i]
-            for j in range(2):
-                cursor.xRange[j], cursor.yRange[j] = plot.MapToScene(
-                    vtkVector2f(xRangePlotCoords[j], yRangePlotCoords[j]))
-
-            cursor.position = plot.MapToScene(vtkVector2f(self.rootPlotPos))
-            item.SetVisible(True)
+            xRange, yRange = self._chart_ranges(i, chart, plot)
+            position = plot.MapToScene(vtkVector2f(self.rootPlotPos))
+            position = [position[0], position[1]]
+            if not item.GetVisible() or position != cursor.position or xRange != cursor.xRange or \
+                    yRange != cursor.yRange:
+                cursor.xRange, cursor.yRange = list(xRange), list(yRange)
+                cursor.position = position
+                item.SetVisible(True)
+                changed = True
+        return changed
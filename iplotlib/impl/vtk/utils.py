@@ -189,25 +189,40 @@ def regression_test(valid_image_abs_path: str, renWin: vtkRenderWindow, threshol
         return True
 
 
-def step_function(i: int, xs, ys, step_type: str):
+def step_points(xs, ys, step_type: str):
     """See [steps-demo](https://matplotlib.org/stable/gallery/lines_bars_and_markers/step_demo.html)
     for meaning of step_type
 
     Args:
-        i (int): an index into xs, ys
         xs (sequence): array of x values
         ys (sequence): array of y values
         step_type (str): step type- valid args are steps/steps-pre, steps-mid, steps-post
 
     Returns:
-        np.ndarray: a new point either pre, mid or post
+        Tuple[np.ndarray, np.ndarray]: the x and y values of the vertices of the step line. The data is returned
+        unchanged for other step types. Integer x values stay integers, the midpoints of steps-mid are rounded down.
     """
-    x, y = xs[i], ys[i]
-    xp, yp = xs[i + 1], ys[i + 1]
-    xmid = (x + xp) * 0.5
+    xs = np.asarray(xs)
+    ys = np.asarray(ys)
+    if len(xs) < 2 or step_type not in ("steps", "steps-pre", "steps-mid", "steps-post"):
+        return xs, ys
+
     if step_type == "steps-pre" or step_type == "steps":
-        return np.array([[x, yp]])
-    elif step_type == "steps-mid":
-        return np.array([[xmid, y], [xmid, yp]])
+        return np.repeat(xs, 2)[:-1], np.repeat(ys, 2)[1:]
     elif step_type == "steps-post":
-        return np.array([[xp, y]])
+        return np.repeat(xs, 2)[1:], np.repeat(ys, 2)[:-1]
+
+    # steps-mid: each sample is followed by two vertices at the middle of the next interval
+    if xs.dtype.kind in 'iu':
+        xmid = xs[:-1] + (xs[1:] - xs[:-1]) // 2
+    else:
+        xmid = (xs[:-1] + xs[1:]) * 0.5
+    new_xs = np.empty(3 * len(xs) - 2, dtype=np.result_type(xs, xmid))
+    new_ys = np.empty(3 * len(ys) - 2, dtype=ys.dtype)
+    new_xs[0::3] = xs
+    new_xs[1::3] = xmid
+    new_xs[2::3] = xmid
+    new_ys[0::3] = ys
+    new_ys[1::3] = ys[:-1]
+    new_ys[2::3] = ys[1:]
+    return new_xs, new_ys
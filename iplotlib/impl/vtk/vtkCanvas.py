@@ -38,6 +38,9 @@ import vtkmodules.vtkInteractionStyle
 import vtkmodules.vtkRenderingOpenGL2
 import vtkmodules.vtkRenderingContextOpenGL2
 
+from iplotlib.core.decimation import m4_view_indices
+from iplotlib.core.windowing import is_sorted
+from iplotlib.data_access.ring_buffer import RingBuffer
 from iplotlib.impl.vtk import utils as vtkImplUtils
 from iplotlib.impl.vtk.tools import CanvasTitleItem, CrosshairCursorWidget, VTK64BitTimePlotSupport, queryMatrix
 from iplotlib.impl.vtk.tools.vtkCrosshairCursorWidget import CrosshairCursor
@@ -78,8 +81,11 @@ class VTKParser(BackendParserBase):
     """
 
     def __init__(self, canvas: Canvas = None, focus_plot=None, focus_plot_stack_key=None,
-                 impl_flush_method: Callable = None) -> None:
+                 impl_flush_method: Callable = None, line_decimation: str = 'm4') -> None:
         """Initialize underlying vtk classes.
+
+        With `line_decimation` set to 'm4', lines only get the M4 samples of their visible range for the width of the
+        view in pixels, and follow the range as it changes. None draws every sample.
         """
         super().__init__(canvas=canvas, focus_plot=focus_plot, focus_plot_stack_key=focus_plot_stack_key,
                          impl_flush_method=impl_flush_method)
@@ -104,6 +110,11 @@ class VTKParser(BackendParserBase):
         self._layout.SetBorderTop(0)
 
         self._vtk_col_row_plot_lut = dict()  # (c, r) -> Plot
+        self._bit_sequence_cache = dict()  # id(vtkPlot) -> (x, RingBuffer of the 4 bit sequences of x)
+        self._step_cache = dict()  # id(Signal) -> (x, y, step type, stepped x, stepped y)
+        self.line_decimation = line_decimation
+        self._line_lod = dict()  # id(vtkPlot) -> [vtkPlot, x, y, var_name, bitSequencing, extremes, shown indices]
+        self._lod_width = None  # width of the view in pixels the charts were laid out for
 
         self._title_region = vtkContextArea()
         axisLeft = self._title_region.GetAxis(vtkAxis.LEFT)
@@ -265,6 +276,9 @@ class VTKParser(BackendParserBase):
         self._vtk_col_row_plot_lut.clear()
         self._layout.SetSize(vtkVector2i(0, 0))
         self._vtk_custom_tickers.clear()
+        self._bit_sequence_cache.clear()
+        self._step_cache.clear()
+        self._line_lod.clear()
         self.crosshair.clear()
         super().clear()
 
@@ -321,8 +335,7 @@ class VTKParser(BackendParserBase):
         for signals in plot.signals.values():
             for signal in signals:
                 if isinstance(signal, SignalXY):
-                    retVal |= self._pm.get_value(
-                        'hi_precision_data', self.canvas, plot, signal=signal)
+                    retVal |= self._pm.get_value(signal, 'hi_precision_data')
         return retVal
 
     def process_ipl_canvas(self, canvas: Canvas):
@@ -469,8 +482,8 @@ class VTKParser(BackendParserBase):
                 vtk_axis.SetTitle(axis.label)
 
             appearance = vtk_axis.GetTitleProperties()  # type: vtkTextProperty
-            fc = self._pm.get_value('font_color', self.canvas, plot, axis)
-            fs = self._pm.get_value('font_size', self.canvas, plot, axis)
+            fc = self._pm.get_value(axis, 'font_color')
+            fs = self._pm.get_value(axis, 'font_size')
             if fc is not None:
                 appearance.SetColor(*vtkImplUtils.get_color3d(fc))
                 logger.debug(f"Ax color: {vtkImplUtils.get_color3d(fc)}")
@@ -487,7 +500,7 @@ class VTKParser(BackendParserBase):
         vtk_axis.AddObserver(vtkChart.UpdateRange, self._axis_update_callback)
 
         if ax_idx == 0:
-            tick_number = self._pm.get_value("tick_number", self.canvas, axis)
+            tick_number = self._pm.get_value(axis, 'tick_number')
             vtk_axis.SetNumberOfTicks(tick_number)
 
     def _refresh_shared_x_axis(self):
@@ -545,6 +558,10 @@ class VTKParser(BackendParserBase):
         if ax_idx != 0:
             return
 
+        # Lines follow the visible range with their level of detail
+        for signal_ref in ci.signals:
+            self._refresh_line_lod(self._signal_impl_shape_lut.get(id(signal_ref())))
+
         # Signal requires x-range only.
         for signal_ref in ci.signals:
             signal = signal_ref()
@@ -663,7 +680,7 @@ class VTKParser(BackendParserBase):
         """
         for chart in self._plot_impl_plot_lut[id(plot)]:
             if isinstance(plot, PlotXY):
-                grid = self._pm.get_value('grid', self.canvas, plot)
+                grid = self._pm.get_value(plot, 'grid')
                 if grid is not None:
                     chart.GetAxis(vtkAxis.BOTTOM).SetGridVisible(grid)
                     chart.GetAxis(vtkAxis.LEFT).SetGridVisible(grid)
@@ -675,13 +692,13 @@ class VTKParser(BackendParserBase):
             plot (Plot): An abstract plot object
         """
         for chart in self._plot_impl_plot_lut[id(plot)]:
-            legend = self._pm.get_value('legend', self.canvas, plot)
+            legend = self._pm.get_value(plot, 'legend')
             chart.SetShowLegend(legend)
             if legend:
-                canvas_leg_position = self._pm.get_value('legend_position', self.canvas)
-                canvas_leg_layout = self._pm.get_value('legend_layout', self.canvas)
-                plot_leg_position = self._pm.get_value('legend_position', self.canvas, plot)
-                plot_leg_layout = self._pm.get_value('legend_layout', self.canvas, plot)
+                canvas_leg_position = self._pm.get_value(self.canvas, 'legend_position')
+                canvas_leg_layout = self._pm.get_value(self.canvas, 'legend_layout')
+                plot_leg_position = self._pm.get_value(plot, 'legend_position')
+                plot_leg_layout = self._pm.get_value(plot, 'legend_layout')
 
                 plot_leg_position = canvas_leg_position if plot_leg_position == 'same as canvas' \
                     else plot_leg_position
@@ -750,7 +767,73 @@ class VTKParser(BackendParserBase):
             x = np.array(x, dtype=np.float64)
         if not isinstance(y, np.ndarray):
             y = np.array(y, dtype=np.float64)
-        table = vtkTable()
+
+        # Lines with more samples than the view can show get a level of detail, see _refresh_line_lod
+        if (self.line_decimation == 'm4' and isinstance(plot, vtkPlotLine) and x.ndim == 1 and y.ndim == 1
+                and len(x) > 4 * self._get_lod_width(plot) and is_sorted(x)):
+            try:
+                # Kept whatever the view, so that the bounds of the line stay those of the data
+                extremes = [np.nanargmin(y), np.nanargmax(y)]
+            except ValueError:
+                extremes = []
+            self._line_lod[id(plot)] = [plot, x, y, var_name, bitSequencing, extremes, None]
+            self._refresh_line_lod(plot)
+            return
+        self._line_lod.pop(id(plot), None)
+        self._set_plot_data(plot, x, y, var_name, bitSequencing)
+
+    def _refresh_line_lod(self, plot: vtkPlot, view_width: int = None):
+        """Give the line the M4 samples of its visible range, for the width of its chart in pixels.
+        Lines without a level of detail and lines that already show the right samples are left as they are.
+        `view_width` is a new width of the view, see :meth:`_get_lod_width`."""
+        lod = self._line_lod.get(id(plot))
+        if lod is None:
+            return
+        plot, x, y, var_name, bitSequencing, extremes, shown = lod
+
+        if plot.GetMarkerStyle() != vtkMarkerUtilities.NONE:
+            # Every sample has its marker
+            indices = np.arange(len(x))
+        else:
+            x_min, x_max = x[0], x[-1]
+            axis = plot.GetXAxis()  # type: vtkAxis
+            # The range of the axis is only meaningful once the chart was laid out
+            if isinstance(axis, vtkAxis) and axis.GetPoint1() != axis.GetPoint2():
+                begin, end = self.get_oaw_axis_limits(axis.GetParent(), 0)
+                if begin is not None and end is not None and begin < x[-1] and end > x[0]:
+                    x_min, x_max = begin, end
+            indices = m4_view_indices(x, y, x_min, x_max, self._get_lod_width(plot, view_width), extremes)
+
+        if shown is not None and np.array_equal(indices, shown):
+            return
+        lod[-1] = indices
+        if len(indices) == len(x):
+            self._set_plot_data(plot, x, y, var_name, bitSequencing)
+        else:
+            self._set_plot_data(plot, x[indices], y[indices], var_name, bitSequencing)
+
+    def _get_lod_width(self, plot: vtkPlot, view_width: int = None) -> int:
+        """Width in pixels of the chart that shows `plot`, or of a column of the canvas before the chart is laid out.
+        Charts are laid out again on the next render only, a new `view_width` scales the width of their last layout."""
+        laid_out_width = self._lod_width or self.view.GetRenderWindow().GetSize()[0] or 1920
+        view_width = view_width or laid_out_width
+        axis = plot.GetXAxis()  # type: vtkAxis
+        if isinstance(axis, vtkAxis) and axis.GetPoint1() != axis.GetPoint2():
+            chart_width = abs(axis.GetPoint2()[0] - axis.GetPoint1()[0])
+            return max(1, int(chart_width * view_width / laid_out_width))
+        cols = self.canvas.cols if self.canvas is not None and self.canvas.cols else 1
+        return max(1, view_width // cols)
+
+    def _set_plot_data(self, plot: vtkPlot, x: np.ndarray, y: np.ndarray, var_name, bitSequencing=False):
+        # Contiguous arrays are shared with VTK without a copy, the vtk arrays keep a reference to them.
+        x = np.ascontiguousarray(x)
+        y = np.ascontiguousarray(y)
+
+        # Reuse the table of the plot, only its columns are replaced.
+        table = plot.GetInput()
+        if not isinstance(table, vtkTable):
+            table = vtkTable()
+        table.RemoveAllColumns()
         xs = numpy_support.numpy_to_vtk(x)
         ys = numpy_support.numpy_to_vtk(y)
         xs.SetName("X-Axis")
@@ -759,21 +842,45 @@ class VTKParser(BackendParserBase):
         table.AddColumn(ys)
         if bitSequencing:
             # insert least->highest significant bits into table columns
-            as16bits = x.view(np.uint16)
-            bitSequences = [as16bits[::4],
-                            as16bits[1::4],
-                            as16bits[2::4],
-                            as16bits[3::4], ]
-            for i, bitSeq in enumerate(bitSequences):
+            for i, bitSeq in enumerate(self.get_bit_sequences(plot, x)):
                 vtkArr = numpy_support.numpy_to_vtk(bitSeq)
                 vtkArr.SetName(f"Bit-Sequence: {i}")
                 table.AddColumn(vtkArr)
+        else:
+            self._bit_sequence_cache.pop(id(plot), None)
+        table.Modified()
 
         plot.SetInputData(table, 0, 1)
         if bitSequencing:
             xaxis = plot.GetXAxis()
             xaxis.InvokeEvent(vtkChart.UpdateRange)
 
+    def get_bit_sequences(self, plot: vtkPlot, x: np.ndarray) -> Sequence[np.ndarray]:
+        """
+        Split the 64-bit values of `x` into four contiguous arrays of 16 bits, from the least to the most significant.
+
+        When `x` continues the data previously given for `plot` (e.g, a streaming buffer that grew and possibly
+        dropped its oldest samples), only the appended samples are split.
+        """
+        cached = self._bit_sequence_cache.get(id(plot))
+        start = 0
+        if cached is not None and x.ndim == 1 and len(x):
+            old_x, bits = cached
+            # x continues old_x if it begins inside the memory of old_x, which is never written to again.
+            offset, remainder = divmod(x.ctypes.data - old_x.ctypes.data, x.itemsize)
+            if (x.dtype == old_x.dtype and not remainder and 0 <= offset <= len(old_x)
+                    and len(bits) == len(old_x) and len(x) >= len(old_x) - offset):
+                bits.keep_last(len(old_x) - offset)
+                start = len(bits)
+        if not start:
+            bits = RingBuffer()
+
+        bits.append(*x[start:].view(np.uint16).reshape(-1, 4).T)
+        self._bit_sequence_cache[id(plot)] = (x, bits)
+        if not len(bits):
+            return [np.empty(0, dtype=np.uint16)] * 4
+        return bits.views()
+
     def _refresh_plot_title(self, plot: Plot):
         """Update plot title text and its appearance
         """
@@ -786,8 +893,8 @@ class VTKParser(BackendParserBase):
             if (plot.plot_title is not None) and draw_title:
                 chart.SetTitle(plot.plot_title)
                 appearance = chart.GetTitleProperties()  # type: vtkTextProperty
-                fc = self._pm.get_value('font_color', self.canvas, plot)
-                fs = self._pm.get_value('font_size', self.canvas, plot)
+                fc = self._pm.get_value(plot, 'font_color')
+                fs = self._pm.get_value(plot, 'font_size')
                 if fc is not None:
                     appearance.SetColor(*vtkImplUtils.get_color3d(fc))
                 if fs is not None:
@@ -798,7 +905,7 @@ class VTKParser(BackendParserBase):
         Update plot background color
         """
         for i, chart in enumerate(self._plot_impl_plot_lut[id(plot)]):
-            rgb_color = self.hex_to_rgb(plot.background_color)
+            rgb_color = self.hex_to_rgb(self._pm.get_value(plot, 'background_color'))
             # Set the background color using vtkBrush
             background_brush = vtk.vtkBrush()
             background_brush.SetColorF(rgb_color)
@@ -854,9 +961,12 @@ class VTKParser(BackendParserBase):
                 logger.error(f"Requested to draw line for sig({id(signal)}), but it does not have sufficient data"
                              f" arrays (<2). {signal}")
                 return
+            x_data, y_data = data[0], data[1]
+            if isinstance(signal, SignalXY):
+                x_data, y_data = self._get_step_data(signal, x_data, y_data)
             line = self._signal_impl_shape_lut.get(id(signal))
             if not isinstance(line, vtkPlot):
-                line = self.add_vtk_line_plot(chart, signal.label, data[0], data[1], hi_prec_nanos)
+                line = self.add_vtk_line_plot(chart, signal.label, x_data, y_data, hi_prec_nanos)
                 if not signal.color:
                     signal.color = self.rgb_to_hex(line.GetBrush().GetColorObject())
                 self._signal_impl_shape_lut.update({id(signal): line})
@@ -867,7 +977,7 @@ class VTKParser(BackendParserBase):
                 except AttributeError:
                     pass
             else:
-                self.refresh_impl_plot_data(line, data[0], data[1], signal.label, hi_prec_nanos)
+                self.refresh_impl_plot_data(line, x_data, y_data, signal.label, hi_prec_nanos)
                 self.view.Render()
 
         # Translate abstract properties to backend
@@ -879,7 +989,8 @@ class VTKParser(BackendParserBase):
             self._refresh_line_style(signal)
             self._refresh_marker_size(signal)
             self._refresh_marker_style(signal)
-            self._refresh_step_type(signal)
+            # The samples shown depend on the marker
+            self._refresh_line_lod(self._signal_impl_shape_lut.get(id(signal)))
 
         self.update_axis_labels_with_units(chart, signal)
 
@@ -898,66 +1009,36 @@ class VTKParser(BackendParserBase):
         if signal.label is not None:
             lines.SetLabel(signal.label)
 
-    def _refresh_step_type(self, signal: SignalXY):
-        line = self._signal_impl_shape_lut.get(id(signal))
-
-        if not isinstance(line, vtkPlotPoints):
-            return
-        chart = self._signal_impl_plot_lut.get(
-            id(signal))
-        plot = self._impl_plot_cache_table.get_cache_item(chart).plot()
-
-        step = self._pm.get_value(
-            'step', self.canvas, plot, signal=signal)
+    def _get_step_data(self, signal: SignalXY, x_data, y_data):
+        """Returns the vertices that draw the data of the signal with its step type.
+        The expansion is kept until the data or the step type of the signal changes."""
+        step = self._pm.get_value(signal, 'step')
         if step is None:
-            return
+            return x_data, y_data
 
-        step_type = STEP_MAP[step.lower()]
+        step_type = STEP_MAP.get(step.lower())
         if step_type not in ["none", "steps", "steps-pre", "steps-post", "steps-mid"]:
             logger.warning(
                 f"Steps type: {step} for {id(signal)} is not recognized!")
-            return
-
-        table = line.GetInput()
-        c0 = table.GetColumn(0)
-        c1 = table.GetColumn(1)
-        xs = numpy_support.vtk_to_numpy(c0)
-        ys = numpy_support.vtk_to_numpy(c1)
-        numPoints = len(xs)
-        var_name = c1.GetName()
-        bitSequencing = table.GetNumberOfColumns() > 2
-
-        newxs = []
-        newys = []
-        if step_type != "none":
-            for i in range(numPoints - 1):
-                newxs.append(xs[i])
-                newys.append(ys[i])
-                for newx, newy in vtkImplUtils.step_function(i, xs, ys, step_type):
-                    newxs.append(newx)
-                    newys.append(newy)
-            newxs.append(xs[-1])
-            newys.append(ys[-1])
-        else:
-            for i in range(0, numPoints - 1, 2):
-                newxs.append(xs[i])
-                newys.append(ys[i])
-            newxs.append(xs[-1])
-            newys.append(ys[-1])
-
-        self.refresh_impl_plot_data(
-            line, newxs, newys, var_name, bitSequencing)
+            return x_data, y_data
+        if step_type == "none":
+            self._step_cache.pop(id(signal), None)
+            return x_data, y_data
+
+        cached = self._step_cache.get(id(signal))
+        if cached is not None and cached[0] is x_data and cached[1] is y_data and cached[2] == step_type:
+            return cached[3], cached[4]
+        step_xs, step_ys = vtkImplUtils.step_points(x_data, y_data, step_type)
+        self._step_cache[id(signal)] = (x_data, y_data, step_type, step_xs, step_ys)
+        return step_xs, step_ys
 
     def _refresh_line_size(self, signal: SignalXY):
         line = self._signal_impl_shape_lut.get(id(signal))
         if not isinstance(line, vtkPlot):
             return
-        chart = self._signal_impl_plot_lut.get(
-            id(signal))
-        plot = self._impl_plot_cache_table.get_cache_item(chart).plot()
         # line style, width if supported by hardware.
         pen = line.GetPen()
-        ls = self._pm.get_value('line_size', self.canvas, plot, signal=signal)
+        ls = self._pm.get_value(signal, 'line_size')
         if ls is not None:
             pen.SetWidth(ls)
 
@@ -965,12 +1046,9 @@ class VTKParser(BackendParserBase):
         line = self._signal_impl_shape_lut.get(id(signal))
         if not isinstance(line, vtkPlotPoints):
             return
-        chart = self._signal_impl_plot_lut.get(
-            id(signal))
-        plot = self._impl_plot_cache_table.get_cache_item(chart).plot()
         # line style, width if supported by hardware.
         pen = line.GetPen()
-        ls = self._pm.get_value('line_style', self.canvas, plot, signal=signal)
+        ls = self._pm.get_value(signal, 'line_style')
         if ls is None:
             return
         elif ls.lower() == "none":
@@ -986,11 +1064,8 @@ class VTKParser(BackendParserBase):
         line = self._signal_impl_shape_lut.get(id(signal))
         if not isinstance(line, vtkPlotPoints):
             return
-        chart = self._signal_impl_plot_lut.get(
-            id(signal))
-        plot = self._impl_plot_cache_table.get_cache_item(chart).plot()
         # marker style, size
-        ms = self._pm.get_value('marker_size', self.canvas, plot, signal=signal)
+        ms = self._pm.get_value(signal, 'marker_size')
         if signal.marker_size is not None:
             line.SetMarkerSize(ms)
 
@@ -998,11 +1073,7 @@ class VTKParser(BackendParserBase):
         line = self._signal_impl_shape_lut.get(id(signal))
         if not isinstance(line, vtkPlotPoints):
             return
-        chart = self._signal_impl_plot_lut.get(
-            id(signal))
-        plot = self._impl_plot_cache_table.get_cache_item(chart).plot()
-        marker = self._pm.get_value(
-            'marker', self.canvas, plot, signal=signal)
+        marker = self._pm.get_value(signal, 'marker')
         if marker == 'x':
             line.SetMarkerStyle(vtkMarkerUtilities.CROSS)
         elif marker == '+':
@@ -1023,6 +1094,15 @@ class VTKParser(BackendParserBase):
         self._layout.SetRect(c_rect)
         self._title_region.SetFixedRect(t_rect)
 
+        if w != self._lod_width:
+            for lod in list(self._line_lod.values()):
+                self._refresh_line_lod(lod[0], w)
+            self._lod_width = w
+
+    def set_impl_plot_slider_limits(self, plot, start, end):
+        """Sliders are not drawn by this backend, there are no slider limits to restore."""
+        pass
+
     def set_focus_plot(self, impl_plot: Any):
         if not isinstance(impl_plot, vtkChart):
             logger.debug("Set focus chart -> None")
@@ -1048,16 +1128,11 @@ class VTKParser(BackendParserBase):
         if hasattr(signal, "color"):
             style['color'] = signal.color
 
-        style['linewidth'] = self._pm.get_value(
-            'line_size', self.canvas, plot, signal=signal) or 1
-        style['linestyle'] = (self._pm.get_value(
-            'line_style', self.canvas, plot, signal=signal) or "Solid").lower()
-        style['marker'] = self._pm.get_value(
-            'marker', self.canvas, plot, signal=signal)
-        style['markersize'] = self._pm.get_value(
-            'marker_size', self.canvas, plot, signal=signal) or 0
-        style["drawstyle"] = self._pm.get_value(
-            'step', self.canvas, plot, signal=signal)
+        style['linewidth'] = self._pm.get_value(signal, 'line_size') or 1
+        style['linestyle'] = (self._pm.get_value(signal, 'line_style') or "Solid").lower()
+        style['marker'] = self._pm.get_value(signal, 'marker')
+        style['markersize'] = self._pm.get_value(signal, 'marker_size') or 0
+        style["drawstyle"] = self._pm.get_value(signal, 'step')
 
         return style
 
@@ -47,8 +47,11 @@ from collections import defaultdict
 from dataclasses import dataclass, field, fields
 import numpy as np
 import os
+import re
+import time
 import typing
 
+from iplotlib.data_access.ring_buffer import RingBuffer
 from iplotlib.interface.utils import string_classifier
 from iplotProcessing.common.errors import InvalidExpression
 from iplotProcessing.core import BufferObject
@@ -63,6 +66,11 @@ logger = setupLogger.get_logger(__name__)
 
 IplotSignalAdapterT = typing.TypeVar('IplotSignalAdapterT', bound='IplotSignalAdapter')
 
+# Tokens of an expression that combines the samples of ${self} position by position.
+ELEMENTWISE_TOKEN = re.compile(r"\s+|(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?|\*\*|//|[-+*/%(),]"
+                               r"|np\.(?P<func>\w+)(?=\s*\()"
+                               r"|\$\{self\}\.(?:(?P<accessor>\w+)\b(?!\s*[\[(.])|data_store\[[0-3]\])")
+
 
 class DataAccessError(Exception):
     pass
@@ -112,6 +120,25 @@ class StatusInfo:
                 (f"{self.sep} {self.inf} infinities" if self.inf > 0 else "")
 
 
+def _count_inf(values) -> int:
+    return int(np.count_nonzero(np.isinf(np.asarray(values))))
+
+
+def _update_inf_count(counted: tuple, previous, current, num_appended: int) -> tuple:
+    """
+    Returns `current` and its number of infinite values. `counted` is such a pair returned before.
+    When `current` holds the samples of `previous` followed by `num_appended` new samples, some of them dropped at
+    the front, and `counted` is the pair of `previous`, only the new and the dropped samples are checked.
+    """
+    values, count = counted
+    if previous is None or values is not previous:
+        return current, _count_inf(current)
+    dropped = len(previous) + num_appended - len(current)
+    if not 0 <= dropped <= len(previous) or num_appended > len(current):
+        return current, _count_inf(current)
+    return current, count - _count_inf(previous[:dropped]) + _count_inf(current[len(current) - num_appended:])
+
+
 @dataclass
 class IplotSignalAdapter(ProcessingSignal):
     """
@@ -142,6 +169,10 @@ class IplotSignalAdapter(ProcessingSignal):
     processing_enabled: bool = True
     time_out_value: float = 60  # Unimplemented  ---> REVIEW: purpose of this attribute?
 
+    # Minimum time in seconds between two full evaluations of expressions that cannot be evaluated incrementally
+    # while streaming.
+    stream_processing_interval = 0.5
+
     def __post_init__(self):
         super().__init__()
 
@@ -159,6 +190,18 @@ class IplotSignalAdapter(ProcessingSignal):
         self.x_data = BufferObject()
         self.y_data = BufferObject()
         self.z_data = BufferObject()
+        self.data_version = 0  # changes whenever x_data, y_data and z_data are set, see _finalize_xyz_data
+
+        # 1.3. Samples received while streaming, see AccessHelper.on_fetch_done
+        self.stream_buffer = None  # type: typing.Optional[RingBuffer]
+        # and their x, y, z data, see _process_appended
+        self._stream_xyz = None  # type: typing.Optional[RingBuffer]
+        self._stream_generation = 0
+        self._stream_processed_at = 0.0
+        self._stream_pending = False  # samples were appended but their processing was put off
+        # data_store[1] and y_data with their number of infinite samples, counted batch by batch while streaming
+        self._store_inf = (None, 0)
+        self._data_inf = (None, 0)
 
         # 2. Post-initialize ArraySignal's properties and our name.
         self._init_label()
@@ -281,12 +324,15 @@ class IplotSignalAdapter(ProcessingSignal):
         # self.ts_start = ranges[0].astype(target_type).item() if isinstance(ranges[0], np.generic) else ranges[0]
         # self.ts_end = ranges[1].astype(target_type).item() if isinstance(ranges[0][0], np.generic) else ranges[0][1]
 
-    def set_da_success(self):
+    def set_da_success(self, previous=None, num_appended: int = 0):
+        """When `num_appended` samples were appended to `previous`, the former data_store[1], only the samples
+        that were appended or dropped are checked for infinite values."""
         self.status_info.reset()
         self.status_info.stage = Stage.DA
         self.status_info.result = Result.SUCCESS
         self.status_info.num_points = len(self.data_store[0])
-        self.status_info.inf = int(np.sum(np.isinf(self.data_store[1])))
+        self._store_inf = _update_inf_count(self._store_inf, previous, self.data_store[1], num_appended)
+        self.status_info.inf = self._store_inf[1]
 
     def set_da_fail(self, msg: str = ''):
         self.status_info.reset()
@@ -296,11 +342,14 @@ class IplotSignalAdapter(ProcessingSignal):
         self.status_info.num_points = 0
         logger.warning(f"Data Access Error: {msg}")
 
-    def set_proc_success(self):
+    def set_proc_success(self, previous=None, num_appended: int = 0):
+        """When `num_appended` samples were appended to `previous`, the former y_data, only the samples that were
+        appended or dropped are checked for infinite values."""
         self.status_info.reset()
         self.status_info.stage = Stage.PROC
         self.status_info.num_points = len(self.x_data)
-        self.status_info.inf = int(np.sum(np.isinf(self.y_data)))
+        self._data_inf = _update_inf_count(self._data_inf, previous, self.y_data, num_appended)
+        self.status_info.inf = self._data_inf[1]
         self.status_info.result = Result.SUCCESS
 
     def set_proc_fail(self, msg: str = ''):
@@ -311,10 +360,45 @@ class IplotSignalAdapter(ProcessingSignal):
         self.status_info.num_points = 0
         logger.warning(f"Processing Error: {msg}")
 
-    def inject_external(self, append: bool = False, **kwargs):
+    def inject_external(self, append: bool = False, **kwargs) -> bool:
+        """Set the data of the signal from `kwargs`, or append it to the data when `append` is True.
+
+        Returns False when the processing of the appended samples was put off, `x_data`, `y_data` and `z_data`
+        are then unchanged until :meth:`process_pending` processes them.
+        """
         AccessHelper.on_fetch_done(self, kwargs, append=append)
         self._access_md5sum = self.calculate_data_hash()
+        if append and self._process_appended(len(kwargs.get('d0', []))):
+            return not self._stream_pending
+        self._stream_pending = False
+        self._do_data_processing()
+
+        # Keep the processed samples so that the next batches can be processed on their own.
+        if append and self.stream_buffer is not None and self._is_incremental():
+            self._stream_xyz = RingBuffer()
+            self._stream_xyz.append(self.x_data, self.y_data, self.z_data)
+            self._stream_generation = self.stream_buffer.generation
+        else:
+            self._stream_xyz = None
+        return True
+
+    @property
+    def stream_pending_at(self) -> typing.Optional[float]:
+        """The time.monotonic() time from which the samples appended while streaming, whose processing was put
+        off, can be processed, or None when there are no such samples."""
+        if not self._stream_pending:
+            return None
+        return self._stream_processed_at + self.stream_processing_interval
+
+    def process_pending(self) -> bool:
+        """Process the samples appended while streaming whose processing was put off, once
+        `stream_processing_interval` is over. Returns True if `x_data`, `y_data` and `z_data` were updated."""
+        if not self._stream_pending or time.monotonic() < self.stream_pending_at:
+            return False
+        self._stream_pending = False
+        self._stream_processed_at = time.monotonic()
         self._do_data_processing()
+        return True
 
     # Private API begins here.
     def _init_children(self, expression: str):
@@ -442,9 +526,90 @@ class IplotSignalAdapter(ProcessingSignal):
 
         # 3. Fix x-z shape mismatch.
         self.z_data = self.acquire_shape(self.z_data, self.x_data)
+        self.data_version += 1
 
         self._report_xyz_data()
 
+    def _is_elementwise(self, expression: str) -> bool:
+        """
+        Returns True if `expression` only combines the samples of this signal position by position with arithmetic
+        and numpy ufuncs, i.e, evaluating it over a batch of samples gives the matching slice of its evaluation over
+        all the samples.
+        """
+        accessors = set(self.alias_map.keys())
+        accessors.add('time')
+        pos = 0
+        while pos < len(expression):
+            match = ELEMENTWISE_TOKEN.match(expression, pos)
+            if match is None:
+                return False
+            if match.group('func') and not isinstance(getattr(np, match.group('func'), None), np.ufunc):
+                return False
+            if match.group('accessor') and match.group('accessor') not in accessors:
+                return False
+            pos = match.end()
+        return True
+
+    def _is_incremental(self) -> bool:
+        return (self.processing_enabled and not len(self.children) and self.depends_on <= {'self'}
+                and all(self._is_elementwise(expr) for expr in [self.x_expr, self.y_expr, self.z_expr]))
+
+    def _process_appended(self, num_samples: int) -> bool:
+        """
+        Process the last `num_samples` samples appended while streaming and append them to `x_data`, `y_data` and
+        `z_data`. Expressions that need all the samples are re-evaluated at most once per
+        `stream_processing_interval`, in between the previous results are kept and the samples are left for
+        :meth:`process_pending`.
+
+        Returns False if all the samples have to be processed now.
+        """
+        if not self.processing_enabled or self.stream_buffer is None:
+            return False
+        if self.status_info.result == Result.INVALID:
+            return False
+        if self.data_access_enabled and self.status_info.result != Result.SUCCESS:
+            return False
+
+        if not self._is_incremental():
+            now = time.monotonic()
+            if now - self._stream_processed_at < self.stream_processing_interval:
+                self._stream_pending = True
+                return True
+            self._stream_processed_at = now
+            return False
+
+        if len(self.stream_buffer) == 0:
+            # The first samples go straight to data_store, see AccessHelper.on_fetch_done
+            return False
+        num_samples = min(num_samples, len(self.stream_buffer))
+        if num_samples == 0:
+            return True
+        stream_xyz = self._stream_xyz
+        if stream_xyz is None or len(stream_xyz) + num_samples < len(self.stream_buffer):
+            return False
+        if self._stream_generation != self.stream_buffer.generation:
+            return False
+
+        # Evaluate the expressions over the new samples only.
+        history = list(self.data_store)
+        self.data_store[:] = [buffer[-num_samples:] for buffer in history]
+        try:
+            data_arrays = self.compute(x=self.x_expr, y=self.y_expr, z=self.z_expr)
+        finally:
+            self.data_store[:] = history
+
+        new_data = [data_arrays.get('x'), data_arrays.get('y'), data_arrays.get('z')]
+        if any(not isinstance(arr, np.ndarray) or arr.ndim == 0 or len(arr) != num_samples for arr in new_data[:2]):
+            return False
+
+        previous = self.y_data
+        stream_xyz.append(*new_data)
+        stream_xyz.keep_last(len(self.stream_buffer))
+        self._finalize_xyz_data([BufferObject(stream_xyz.view(i), unit=getattr(arr, 'unit', ''))
+                                 for i, arr in enumerate(new_data)])
+        self.set_proc_success(previous, num_samples)
+        return True
+
     def _process_data(self):
         # 1. Cannot process data when _fetch_data failed or did not occur
         if self.data_access_enabled and self.status_info.result != Result.SUCCESS:
@@ -683,12 +848,25 @@ class AccessHelper:
         signal.alias_map.update(res['alias_map'])
 
         # we can append to existing data if required (in case of real time streaming)
+        previous, num_appended = None, 0
         if append and len(signal.data_store[0]) > 0:
-            signal.data_store[0] = BufferObject(np.append(signal.data_store[0], res['d0']))
-            signal.data_store[1] = BufferObject(np.append(signal.data_store[1], res['d1']))
-            signal.data_store[2] = BufferObject(np.append(signal.data_store[2], res['d2']))
-            signal.data_store[3] = BufferObject(np.append(signal.data_store[3], res['d3']))
+            if signal.stream_buffer is None:
+                signal.stream_buffer = RingBuffer()
+            previous, generation = signal.data_store[1], signal.stream_buffer.generation
+            num_appended = len(res['d0'])
+            if len(signal.stream_buffer) == 0:
+                # Seed the buffer with the samples we already have.
+                signal.stream_buffer.append(*signal.data_store[:4])
+            signal.stream_buffer.append(res['d0'], res['d1'], res['d2'], res['d3'])
+            for i in range(4):
+                # zero-copy views, the buffer never writes to samples it has handed out.
+                unit = getattr(signal.data_store[i], 'unit', '')
+                signal.data_store[i] = BufferObject(signal.stream_buffer.view(i), unit=unit)
+            if signal.stream_buffer.generation != generation:
+                previous = None  # the retained samples were rewritten
         else:
+            if signal.stream_buffer is not None:
+                signal.stream_buffer.clear()
             signal.data_store.clear()
             signal.data_store.append(BufferObject(res['d0']))
             signal.data_store.append(BufferObject(res['d1']))
@@ -705,7 +883,7 @@ class AccessHelper:
         if res.get('d3_unit'):
             signal.data_store[3].unit = res['d3_unit']
 
-        signal.set_da_success()
+        signal.set_da_success(previous, num_appended)
 
     @staticmethod
     def _submit_fetch(signal: IplotSignalAdapter):
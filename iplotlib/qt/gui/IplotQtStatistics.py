@@ -21,6 +21,9 @@ from PySide6.QtGui import QAction
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem, QHeaderView, \
     QAbstractItemView, QPushButton, QMenu, QSpinBox, QLabel, QFrame
 
+from iplotlib.core.range_query import get_range_index
+from iplotlib.core.windowing import window_selector
+from iplotlib.impl.matplotlib.lineDecimation import get_line_data, line_data_sorted
 import iplotLogging.setupLogger as Sl
 
 logger = Sl.get_logger(__name__)
@@ -158,18 +161,29 @@ class IplotQtStatistics(QWidget):
             # Add Statistics to the table
             has_envelope = signal.data_store[2].size > 0 and signal.data_store[3].size > 0
             line = signal.lines[0][0]
-            x_data = line.get_xdata()
+            x_data, y_data = get_line_data(line)
             lo, hi = impl_plot.get_xlim()
+            y_lo, y_hi = impl_plot.get_ylim()
+            selector = window_selector(x_data, lo, hi, assume_sorted=line_data_sorted(line))
 
             if has_envelope > 0:
-                y_min = np.array(signal.data_store[1])
-                y_max = np.array(signal.data_store[2])
-                y_mean = np.array(signal.data_store[3])
+                columns = (np.asarray(signal.data_store[1]), np.asarray(signal.data_store[2]),
+                           np.asarray(signal.data_store[3]))
+                stats = _window_stats(line, ('min', 'max', 'mean'), columns, selector, y_lo, y_hi)
+                if stats is not None:
+                    (min_val, _, _, _), (_, max_val, _, _), (_, _, total, samples) = stats
+                    y_min, y_max, y_mean = columns
+                    first = (y_min[selector.start].item(), y_mean[selector.start].item(),
+                             y_max[selector.start].item())
+                    last = (y_min[selector.stop - 1].item(), y_mean[selector.stop - 1].item(),
+                            y_max[selector.stop - 1].item())
+                    self._set_stats(idx, float(min_val), total / samples, float(max_val), first, last, samples)
+                    continue
+
+                y_min, y_max, y_mean = (column[selector] for column in columns)
 
                 # Filter values
-                y_lo, y_hi = impl_plot.get_ylim()
-                mask = ((x_data > lo) & (x_data < hi) &
-                        (y_min > y_lo) & (y_min < y_hi) &
+                mask = ((y_min > y_lo) & (y_min < y_hi) &
                         (y_mean > y_lo) & (y_mean < y_hi) &
                         (y_max > y_lo) & (y_max < y_hi))
                 y_min_displayed = y_min[mask]
@@ -191,11 +205,15 @@ class IplotQtStatistics(QWidget):
 
             else:
                 # Base case
-                y_data = line.get_ydata()
-                y_lo, y_hi = impl_plot.get_ylim()
-                mask = ((x_data > lo) & (x_data < hi) &
-                        (y_data > y_lo) & (y_data < y_hi))
-                y_displayed = y_data[mask]
+                stats = _window_stats(line, ('y',), (y_data,), selector, y_lo, y_hi)
+                if stats is not None:
+                    min_val, max_val, total, samples = stats[0]
+                    self._set_stats(idx, float(min_val), total / samples, float(max_val), y_data[selector.start].item(),
+                                    y_data[selector.stop - 1].item(), samples)
+                    continue
+
+                y_data = y_data[selector]
+                y_displayed = y_data[(y_data > y_lo) & (y_data < y_hi)]
                 samples = y_displayed.size
 
                 if samples > 0:
@@ -243,4 +261,25 @@ class IplotQtStatistics(QWidget):
                         if not float(data).is_integer():
                             item.setText(f"{data:.{self.decimal_digits}f}")
                         else:
-                            item.setText(str(int(data)))
\ No newline at end of file
+                            item.setText(str(int(data)))
+
+
+def _window_stats(owner, names, columns, selector, y_lo, y_hi):
+    """
+    Returns the range statistics of each column over the window `selector` when the window is a slice and all of
+    its samples are displayed, i.e. none is NaN or out of (`y_lo`, `y_hi`). Returns None otherwise, the samples
+    must then be filtered one by one.
+    """
+    if not isinstance(selector, slice) or selector.stop <= selector.start:
+        return None
+    stats = []
+    for name, column in zip(names, columns):
+        index = get_range_index(owner, column, name)
+        if index is None:
+            return None
+        column_stats = index.query(selector.start, selector.stop)
+        if (column_stats.count != selector.stop - selector.start
+                or not y_lo < column_stats.min <= column_stats.max < y_hi):
+            return None
+        stats.append(column_stats)
+    return stats
@@ -21,7 +21,7 @@ This module has a base class defined for all Qt canvas implementations.
 
 from abc import abstractmethod
 from contextlib import contextmanager
-from typing import Collection, List
+from typing import Collection, List, Optional
 
 from PySide6.QtCore import QMetaObject, QSize, Qt, Signal, Slot
 from PySide6.QtWidgets import QApplication, QWidget
@@ -32,6 +32,7 @@ from iplotlib.core.command import IplotCommand
 from iplotlib.core.drop_info import DropInfo
 from iplotlib.core.commands.axes_range import IplotAxesRangeCmd
 from iplotlib.core.impl_base import BackendParserBase
+from iplotlib.data_access.streamer import CanvasStreamer
 import iplotLogging.setupLogger as Sl
 
 logger = Sl.get_logger(__name__)
@@ -50,6 +51,7 @@ class IplotQtCanvas(QWidget):
         self._staging_cmds = []  # type: List[IplotAxesRangeCmd]
         self._commitd_cmds = []  # type: List[IplotAxesRangeCmd]
         self._refresh_original_ranges = True
+        self._streamer = None  # type: Optional[CanvasStreamer]
         self.dropInfo = DropInfo()
 
     @abstractmethod
@@ -227,6 +229,21 @@ class IplotQtCanvas(QWidget):
                 if isinstance(plot, PlotXYWithSlider):
                     plot.clean_slider()
 
+    def start_streaming(self, streamer: CanvasStreamer):
+        """
+        Stream the signals of the current canvas with `streamer`. The signals updated between two frames are
+        redrawn together, at most `streamer.max_fps` times per second.
+        """
+        self.stop_streaming()
+        self._streamer = streamer
+        streamer.start(self.get_canvas(), frame_callback=self._parser.process_ipl_signals)
+
+    def stop_streaming(self):
+        """Stop the streamer given to :meth:`start_streaming`, if any."""
+        if self._streamer is not None:
+            self._streamer.stop()
+            self._streamer = None
+
     def sizeHint(self):
         return QSize(900, 400)
 
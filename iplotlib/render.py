@@ -0,0 +1,153 @@
+# Copyright (c) 2020-2025 ITER Organization,
+#               CS 90046
+#               13067 St Paul Lez Durance Cedex
+#               France
+# Author IO
+#
+# This file is part of iplotlib module.
+# iplotlib python module is free software: you can redistribute it and/or modify it under
+# the terms of the MIT license.
+#
+# This file is part of ITER CODAC software.
+# For the terms and conditions of redistribution or use of this software
+# refer to the file LICENSE located in the top level directory
+# of the distribution package
+#
+
+
+
+"""
+Headless rendering of canvas JSON files to image files.
+
+Example::
+
+    python -m iplotlib.render -format png -o out/ -jobs 8 canvases/*.json
+
+The canvases are drawn with the matplotlib Agg backend, so no display or QApplication is needed. The files are
+spread over a pool of processes and the time spent on each file is reported as it completes.
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, NamedTuple, Optional
+
+import matplotlib
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from iplotLogging import setupLogger
+from iplotlib.core import Canvas
+from iplotlib.impl.matplotlib.matplotlibCanvas import MatplotlibParser
+from iplotlib.interface.iplotSignalAdapter import AccessHelper
+
+logger = setupLogger.get_logger(__name__)
+
+
+class RenderResult(NamedTuple):
+    source: str
+    output: Optional[str]
+    seconds: float
+    error: Optional[str] = None
+
+
+def output_path(source: str, output_dir: Optional[str], fmt: str) -> str:
+    """
+    Returns the path of the image rendered from `source`: its name with the `fmt` extension, in `output_dir` or next
+    to the source.
+    """
+    name = os.path.splitext(os.path.basename(source))[0] + '.' + fmt
+    return os.path.join(output_dir if output_dir else os.path.dirname(source), name)
+
+
+def render_file(source: str, output: str, fmt: str = 'png', width: int = 1920, height: int = 1080,
+                dpi: int = 100) -> RenderResult:
+    """
+    Render the canvas stored as JSON in `source` to the image file `output`. `width` and `height` are in pixels.
+    Errors are reported in the result rather than raised, so a batch goes on with the other files.
+    """
+    start = time.perf_counter()
+    try:
+        with open(source, 'r', encoding='utf-8') as fp:
+            canvas = Canvas.from_json(fp.read())
+        if not isinstance(canvas, Canvas):
+            raise ValueError("the file does not describe a canvas")
+
+        parser = MatplotlibParser()
+        FigureCanvasAgg(parser.figure)
+        parser.export_image(output, canvas=canvas, format=fmt, width=width, height=height, dpi=dpi)
+    except Exception as e:
+        return RenderResult(source, None, time.perf_counter() - start, f"{type(e).__name__}: {e}")
+    return RenderResult(source, output, time.perf_counter() - start)
+
+
+def render_files(sources: List[str], output_dir: Optional[str] = None, fmt: str = 'png', width: int = 1920,
+                 height: int = 1080, dpi: int = 100, jobs: int = None, sources_config: str = None,
+                 use_fallback_samples: bool = False):
+    """
+    Render every canvas JSON file of `sources` with a pool of `jobs` processes (one per CPU by default) and yield
+    a :class:`RenderResult` for each file in order of completion.
+
+    `sources_config` is the data sources configuration given to `iplotDataAccess` in each process, so that the
+    signals of the canvases can fetch their data.
+    """
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                             initargs=(sources_config, use_fallback_samples)) as pool:
+        futures = [pool.submit(render_file, source, output_path(source, output_dir, fmt), fmt, width, height, dpi)
+                   for source in sources]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def _init_worker(sources_config: Optional[str], use_fallback_samples: bool):
+    matplotlib.use('Agg')
+    AccessHelper.num_samples_override = use_fallback_samples
+    if sources_config:
+        from iplotDataAccess.dataAccess import DataAccess
+
+        os.environ.update({'IPLOT_SOURCES_CONFIG': os.path.abspath(sources_config)})
+        da = DataAccess()
+        if da.load_config(sources_config):
+            AccessHelper.da = da
+        else:
+            logger.error(f"Cannot load the data sources configuration {sources_config}")
+
+
+def main(argv=None) -> int:
+    import argparse
+
+    matplotlib.use('Agg')
+    parser = argparse.ArgumentParser(prog='python -m iplotlib.render',
+                                     description="Render canvas JSON files to images.")
+    parser.add_argument('files', nargs='+', help="Canvas JSON files.")
+    parser.add_argument('-o', dest='output_dir', default=None,
+                        help="Output directory, the images are written next to the JSON files by default.")
+    parser.add_argument('-format', dest='format', default='png',
+                        choices=sorted(FigureCanvasAgg.get_supported_filetypes()), help="Image format.")
+    parser.add_argument('-width', dest='width', type=int, default=1920, help="Image width in pixels.")
+    parser.add_argument('-height', dest='height', type=int, default=1080, help="Image height in pixels.")
+    parser.add_argument('-dpi', dest='dpi', type=int, default=100, help="Resolution of the fonts and lines.")
+    parser.add_argument('-jobs', dest='jobs', type=int, default=None,
+                        help="Number of rendering processes, one per CPU by default.")
+    parser.add_argument('-sources-config', dest='sources_config', default=None,
+                        help="Data sources configuration used to fetch the data of the signals.")
+    parser.add_argument('-use-fallback-samples', dest='use_fallback_samples', action='store_true', default=False)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    failures = 0
+    for result in render_files(args.files, args.output_dir, args.format, args.width, args.height, args.dpi,
+                               args.jobs, args.sources_config, args.use_fallback_samples):
+        if result.error is None:
+            print(f"{result.seconds:8.3f} s  {result.source} -> {result.output}", flush=True)
+        else:
+            failures += 1
+            print(f"{result.seconds:8.3f} s  {result.source} FAILED {result.error}", flush=True)
+    print(f"Rendered {len(args.files) - failures}/{len(args.files)} files in {time.perf_counter() - start:.3f} s")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
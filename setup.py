@@ -43,7 +43,8 @@ setuptools.setup(
     ],
     entry_points={
         "console_scripts": [
-            "iplotlib-qt-canvas = iplotlib.qt.gui.iplotQtStandaloneCanvas:main"
+            "iplotlib-qt-canvas = iplotlib.qt.gui.iplotQtStandaloneCanvas:main",
+            "iplotlib-render = iplotlib.render:main"
         ]
     },
     package_data={